@@ -7,9 +7,66 @@ This module handles the conversion between different coordinate systems:
 - PDF coordinates (bottom-left origin, y increases upward)
 """
 
+import functools
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional - fall back to plain Python/NumPy
+    njit = None
+
+
+def _clamp_one(x1, y1, x2, y2, page_width, page_height, min_size):
+    """Clamp a single rectangle to the page and enforce the minimum size"""
+    # Plain Python: called once per drag/resize event, where a JIT call (and its
+    # first-call compile) would cost more than the four min/max pairs
+    x1 = max(0.0, min(x1, page_width - min_size))
+    y1 = max(0.0, min(y1, page_height - min_size))
+    x2 = max(x1 + min_size, min(x2, page_width))
+    y2 = max(y1 + min_size, min(y2, page_height))
+    return x1, y1, x2, y2
+
+
+if njit is not None:
+    # Compiled eagerly for its one signature at import, so the first batch
+    # clamp does not stall the UI on JIT compilation
+    @njit("f8[:,:](f8[:,:], f8, f8, f8)", cache=True)
+    def _clamp_many(rects, page_width, page_height, min_size):
+        """Clamp every row of an (N, 4) float64 array"""
+        out = np.empty_like(rects)
+        for i in range(rects.shape[0]):
+            x1 = max(0.0, min(rects[i, 0], page_width - min_size))
+            y1 = max(0.0, min(rects[i, 1], page_height - min_size))
+            out[i, 0] = x1
+            out[i, 1] = y1
+            out[i, 2] = max(x1 + min_size, min(rects[i, 2], page_width))
+            out[i, 3] = max(y1 + min_size, min(rects[i, 3], page_height))
+        return out
+else:
+    def _clamp_many(rects, page_width, page_height, min_size):
+        """Clamp every row of an (N, 4) float64 array"""
+        x1 = np.maximum(0.0, np.minimum(rects[:, 0], page_width - min_size))
+        y1 = np.maximum(0.0, np.minimum(rects[:, 1], page_height - min_size))
+        x2 = np.maximum(x1 + min_size, np.minimum(rects[:, 2], page_width))
+        y2 = np.maximum(y1 + min_size, np.minimum(rects[:, 3], page_height))
+        return np.stack([x1, y1, x2, y2], axis=1)
+
+try:
+    # Ahead-of-time compiled kernels built by coordinate_utils_aot.py (no JIT warm-up)
+    import coord_kernels
+except ImportError:
+    coord_kernels = None
+else:
+    _clamp_many = coord_kernels.clamp_batch
+
+
 class CoordinateTransformer:
     """Handles coordinate transformations between canvas and PDF coordinate systems"""
     
+    # pdf_scale is a property backed by _pdf_scale, so the slot holds the private name
+    __slots__ = ("_pdf_scale", "canvas_offset", "_inv_pdf_scale")
+    
     def __init__(self, pdf_scale, canvas_offset=25):
         """
         Initialize the coordinate transformer
@@ -21,6 +78,19 @@ class CoordinateTransformer:
         self.pdf_scale = pdf_scale
         self.canvas_offset = canvas_offset
     
+    @property
+    def pdf_scale(self):
+        """Scale factor used when displaying PDF on canvas"""
+        return self._pdf_scale
+    
+    @pdf_scale.setter
+    def pdf_scale(self, value):
+        if not value:
+            raise ValueError("pdf_scale must be non-zero")
+        self._pdf_scale = value
+        # Cached reciprocal so canvas -> PDF conversion multiplies instead of divides
+        self._inv_pdf_scale = 1.0 / float(value)
+    
     def canvas_to_pdf(self, canvas_rect, page_height):
         """
         Convert canvas coordinates to PDF coordinates
@@ -41,24 +111,16 @@ class CoordinateTransformer:
         relative_y2 = canvas_y2 - self.canvas_offset
         
         # Step 2: Scale back from display coordinates to PDF coordinates
-        pdf_x1 = relative_x1 / self.pdf_scale
-        pdf_y1 = relative_y1 / self.pdf_scale
-        pdf_x2 = relative_x2 / self.pdf_scale
-        pdf_y2 = relative_y2 / self.pdf_scale
-        
-        # Step 3: Convert coordinate systems (direct mapping for now)
-        final_x1 = pdf_x1
-        final_y1 = pdf_y1
-        final_x2 = pdf_x2
-        final_y2 = pdf_y2
-        
-        # Ensure proper rectangle ordering
-        if final_x1 > final_x2:
-            final_x1, final_x2 = final_x2, final_x1
-        if final_y1 > final_y2:
-            final_y1, final_y2 = final_y2, final_y1
-            
-        return [final_x1, final_y1, final_x2, final_y2]
+        inv_scale = self._inv_pdf_scale
+        pdf_x1 = relative_x1 * inv_scale
+        pdf_y1 = relative_y1 * inv_scale
+        pdf_x2 = relative_x2 * inv_scale
+        pdf_y2 = relative_y2 * inv_scale
+        
+        # PDF and canvas axes map directly (no y-flip), so only ordering remains
+        # Ensure proper rectangle ordering (same min/max pairing as the batch path)
+        return [min(pdf_x1, pdf_x2), min(pdf_y1, pdf_y2),
+                max(pdf_x1, pdf_x2), max(pdf_y1, pdf_y2)]
     
     def pdf_to_canvas(self, pdf_rect, page_height):
         """
@@ -73,19 +135,13 @@ class CoordinateTransformer:
         """
         pdf_x1, pdf_y1, pdf_x2, pdf_y2 = pdf_rect
         
-        # Step 1: Convert coordinate systems (direct mapping for now)
-        relative_x1 = pdf_x1
-        relative_y1 = pdf_y1
-        relative_x2 = pdf_x2
-        relative_y2 = pdf_y2
-        
-        # Step 2: Scale to display coordinates
-        display_x1 = relative_x1 * self.pdf_scale
-        display_y1 = relative_y1 * self.pdf_scale
-        display_x2 = relative_x2 * self.pdf_scale
-        display_y2 = relative_y2 * self.pdf_scale
+        # Step 1: Scale to display coordinates (PDF and canvas axes map directly)
+        display_x1 = pdf_x1 * self.pdf_scale
+        display_y1 = pdf_y1 * self.pdf_scale
+        display_x2 = pdf_x2 * self.pdf_scale
+        display_y2 = pdf_y2 * self.pdf_scale
         
-        # Step 3: Add canvas offset
+        # Step 2: Add canvas offset
         canvas_x1 = display_x1 + self.canvas_offset
         canvas_y1 = display_y1 + self.canvas_offset
         canvas_x2 = display_x2 + self.canvas_offset
@@ -93,6 +149,49 @@ class CoordinateTransformer:
         
         return [canvas_x1, canvas_y1, canvas_x2, canvas_y2]
     
+    def canvas_to_pdf_batch(self, rects, page_height):
+        """
+        Convert many canvas rectangles to PDF coordinates at once
+        
+        Args:
+            rects (array-like): (N, 4) array of [x1, y1, x2, y2] canvas rectangles
+            page_height (float): Height of the PDF page in points
+            
+        Returns:
+            np.ndarray: (N, 4) float64 array of [x1, y1, x2, y2] in PDF coordinates
+        """
+        # Same input shape for every backend, so [] and a single flat rect work too
+        rects = np.ascontiguousarray(rects, dtype=np.float64).reshape(-1, 4)
+        if coord_kernels is not None:
+            return coord_kernels.canvas_to_pdf_batch(rects, float(self.canvas_offset), self._inv_pdf_scale)
+        
+        r = (rects - self.canvas_offset) * self._inv_pdf_scale
+        
+        # Ensure proper rectangle ordering without per-row branches
+        x1 = np.minimum(r[:, 0], r[:, 2])
+        x2 = np.maximum(r[:, 0], r[:, 2])
+        y1 = np.minimum(r[:, 1], r[:, 3])
+        y2 = np.maximum(r[:, 1], r[:, 3])
+        
+        return np.stack([x1, y1, x2, y2], axis=1)
+    
+    def pdf_to_canvas_batch(self, rects, page_height):
+        """
+        Convert many PDF rectangles to canvas coordinates at once
+        
+        Args:
+            rects (array-like): (N, 4) array of [x1, y1, x2, y2] PDF rectangles
+            page_height (float): Height of the PDF page in points
+            
+        Returns:
+            np.ndarray: (N, 4) float64 array of [x1, y1, x2, y2] in canvas coordinates
+        """
+        rects = np.ascontiguousarray(rects, dtype=np.float64).reshape(-1, 4)
+        if coord_kernels is not None:
+            return coord_kernels.pdf_to_canvas_batch(rects, float(self.pdf_scale), float(self.canvas_offset))
+        
+        return rects * self.pdf_scale + self.canvas_offset
+    
     def clamp_to_page(self, pdf_rect, page_width, page_height, min_size=10):
         """
         Clamp PDF coordinates to page boundaries and ensure minimum size
@@ -108,19 +207,48 @@ class CoordinateTransformer:
         """
         x1, y1, x2, y2 = pdf_rect
         
-        # Clamp to page boundaries
-        x1 = max(0, min(x1, page_width - min_size))
-        y1 = max(0, min(y1, page_height - min_size))
-        x2 = max(x1 + min_size, min(x2, page_width))
-        y2 = max(y1 + min_size, min(y2, page_height))
+        return list(_clamp_one(float(x1), float(y1), float(x2), float(y2),
+                               float(page_width), float(page_height), float(min_size)))
+    
+    def clamp_to_page_batch(self, rects, page_width, page_height, min_size=10):
+        """
+        Clamp many PDF rectangles to page boundaries at once
         
-        return [x1, y1, x2, y2]
+        Args:
+            rects (array-like): (N, 4) array of [x1, y1, x2, y2] in PDF coordinates
+            page_width (float): Width of the PDF page
+            page_height (float): Height of the PDF page
+            min_size (float): Minimum width/height for each rectangle
+            
+        Returns:
+            np.ndarray: (N, 4) float64 array of clamped coordinates
+        """
+        rects = np.ascontiguousarray(rects, dtype=np.float64).reshape(-1, 4)
+        return _clamp_many(rects, float(page_width), float(page_height), float(min_size))
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_display_scale(canvas_size, page_size, max_scale, margin):
+    """Memoized body of calculate_display_scale (arguments must be hashable)"""
+    canvas_width, canvas_height = canvas_size
+    page_width, page_height = page_size
+    
+    # Calculate scale factors for each dimension
+    scale_x = (canvas_width - margin) / page_width
+    scale_y = (canvas_height - margin) / page_height
+    
+    # Use the smaller scale factor to ensure the page fits
+    scale = min(scale_x, scale_y, max_scale)
+    
+    return scale
 
 
 def calculate_display_scale(canvas_size, page_size, max_scale=2.0, margin=50):
     """
     Calculate the scale factor for displaying a PDF page on canvas
     
+    Canvas and page sizes change rarely, so results are cached by argument.
+    
     Args:
         canvas_size (tuple): (width, height) of the canvas
         page_size (tuple): (width, height) of the PDF page
@@ -130,14 +258,10 @@ def calculate_display_scale(canvas_size, page_size, max_scale=2.0, margin=50):
     Returns:
         float: Scale factor to use for display
     """
-    canvas_width, canvas_height = canvas_size
-    page_width, page_height = page_size
-    
-    # Calculate scale factors for each dimension
-    scale_x = (canvas_width - margin) / page_width
-    scale_y = (canvas_height - margin) / page_height
-    
-    # Use the smaller scale factor to ensure the page fits
-    scale = min(scale_x, scale_y, max_scale)
-    
-    return scale
\ No newline at end of file
+    return _cached_display_scale(tuple(canvas_size), tuple(page_size), max_scale, margin)
+
+
+try:
+    from coordinate_utils_ext import CoordinateTransformerFast
+except ImportError:  # Cython extension not built - same interface in pure Python
+    CoordinateTransformerFast = CoordinateTransformer
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Ahead-of-time compiled coordinate kernels for PDF Form Maker
+
+Running this script with numba installed builds a `coord_kernels` extension
+module next to coordinate_utils.py:
+
+    python coordinate_utils_aot.py
+
+coordinate_utils imports the compiled kernels when they exist, so the batch
+transforms get compiled speed without numba's JIT warm-up on every launch
+(numba is then not needed at run time). Without the module it falls back to
+the @njit / NumPy implementations.
+"""
+
+import os
+
+import numpy as np
+from numba.pycc import CC
+
+cc = CC("coord_kernels")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+@cc.export("canvas_to_pdf_batch", "f8[:,:](f8[:,:], f8, f8)")
+def canvas_to_pdf_batch(rects, canvas_offset, inv_scale):
+    """Convert (N, 4) canvas rectangles to ordered PDF rectangles"""
+    out = np.empty_like(rects)
+    for i in range(rects.shape[0]):
+        x1 = (rects[i, 0] - canvas_offset) * inv_scale
+        y1 = (rects[i, 1] - canvas_offset) * inv_scale
+        x2 = (rects[i, 2] - canvas_offset) * inv_scale
+        y2 = (rects[i, 3] - canvas_offset) * inv_scale
+        out[i, 0] = min(x1, x2)
+        out[i, 1] = min(y1, y2)
+        out[i, 2] = max(x1, x2)
+        out[i, 3] = max(y1, y2)
+    return out
+
+
+@cc.export("pdf_to_canvas_batch", "f8[:,:](f8[:,:], f8, f8)")
+def pdf_to_canvas_batch(rects, pdf_scale, canvas_offset):
+    """Convert (N, 4) PDF rectangles to canvas rectangles"""
+    out = np.empty_like(rects)
+    for i in range(rects.shape[0]):
+        for j in range(4):
+            out[i, j] = rects[i, j] * pdf_scale + canvas_offset
+    return out
+
+
+@cc.export("clamp_batch", "f8[:,:](f8[:,:], f8, f8, f8)")
+def clamp_batch(rects, page_width, page_height, min_size):
+    """Clamp every row of an (N, 4) array to the page and enforce the minimum size"""
+    out = np.empty_like(rects)
+    for i in range(rects.shape[0]):
+        x1 = max(0.0, min(rects[i, 0], page_width - min_size))
+        y1 = max(0.0, min(rects[i, 1], page_height - min_size))
+        out[i, 0] = x1
+        out[i, 1] = y1
+        out[i, 2] = max(x1 + min_size, min(rects[i, 2], page_width))
+        out[i, 3] = max(y1 + min_size, min(rects[i, 3], page_height))
+    return out
+
+
+if __name__ == "__main__":
+    cc.compile()
+    print(f"✅ Built coord_kernels in {cc.output_dir}")
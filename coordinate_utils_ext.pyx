@@ -0,0 +1,117 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Compiled coordinate transformations for PDF Form Maker
+
+Drop-in replacement for the scalar methods of coordinate_utils.CoordinateTransformer
+using C doubles throughout. Build it in place next to coordinate_utils.py with:
+
+    pip install cython
+    cythonize -i -3 coordinate_utils_ext.pyx
+
+coordinate_utils falls back to the pure Python class when the module is not built.
+"""
+
+
+cdef class CoordinateTransformerFast:
+    """Handles coordinate transformations between canvas and PDF coordinate systems"""
+
+    cdef double _pdf_scale
+    cdef double _inv_pdf_scale
+    cdef public double canvas_offset
+
+    def __init__(self, pdf_scale, canvas_offset=25):
+        """
+        Initialize the coordinate transformer
+
+        Args:
+            pdf_scale (float): Scale factor used when displaying PDF on canvas
+            canvas_offset (int): Pixel offset where PDF image is placed on canvas
+        """
+        self.pdf_scale = pdf_scale
+        self.canvas_offset = canvas_offset
+
+    @property
+    def pdf_scale(self):
+        """Scale factor used when displaying PDF on canvas"""
+        return self._pdf_scale
+
+    @pdf_scale.setter
+    def pdf_scale(self, value):
+        if not value:
+            raise ValueError("pdf_scale must be non-zero")
+        self._pdf_scale = value
+        self._inv_pdf_scale = 1.0 / self._pdf_scale
+
+    cpdef list canvas_to_pdf(self, canvas_rect, double page_height):
+        """
+        Convert canvas coordinates to PDF coordinates
+
+        Args:
+            canvas_rect (list): [x1, y1, x2, y2] in canvas coordinates
+            page_height (float): Height of the PDF page in points
+
+        Returns:
+            list: [x1, y1, x2, y2] in PDF coordinates
+        """
+        cdef double x1, y1, x2, y2, tmp
+        x1, y1, x2, y2 = canvas_rect
+
+        x1 = (x1 - self.canvas_offset) * self._inv_pdf_scale
+        y1 = (y1 - self.canvas_offset) * self._inv_pdf_scale
+        x2 = (x2 - self.canvas_offset) * self._inv_pdf_scale
+        y2 = (y2 - self.canvas_offset) * self._inv_pdf_scale
+
+        # Ensure proper rectangle ordering
+        if x1 > x2:
+            tmp = x1
+            x1 = x2
+            x2 = tmp
+        if y1 > y2:
+            tmp = y1
+            y1 = y2
+            y2 = tmp
+
+        return [x1, y1, x2, y2]
+
+    cpdef list pdf_to_canvas(self, pdf_rect, double page_height):
+        """
+        Convert PDF coordinates to canvas coordinates
+
+        Args:
+            pdf_rect (list): [x1, y1, x2, y2] in PDF coordinates
+            page_height (float): Height of the PDF page in points
+
+        Returns:
+            list: [x1, y1, x2, y2] in canvas coordinates
+        """
+        cdef double x1, y1, x2, y2
+        x1, y1, x2, y2 = pdf_rect
+
+        return [x1 * self._pdf_scale + self.canvas_offset,
+                y1 * self._pdf_scale + self.canvas_offset,
+                x2 * self._pdf_scale + self.canvas_offset,
+                y2 * self._pdf_scale + self.canvas_offset]
+
+    cpdef list clamp_to_page(self, pdf_rect, double page_width, double page_height,
+                             double min_size=10):
+        """
+        Clamp PDF coordinates to page boundaries and ensure minimum size
+
+        Args:
+            pdf_rect (list): [x1, y1, x2, y2] in PDF coordinates
+            page_width (float): Width of the PDF page
+            page_height (float): Height of the PDF page
+            min_size (float): Minimum width/height for the rectangle
+
+        Returns:
+            list: Clamped [x1, y1, x2, y2] coordinates
+        """
+        cdef double x1, y1, x2, y2
+        x1, y1, x2, y2 = pdf_rect
+
+        x1 = max(0.0, min(x1, page_width - min_size))
+        y1 = max(0.0, min(y1, page_height - min_size))
+        x2 = max(x1 + min_size, min(x2, page_width))
+        y2 = max(y1 + min_size, min(y2, page_height))
+
+        return [x1, y1, x2, y2]
@@ -5,9 +5,58 @@ Field Manager for PDF Form Maker
 Handles creation, selection, manipulation, and rendering of form fields.
 """
 
+import functools
+import logging
+import os
+import re
 import tkinter as tk
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from coordinate_utils import CoordinateTransformer
 from models import FormField, FieldType, AppConstants, MouseState
+from spatial_index import GridIndex
+
+logger = logging.getLogger(__name__)
+
+# Trailing number of a field name, e.g. the 12 in "text_12"
+_FIELD_NUM_RE = re.compile(r'(\d+)$')
+
+# Resize handle directions, in the order _handle_positions returns them
+_HANDLE_ORDER = ('nw', 'ne', 'sw', 'se', 'n', 's', 'w', 'e')
+
+# Edges moved by each resize handle: north=1, south=2, west=4, east=8
+_HANDLE_MASK = {'n': 1, 's': 2, 'w': 4, 'e': 8, 'nw': 5, 'ne': 9, 'sw': 6, 'se': 10}
+
+
+def _handle_positions(x1, y1, x2, y2, handle_size):
+    """
+    Top-left corner of each resize handle for a field's canvas rect
+    
+    Returns:
+        Tuple of (x, y) pairs in _HANDLE_ORDER
+    """
+    half = handle_size // 2
+    left, right = x1 - half, x2 - half
+    top, bottom = y1 - half, y2 - half
+    mid_x = (x1 + x2) // 2 - half
+    mid_y = (y1 + y2) // 2 - half
+    return ((left, top), (right, top), (left, bottom), (right, bottom),
+            (mid_x, top), (mid_x, bottom), (left, mid_y), (right, mid_y))
+
+
+@functools.lru_cache(maxsize=4096)
+def _item_tags(name: str, page_num: int) -> Tuple[tuple, tuple]:
+    """
+    Canvas tags of a field's rectangle and label, built once per name and page
+    
+    Returns:
+        (rectangle tags, label tags); the first tag of each is the per-field one
+    """
+    page_tag = f"form_field_p{page_num}"
+    return ((f"field_{name}", "form_field", page_tag),
+            (f"field_{name}_label", "form_field", page_tag))
 
 
 class FieldManager:
@@ -23,10 +72,140 @@ class FieldManager:
         """
         self.canvas = canvas
         self.pdf_handler = pdf_handler
-        self.fields: List[FormField] = []
+        # Per-page grid of field rects in PDF coordinates (zoom independent)
+        self._page_index: Dict[int, GridIndex] = {}
+        self._indexed_page: Dict[int, int] = {}  # id(field) -> page it is indexed under
+        # Managed fields of each page, in list (draw) order
+        self._fields_by_page: Dict[int, List[FormField]] = {}
+        # Managed fields by name, for O(1) membership checks on (possibly copied) fields
+        self._fields_by_name: Dict[str, List[FormField]] = {}
+        self._indexed_name: Dict[int, str] = {}  # id(field) -> name it is indexed under
+        # Live canvas items per field: id(field) -> (rect id, label id, style)
+        self._drawn_items: Dict[int, Tuple[int, int, tuple]] = {}
+        # Page whose field items are visible; items of other pages stay hidden for reuse
+        self._shown_page: Optional[int] = None
+        # Zoom each page's items were drawn at, for pages whose items are up to date
+        self._page_drawn_scale: Dict[int, float] = {}
+        # Reusable resize handle items, by direction (hidden when nothing is selected)
+        self._handle_ids: Dict[str, int] = {}
+        self._handles_shown = False
+        # Managed fields in creation (draw) order; changed only through the methods
+        # below, which keep the lookup indexes above in step
+        self._fields: List[FormField] = []
         self.selected_field: Optional[FormField] = None
         self.field_counter = 0
         self.mouse_state = MouseState()
+        # Fields waiting for the next idle-time redraw, keyed by id(field)
+        self._dirty: Dict[int, FormField] = {}
+        self._redraw_scheduled = False
+        # Nesting depth of begin_batch() and the fields draw_field was asked for meanwhile
+        self._batch_depth = 0
+        self._batch_dirty: Dict[int, FormField] = {}
+        # Handle hit boxes of the selected field, valid while _sel_handle_key matches
+        self._sel_handle_key: Optional[tuple] = None
+        self._sel_bounds: Tuple[float, float, float, float] = (0, 0, 0, 0)
+        self._sel_handle_bboxes: Tuple[Tuple[str, float, float, float, float], ...] = ()
+    
+    @property
+    def fields(self) -> List[FormField]:
+        """All managed fields in creation (draw) order"""
+        return self._fields
+    
+    @fields.setter
+    def fields(self, fields):
+        """Replace all managed fields at once"""
+        self._fields = list(fields)
+        self._index_rebuild()
+    
+    def _append_field(self, field: FormField):
+        """Add a field to the end of the field list and to the lookup indexes"""
+        self._fields.append(field)
+        self._index_add(field)
+    
+    def _index_add(self, field: FormField):
+        """Add a field to the spatial index of its page"""
+        index = self._page_index.get(field.page_num)
+        if index is None:
+            index = self._page_index[field.page_num] = GridIndex()
+        index.insert(id(field), field, field.rect)
+        self._indexed_page[id(field)] = field.page_num
+        self._fields_by_page.setdefault(field.page_num, []).append(field)
+        self._fields_by_name.setdefault(field.name, []).append(field)
+        self._indexed_name[id(field)] = field.name
+        self._invalidate_hidden_page(field.page_num)
+    
+    def _index_remove(self, field: FormField):
+        """Remove a field from the spatial index"""
+        page_num = self._indexed_page.pop(id(field), None)
+        if page_num is not None:
+            self._invalidate_hidden_page(page_num)
+            self._page_index[page_num].remove(id(field))
+            page_fields = self._fields_by_page[page_num]
+            for i, other in enumerate(page_fields):
+                if other is field:
+                    del page_fields[i]
+                    break
+            if not page_fields:
+                del self._fields_by_page[page_num]
+        name = self._indexed_name.pop(id(field), None)
+        if name is not None:
+            same_name = self._fields_by_name[name]
+            for i, other in enumerate(same_name):
+                if other is field:
+                    del same_name[i]
+                    break
+            if not same_name:
+                del self._fields_by_name[name]
+        self._drawn_items.pop(id(field), None)
+    
+    def _index_rebuild(self):
+        """Rebuild the spatial index from the field list"""
+        self._page_index = {}
+        self._indexed_page = {}
+        self._fields_by_page = {}
+        self._fields_by_name = {}
+        self._indexed_name = {}
+        # Hidden pages may hold items of fields that are gone now
+        self._page_drawn_scale.clear()
+        for field in self._fields:
+            self._index_add(field)
+        
+        # Forget canvas items of fields that are no longer managed
+        for key in [key for key in self._drawn_items if key not in self._indexed_page]:
+            del self._drawn_items[key]
+    
+    def _invalidate_hidden_page(self, page_num: int):
+        """Make the next show_page of a hidden page redraw it instead of unhiding stale items"""
+        if page_num != self._shown_page:
+            self._page_drawn_scale.pop(page_num, None)
+    
+    def _reindex_field(self, field: FormField):
+        """Re-bucket a managed field after its rect or page changed"""
+        page_num = self._indexed_page.get(id(field))
+        if page_num is None:
+            return
+        if page_num != field.page_num or self._indexed_name[id(field)] != field.name:
+            self._index_remove(field)
+            self._index_add(field)
+        else:
+            self._page_index[page_num].update(id(field), field, field.rect)
+    
+    def _managed_field(self, field: FormField) -> Optional[FormField]:
+        """
+        Find the managed field that is, or equals, the given field
+        
+        Args:
+            field: A managed field or a copy of one (history commands keep copies)
+            
+        Returns:
+            The field object stored in self.fields, or None if it is not managed
+        """
+        if id(field) in self._indexed_page:
+            return field
+        for managed in self._fields_by_name.get(field.name, ()):
+            if managed == field:
+                return managed
+        return None
     
     def create_field(self, field_type: FieldType, x: float, y: float, page_num: int) -> FormField:
         """
@@ -81,20 +260,128 @@ class FieldManager:
             field.image_data = None  # No image data initially
         
         # Add to fields list
-        self.fields.append(field)
+        self._append_field(field)
+        
+        logger.debug("Created field '%s' at canvas (%.1f, %.1f)", field.name, x, y)
+        
+        return field
+    
+    def create_and_select(self, field_type: FieldType, x: float, y: float, page_num: int) -> FormField:
+        """
+        Create a new field and select it, drawing it once with its handles
         
-        print(f"Created field '{field.name}' at canvas ({x:.1f}, {y:.1f})")
+        The draw is deferred to the idle redraw pass, which also redraws the
+        previously selected field without its highlight.
         
+        Args:
+            field_type: Type of field to create
+            x, y: Position on canvas
+            page_num: PDF page number
+            
+        Returns:
+            The created FormField
+        """
+        field = self.create_field(field_type, x, y, page_num)
+        self.select_field(field)
         return field
     
+    def generate_unique_name(self, name: str) -> str:
+        """
+        Get a field name not used by any managed field
+        
+        Args:
+            name: Preferred name
+            
+        Returns:
+            name itself if it is free, otherwise the first free "<name>_copy_<n>"
+        """
+        candidate = name
+        counter = 1
+        # The name index answers each probe without scanning the fields
+        while candidate in self._fields_by_name:
+            candidate = f"{name}_copy_{counter}"
+            counter += 1
+        return candidate
+    
+    def rename_field(self, field: FormField, new_name: str):
+        """
+        Rename a field, keeping the name index and its canvas tags current
+        
+        Args:
+            field: Managed field to rename
+            new_name: The new name
+        """
+        field.name = new_name
+        self._reindex_field(field)
+        # Its canvas tags carry the name, so redraw the field under the new ones
+        self._schedule_redraw(field)
+    
+    def duplicate(self, field: FormField, page_num: Optional[int] = None, offset: float = 20.0) -> FormField:
+        """
+        Add a copy of a field under a unique name, offset from the original
+        
+        The copy is drawn on the next idle redraw pass.
+        
+        Args:
+            field: Field to copy (managed or not, e.g. the clipboard field)
+            page_num: Page for the copy, or None to keep the original's page
+            offset: Distance to shift the copy right and down, in PDF units
+            
+        Returns:
+            The new FormField
+        """
+        new_field = field.clone(self.generate_unique_name(field.name))
+        if page_num is not None:
+            new_field.page_num = page_num
+        rect = new_field.rect
+        rect[0] += offset
+        rect[1] += offset
+        rect[2] += offset
+        rect[3] += offset
+        
+        self._append_field(new_field)
+        self._schedule_redraw(new_field)
+        return new_field
+    
     def add_field(self, field: FormField):
         """Add an existing field to the manager (used for paste operations)"""
-        self.fields.append(field)
+        self._append_field(field)
         
         # Draw the field on the canvas
         self.draw_field(field)
         
-        print(f"Added field '{field.name}' to page {field.page_num + 1}")
+        logger.debug("Added field '%s' to page %d", field.name, field.page_num + 1)
+    
+    def insert_field(self, index: int, field: FormField):
+        """
+        Put a field back into the manager at a position of the field list
+        
+        Used to undo deletes, so the field keeps its place in the draw order.
+        
+        Args:
+            index: Position in self.fields
+            field: The field to insert
+        """
+        self._fields.insert(index, field)
+        self._index_add(field)
+        if self._fields[-1] is not field:
+            # Keep the page's field list in the same (draw) order as self.fields
+            page_num = field.page_num
+            self._fields_by_page[page_num] = [
+                other for other in self._fields if self._indexed_page.get(id(other)) == page_num]
+        self.draw_field(field)
+    
+    def _current_transform(self) -> Tuple[float, float]:
+        """
+        Get the PDF-to-canvas transform for the current zoom level
+        
+        Returns:
+            (scale, offset) such that canvas = pdf * scale + offset
+        """
+        if self.pdf_handler and hasattr(self.pdf_handler, 'pdf_scale'):
+            return self.pdf_handler.pdf_scale, AppConstants.CANVAS_OFFSET
+        # Fallback if no PDF handler
+        return 1.0, 0.0
     
     def get_canvas_rect_for_field(self, field: FormField) -> List[float]:
         """
@@ -106,19 +393,10 @@ class FieldManager:
         Returns:
             List of canvas coordinates [x1, y1, x2, y2] scaled for current zoom
         """
-        # Get PDF coordinates (stored in field.rect)
-        pdf_rect = field.rect.copy()
-        
-        # Convert to canvas coordinates using current zoom
-        if self.pdf_handler and hasattr(self.pdf_handler, 'pdf_scale'):
-            canvas_x1 = pdf_rect[0] * self.pdf_handler.pdf_scale + AppConstants.CANVAS_OFFSET
-            canvas_y1 = pdf_rect[1] * self.pdf_handler.pdf_scale + AppConstants.CANVAS_OFFSET
-            canvas_x2 = pdf_rect[2] * self.pdf_handler.pdf_scale + AppConstants.CANVAS_OFFSET
-            canvas_y2 = pdf_rect[3] * self.pdf_handler.pdf_scale + AppConstants.CANVAS_OFFSET
-            return [canvas_x1, canvas_y1, canvas_x2, canvas_y2]
-        else:
-            # Fallback if no PDF handler
-            return pdf_rect.copy()
+        # Convert PDF coordinates (stored in field.rect) using current zoom
+        scale, offset = self._current_transform()
+        x1, y1, x2, y2 = field.rect
+        return [x1 * scale + offset, y1 * scale + offset, x2 * scale + offset, y2 * scale + offset]
     
     def get_pdf_rect_for_field(self, field: FormField) -> List[float]:
         """
@@ -145,11 +423,10 @@ class FieldManager:
         
         # Select the new field
         self.selected_field = field
+        self._sel_handle_key = None
         if field:
             # Redraw the field with selection highlighting
-            self.canvas.delete(f"field_{field.name}")
-            self.canvas.delete(f"field_{field.name}_label")
-            self.draw_field(field)
+            self._schedule_redraw(field)
     
     def clear_selection(self):
         """Clear the currently selected field"""
@@ -159,15 +436,13 @@ class FieldManager:
             
             # Clear the selection first
             self.selected_field = None
+            self._sel_handle_key = None
             
             # Remove resize handles
-            for handle in AppConstants.RESIZE_HANDLES:
-                self.canvas.delete(f"handle_{handle}")
+            self._hide_resize_handles()
             
             # Redraw field without selection highlighting
-            self.canvas.delete(f"field_{previously_selected.name}")
-            self.canvas.delete(f"field_{previously_selected.name}_label")
-            self.draw_field(previously_selected)
+            self._schedule_redraw(previously_selected)
     
     def delete_field(self, field: FormField) -> bool:
         """
@@ -179,21 +454,26 @@ class FieldManager:
         Returns:
             True if field was deleted, False otherwise
         """
-        if field not in self.fields:
+        field = self._managed_field(field)
+        if field is None:
             return False
         
         # Remove from canvas
-        self.canvas.delete(f"field_{field.name}")
-        self.canvas.delete(f"field_{field.name}_label")
+        rect_tags, label_tags = _item_tags(field.name, field.page_num)
+        self.canvas.delete(rect_tags[0])
+        self.canvas.delete(label_tags[0])
         
         # Remove resize handles if this field is selected
         if field == self.selected_field:
-            for handle in AppConstants.RESIZE_HANDLES:
-                self.canvas.delete(f"handle_{handle}")
+            self._hide_resize_handles()
             self.selected_field = None
         
         # Remove from fields list
-        self.fields.remove(field)
+        for i, managed in enumerate(self._fields):
+            if managed is field:
+                del self._fields[i]
+                break
+        self._index_remove(field)
         return True
     
     def get_field_at_position(self, x: float, y: float, page_num: int) -> Optional[FormField]:
@@ -207,40 +487,157 @@ class FieldManager:
         Returns:
             Field at position, or None if no field found
         """
-        for field in self.fields:
-            if field.page_num != page_num:
+        index = self._page_index.get(page_num)
+        if not index:
+            return None
+        
+        # The index is kept in PDF coordinates, so map the point back first
+        scale, offset = self._current_transform()
+        pdf_x = (x - offset) / scale
+        pdf_y = (y - offset) / scale
+        
+        hits = []
+        for field in index.query_point(pdf_x, pdf_y):
+            # Use canvas coordinates for the exact hit detection
+            x1, y1, x2, y2 = field.rect
+            if (x1 * scale + offset <= x <= x2 * scale + offset and
+                    y1 * scale + offset <= y <= y2 * scale + offset):
+                hits.append(field)
+        
+        if len(hits) > 1:
+            # Overlapping fields: the earliest created one wins, as before
+            order = {id(field): i for i, field in enumerate(self._fields_by_page[page_num])}
+            hits.sort(key=lambda field: order.get(id(field), 0))
+        
+        return hits[0] if hits else None
+    
+    def _schedule_redraw(self, field: FormField):
+        """Mark a field dirty and redraw it once the Tk event loop is idle"""
+        self._dirty[id(field)] = field
+        if not self._redraw_scheduled:
+            self._redraw_scheduled = True
+            self.canvas.after_idle(self._flush_redraws)
+    
+    def _flush_redraws(self):
+        """Redraw every field marked dirty since the last flush"""
+        dirty = list(self._dirty.values())
+        self._dirty.clear()
+        self._redraw_scheduled = False
+        
+        current_page = getattr(self.pdf_handler, 'current_page', None) if self.pdf_handler else None
+        for field in dirty:
+            # Skip fields deleted or paged away from since they were scheduled
+            if id(field) not in self._indexed_page:
                 continue
-            
-            # Use canvas coordinates for hit detection
-            canvas_rect = self.get_canvas_rect_for_field(field)
-            x1, y1, x2, y2 = canvas_rect
-            if x1 <= x <= x2 and y1 <= y <= y2:
-                return field
+            if current_page is not None and field.page_num != current_page:
+                self._invalidate_hidden_page(field.page_num)
+                continue
+            self._redraw_field(field)
+    
+    def _redraw_field(self, field: FormField):
+        """Reposition a field's existing canvas items, or draw it from scratch"""
+        items = self._drawn_items.get(id(field))
+        if (items is None or items[2] != self._field_style(field)
+                or self.canvas.type(items[0]) != 'rectangle'):
+            # First draw, appearance change or items wiped by a page redraw
+            self._do_draw_field(field)
+            return
         
-        return None
+        x1, y1, x2, y2 = self.get_canvas_rect_for_field(field)
+        self.canvas.coords(items[0], x1, y1, x2, y2)
+        self.canvas.coords(items[1], x1 + 3, y1 + 3)
+        
+        if field == self.selected_field:
+            if self._handles_shown:
+                handle_size = AppConstants.HANDLE_SIZE
+                handles = _handle_positions(x1, y1, x2, y2, handle_size)
+                for direction, (hx, hy) in zip(_HANDLE_ORDER, handles):
+                    self.canvas.coords(self._handle_ids[direction],
+                                       hx, hy, hx + handle_size, hy + handle_size)
+            else:
+                self.draw_resize_handles(field)
+    
+    def _field_style(self, field: FormField) -> tuple:
+        """Everything besides position that affects how a field is drawn"""
+        return (field == self.selected_field, field.type, field.name, self._label_text(field))
+    
+    def _label_text(self, field: FormField) -> str:
+        """Text of the type label drawn in a field's corner"""
+        if field.type is FieldType.IMAGE:
+            if field.image_path:
+                return f"📷 {os.path.basename(field.image_path)}"
+            return "📷 Image"
+        return field.type.value
     
     def draw_field(self, field: FormField):
-        """Draw a field on the canvas"""
-        # First, remove any existing canvas elements for this field
-        self.canvas.delete(f"field_{field.name}")
-        self.canvas.delete(f"field_{field.name}_label")
+        """Draw a field on the canvas immediately (or at end_batch inside a batch)"""
+        self._dirty.pop(id(field), None)
+        if self._batch_depth:
+            self._batch_dirty[id(field)] = field
+            return
+        self._do_draw_field(field)
+    
+    def begin_batch(self):
+        """Defer draw_field calls until the matching end_batch"""
+        self._batch_depth += 1
+    
+    def end_batch(self):
+        """Draw each field touched since begin_batch once, in its final state"""
+        self._batch_depth -= 1
+        if self._batch_depth:
+            return
         
-        # Also remove resize handles if this field is selected
-        if field == self.selected_field:
-            for handle in AppConstants.RESIZE_HANDLES:
-                self.canvas.delete(f"handle_{handle}")
+        dirty = list(self._batch_dirty.values())
+        self._batch_dirty.clear()
+        for field in dirty:
+            # Fields deleted during the batch were already removed from the canvas
+            if id(field) in self._indexed_page:
+                self._do_draw_field(field)
+    
+    def _do_draw_field(self, field: FormField, canvas_rect: Optional[List[float]] = None,
+                       erase: bool = True):
+        """
+        Draw a field on the canvas
+        
+        Args:
+            field: The form field to draw
+            canvas_rect: Precomputed canvas rect, or None to compute it here
+            erase: Whether to delete the field's existing items first (False when
+                   the caller already cleared them with one tagged delete)
+        """
+        # Per-field tags for targeted updates, shared tags for bulk deletes
+        rect_tags, label_tags = _item_tags(field.name, field.page_num)
+        
+        if self._shown_page is not None and field.page_num != self._shown_page:
+            # Not on the page being shown: drop its items and redraw the page when shown
+            self.canvas.delete(rect_tags[0])
+            self.canvas.delete(label_tags[0])
+            self._drawn_items.pop(id(field), None)
+            self._invalidate_hidden_page(field.page_num)
+            return
+        
+        # First, remove any existing canvas elements for this field
+        old_items = self._drawn_items.pop(id(field), None)
+        if erase:
+            self.canvas.delete(rect_tags[0])
+            self.canvas.delete(label_tags[0])
+            if old_items is not None and old_items[2][2] != field.name:
+                # Renamed since the last draw - the name tags no longer match
+                self.canvas.delete(old_items[0])
+                self.canvas.delete(old_items[1])
         
         # Use canvas coordinates for drawing
-        canvas_rect = self.get_canvas_rect_for_field(field)
+        if canvas_rect is None:
+            canvas_rect = self.get_canvas_rect_for_field(field)
         x1, y1, x2, y2 = canvas_rect
         
         # Determine colors
-        color = AppConstants.FIELD_COLORS[field.type]
+        color = field.color
         outline_color = AppConstants.SELECTION_COLOR if field == self.selected_field else color
         outline_width = 3 if field == self.selected_field else 2
         
         # Draw main rectangle
-        if field.type == FieldType.IMAGE:
+        if field.type is FieldType.IMAGE:
             # For image fields, use dashed border to indicate placeholder
             field.canvas_id = self.canvas.create_rectangle(
                 x1, y1, x2, y2,
@@ -248,7 +645,7 @@ class FieldManager:
                 width=outline_width,
                 fill='lightgray',  # Light gray background for image placeholder
                 stipple='gray50',  # Pattern to indicate image area
-                tags=f"field_{field.name}"
+                tags=rect_tags
             )
         else:
             # Regular fields
@@ -257,7 +654,7 @@ class FieldManager:
                 outline=outline_color,
                 width=outline_width,
                 fill='',
-                tags=f"field_{field.name}"
+                tags=rect_tags
             )
         
         # Draw field type label
@@ -265,60 +662,184 @@ class FieldManager:
         label_y = y1 + 3
         
         # Special label for image fields
-        if field.type == FieldType.IMAGE:
-            label_text = "📷 Image"
-            if hasattr(field, 'image_path') and field.image_path:
-                import os
-                filename = os.path.basename(field.image_path)
-                label_text = f"📷 {filename}"
-        else:
-            label_text = field.type.value
+        label_text = self._label_text(field)
         
-        self.canvas.create_text(
+        label_id = self.canvas.create_text(
             label_x, label_y,
             anchor='nw',
             text=label_text,
             fill=outline_color,
             font=('Arial', 8, 'bold'),
-            tags=f"field_{field.name}_label"
+            tags=label_tags
         )
+        self._drawn_items[id(field)] = (field.canvas_id, label_id, self._field_style(field))
         
         # Draw resize handles if this field is selected
         if field == self.selected_field:
-            self.draw_resize_handles(field)
+            self.draw_resize_handles(field, canvas_rect)
     
-    def draw_resize_handles(self, field: FormField):
+    def draw_resize_handles(self, field: FormField, canvas_rect: Optional[List[float]] = None):
         """Draw resize handles around a selected field"""
-        canvas_rect = self.get_canvas_rect_for_field(field)
+        if canvas_rect is None:
+            canvas_rect = self.get_canvas_rect_for_field(field)
         x1, y1, x2, y2 = canvas_rect
         handle_size = AppConstants.HANDLE_SIZE
         
         # Calculate handle positions
-        handles = {
-            'nw': (x1 - handle_size//2, y1 - handle_size//2),  # Top-left
-            'ne': (x2 - handle_size//2, y1 - handle_size//2),  # Top-right
-            'sw': (x1 - handle_size//2, y2 - handle_size//2),  # Bottom-left
-            'se': (x2 - handle_size//2, y2 - handle_size//2),  # Bottom-right
-            'n': ((x1 + x2)//2 - handle_size//2, y1 - handle_size//2),   # Top
-            's': ((x1 + x2)//2 - handle_size//2, y2 - handle_size//2),   # Bottom
-            'w': (x1 - handle_size//2, (y1 + y2)//2 - handle_size//2),   # Left
-            'e': (x2 - handle_size//2, (y1 + y2)//2 - handle_size//2),   # Right
-        }
-        
-        for direction, (x, y) in handles.items():
-            self.canvas.create_rectangle(
-                x, y, x + handle_size, y + handle_size,
-                fill=AppConstants.HANDLE_COLOR,
-                outline='white',
-                width=1,
-                tags=f"handle_{direction}"
-            )
+        handles = _handle_positions(x1, y1, x2, y2, handle_size)
+        
+        # Reuse the handle items unless a page redraw wiped the canvas
+        if self._handle_ids and self.canvas.type(self._handle_ids['nw']) == 'rectangle':
+            for direction, (x, y) in zip(_HANDLE_ORDER, handles):
+                self.canvas.coords(self._handle_ids[direction], x, y, x + handle_size, y + handle_size)
+            self.canvas.itemconfigure("form_handle", state='normal')
+            # Keep them above fields drawn since they were created
+            self.canvas.tag_raise("form_handle")
+        else:
+            for direction, (x, y) in zip(_HANDLE_ORDER, handles):
+                self._handle_ids[direction] = self.canvas.create_rectangle(
+                    x, y, x + handle_size, y + handle_size,
+                    fill=AppConstants.HANDLE_COLOR,
+                    outline='white',
+                    width=1,
+                    tags=(f"handle_{direction}", "form_handle")
+                )
+        self._handles_shown = True
+    
+    def _hide_resize_handles(self):
+        """Hide the resize handles, keeping the items for the next selection"""
+        if self._handles_shown:
+            self.canvas.itemconfigure("form_handle", state='hidden')
+            self._handles_shown = False
+    
+    def get_canvas_rects_for_fields(self, fields: List[FormField]) -> List[List[float]]:
+        """
+        Get canvas coordinates for many fields with one vectorized transform
+        
+        Args:
+            fields: The form fields
+            
+        Returns:
+            List of canvas coordinates [x1, y1, x2, y2], one per field
+        """
+        if not fields:
+            return []
+        pdf_rects = np.array([field.rect for field in fields], dtype=np.float64)
+        
+        scale, offset = self._current_transform()
+        return CoordinateTransformer(scale, offset).pdf_to_canvas_batch(pdf_rects, 0).tolist()
+    
+    def show_page(self, page_num: int):
+        """
+        Switch the canvas to the fields of another page
+        
+        The fields of the page left are hidden rather than deleted, so coming
+        back to a page at the same zoom unhides its items instead of creating
+        them again. Pages changed or zoomed since they were drawn are redrawn.
+        
+        Args:
+            page_num: The page now displayed
+        """
+        if (self._page_drawn_scale.get(page_num) != self._current_transform()[0]
+                or not self._page_items_alive(page_num)):
+            self.redraw_fields_for_page(page_num)
+            return
+        
+        self._hide_shown_page(page_num)
+        self._hide_resize_handles()
+        self.canvas.itemconfigure(f"form_field_p{page_num}", state='normal')
+        self._shown_page = page_num
+        # Fields culled when the page was drawn may be in view now
+        self.reveal_visible_fields(page_num)
+    
+    def _hide_shown_page(self, page_num: int):
+        """Hide the items of the shown page if it is not page_num"""
+        if self._shown_page is not None and self._shown_page != page_num:
+            self.canvas.itemconfigure(f"form_field_p{self._shown_page}", state='hidden')
+    
+    def _page_items_alive(self, page_num: int) -> bool:
+        """Check that a page's items were not wiped from the canvas (e.g. by a delete("all"))"""
+        for field in self._fields_by_page.get(page_num, ()):
+            items = self._drawn_items.get(id(field))
+            if items is not None:
+                return self.canvas.type(items[0]) == 'rectangle'
+        return True
     
     def redraw_fields_for_page(self, page_num: int):
         """Redraw all fields for the specified page"""
-        for field in self.fields:
-            if field.page_num == page_num:
-                self.draw_field(field)
+        fields = list(self._fields_by_page.get(page_num, ()))
+        
+        # One tagged delete clears the whole page instead of two per field
+        self.canvas.delete(f"form_field_p{page_num}")
+        self._hide_resize_handles()
+        self._hide_shown_page(page_num)
+        self._shown_page = page_num
+        self._page_drawn_scale[page_num] = self._current_transform()[0]
+        if not fields:
+            # Pages without fields (common in mostly blank PDFs) need no view queries
+            return
+        
+        # Fields outside the scrolled-to area are drawn by reveal_visible_fields
+        # once they come into view
+        region = self._visible_region()
+        
+        # Convert every rect on the page at once instead of field by field,
+        # with the loop's method lookups hoisted into locals
+        pop_dirty = self._dirty.pop
+        draw = self._do_draw_field
+        for field, canvas_rect in zip(fields, self.get_canvas_rects_for_fields(fields)):
+            pop_dirty(id(field), None)
+            if region is not None and field is not self.selected_field:
+                x1, y1, x2, y2 = canvas_rect
+                if x2 < region[0] or x1 > region[2] or y2 < region[1] or y1 > region[3]:
+                    # Its items went with the page-wide delete above
+                    self._drawn_items.pop(id(field), None)
+                    continue
+            draw(field, canvas_rect, erase=False)
+    
+    def _visible_region(self) -> Optional[Tuple[float, float, float, float]]:
+        """
+        Get the part of the canvas currently scrolled into view
+        
+        Returns:
+            (x1, y1, x2, y2) in canvas coordinates, or None if the canvas is not
+            mapped yet (in which case nothing should be culled)
+        """
+        try:
+            x1 = self.canvas.canvasx(0)
+            y1 = self.canvas.canvasy(0)
+            width = self.canvas.winfo_width()
+            height = self.canvas.winfo_height()
+        except tk.TclError:
+            return None
+        if width <= 1 or height <= 1:
+            return None
+        return x1, y1, x1 + width, y1 + height
+    
+    def reveal_visible_fields(self, page_num: int):
+        """
+        Draw fields of a page that have scrolled into view but were never drawn
+        
+        Args:
+            page_num: The page currently displayed
+        """
+        index = self._page_index.get(page_num)
+        region = self._visible_region()
+        if not index or region is None:
+            return
+        
+        # Candidates come from the spatial index, which works in PDF coordinates
+        scale, offset = self._current_transform()
+        vx1, vy1, vx2, vy2 = region
+        for field in index.query_rect((vx1 - offset) / scale, (vy1 - offset) / scale,
+                                      (vx2 - offset) / scale, (vy2 - offset) / scale):
+            if id(field) in self._drawn_items:
+                continue
+            x1, y1, x2, y2 = field.rect
+            if (x2 * scale + offset < vx1 or x1 * scale + offset > vx2 or
+                    y2 * scale + offset < vy1 or y1 * scale + offset > vy2):
+                continue
+            self._schedule_redraw(field)
     
     def check_resize_handle_click(self, x: float, y: float) -> Optional[str]:
         """
@@ -333,28 +854,40 @@ class FieldManager:
         if not self.selected_field:
             return None
         
-        # Use canvas coordinates for handle detection
-        canvas_rect = self.get_canvas_rect_for_field(self.selected_field)
-        x1, y1, x2, y2 = canvas_rect
-        handle_size = AppConstants.HANDLE_SIZE
+        self._update_handle_cache()
         
-        handles = {
-            'nw': (x1 - handle_size//2, y1 - handle_size//2),
-            'ne': (x2 - handle_size//2, y1 - handle_size//2),
-            'sw': (x1 - handle_size//2, y2 - handle_size//2),
-            'se': (x2 - handle_size//2, y2 - handle_size//2),
-            'n': ((x1 + x2)//2 - handle_size//2, y1 - handle_size//2),
-            's': ((x1 + x2)//2 - handle_size//2, y2 - handle_size//2),
-            'w': (x1 - handle_size//2, (y1 + y2)//2 - handle_size//2),
-            'e': (x2 - handle_size//2, (y1 + y2)//2 - handle_size//2),
-        }
-        
-        for direction, (hx, hy) in handles.items():
-            if hx <= x <= hx + handle_size and hy <= y <= hy + handle_size:
+        # Reject points outside the box spanned by all eight handles
+        bx1, by1, bx2, by2 = self._sel_bounds
+        if not (bx1 <= x <= bx2 and by1 <= y <= by2):
+            return None
+        
+        for direction, hx1, hy1, hx2, hy2 in self._sel_handle_bboxes:
+            if hx1 <= x <= hx2 and hy1 <= y <= hy2:
                 return direction
         
         return None
     
+    def _update_handle_cache(self):
+        """Recompute the selected field's handle hit boxes if its rect or the zoom changed"""
+        field = self.selected_field
+        scale = getattr(self.pdf_handler, 'pdf_scale', None)
+        key = (id(field), tuple(field.rect), scale)
+        if key == self._sel_handle_key:
+            return
+        
+        # Use canvas coordinates for handle detection
+        x1, y1, x2, y2 = self.get_canvas_rect_for_field(field)
+        handle_size = AppConstants.HANDLE_SIZE
+        half = handle_size // 2
+        
+        self._sel_bounds = (min(x1, x2) - half, min(y1, y2) - half,
+                            max(x1, x2) - half + handle_size, max(y1, y2) - half + handle_size)
+        self._sel_handle_bboxes = tuple(
+            (direction, hx, hy, hx + handle_size, hy + handle_size)
+            for direction, (hx, hy) in zip(_HANDLE_ORDER, _handle_positions(x1, y1, x2, y2, handle_size))
+        )
+        self._sel_handle_key = key
+    
     def move_field(self, field: FormField, dx: float, dy: float):
         """
         Move a field by the specified delta (in canvas coordinates)
@@ -364,22 +897,35 @@ class FieldManager:
             dx, dy: Movement delta in canvas coordinates
         """
         # Convert canvas delta to PDF delta
-        if self.pdf_handler and hasattr(self.pdf_handler, 'pdf_scale'):
-            pdf_dx = dx / self.pdf_handler.pdf_scale
-            pdf_dy = dy / self.pdf_handler.pdf_scale
-        else:
-            pdf_dx, pdf_dy = dx, dy
+        scale = self._current_transform()[0]
+        pdf_dx = dx / scale
+        pdf_dy = dy / scale
+        
+        # Update PDF coordinates in place - no new list per motion event
+        rect = field.rect
+        rect[0] += pdf_dx
+        rect[1] += pdf_dy
+        rect[2] += pdf_dx
+        rect[3] += pdf_dy
+        self._reindex_field(field)
+        
+        # Redraw once per idle cycle rather than on every motion event
+        self._schedule_redraw(field)
+    
+    def set_field_rect(self, field: FormField, rect: List[float]):
+        """
+        Move or resize a field to a new rect (in PDF coordinates)
         
-        # Update PDF coordinates
-        x1, y1, x2, y2 = field.rect
-        field.rect = [x1 + pdf_dx, y1 + pdf_dy, x2 + pdf_dx, y2 + pdf_dy]
+        Like move_field, the field is redrawn once per idle cycle, so a burst
+        of calls (e.g. arrow-key autorepeat) costs a single redraw.
         
-        # Redraw the field
-        self.canvas.delete(f"field_{field.name}")
-        self.canvas.delete(f"field_{field.name}_label")
-        for handle in AppConstants.RESIZE_HANDLES:
-            self.canvas.delete(f"handle_{handle}")
-        self.draw_field(field)
+        Args:
+            field: Field to update
+            rect: New [x1, y1, x2, y2] in PDF coordinates
+        """
+        field.rect[:] = rect
+        self._reindex_field(field)
+        self._schedule_redraw(field)
     
     def resize_field(self, field: FormField, handle: str, x: float, y: float):
         """
@@ -391,47 +937,43 @@ class FieldManager:
             x, y: New position of the handle in canvas coordinates
         """
         # Convert canvas coordinates to PDF coordinates
-        if self.pdf_handler and hasattr(self.pdf_handler, 'pdf_scale'):
-            pdf_x = (x - AppConstants.CANVAS_OFFSET) / self.pdf_handler.pdf_scale
-            pdf_y = (y - AppConstants.CANVAS_OFFSET) / self.pdf_handler.pdf_scale
-        else:
-            pdf_x, pdf_y = x, y
+        scale, offset = self._current_transform()
+        pdf_x = (x - offset) / scale
+        pdf_y = (y - offset) / scale
+        min_pdf = 10 / scale  # Minimum width/height (10 canvas pixels) in PDF units
         
         x1, y1, x2, y2 = field.rect  # PDF coordinates
         
         # Update rectangle based on resize handle
-        if 'n' in handle:
-            y1 = min(pdf_y, y2 - 10/self.pdf_handler.pdf_scale)  # Minimum height in PDF units
-        if 's' in handle:
-            y2 = max(pdf_y, y1 + 10/self.pdf_handler.pdf_scale)
-        if 'w' in handle:
-            x1 = min(pdf_x, x2 - 10/self.pdf_handler.pdf_scale)  # Minimum width in PDF units
-        if 'e' in handle:
-            x2 = max(pdf_x, x1 + 10/self.pdf_handler.pdf_scale)
-        
-        field.rect = [x1, y1, x2, y2]
-        
-        # Redraw the field
-        self.canvas.delete(f"field_{field.name}")
-        self.canvas.delete(f"field_{field.name}_label")
-        for h in AppConstants.RESIZE_HANDLES:
-            self.canvas.delete(f"handle_{h}")
-        self.draw_field(field)
+        mask = _HANDLE_MASK[handle]
+        if mask & 1:
+            y1 = min(pdf_y, y2 - min_pdf)
+        if mask & 2:
+            y2 = max(pdf_y, y1 + min_pdf)
+        if mask & 4:
+            x1 = min(pdf_x, x2 - min_pdf)
+        if mask & 8:
+            x2 = max(pdf_x, x1 + min_pdf)
+        
+        rect = field.rect
+        rect[0], rect[1], rect[2], rect[3] = x1, y1, x2, y2
+        self._reindex_field(field)
+        
+        # Redraw once per idle cycle rather than on every motion event
+        self._schedule_redraw(field)
     
     def get_fields_for_page(self, page_num: int) -> List[FormField]:
         """Get all fields for a specific page"""
-        return [field for field in self.fields if field.page_num == page_num]
+        return list(self._fields_by_page.get(page_num, ()))
     
     def clear_all_fields(self):
         """Clear all fields"""
-        for field in self.fields:
-            self.canvas.delete(f"field_{field.name}")
-            self.canvas.delete(f"field_{field.name}_label")
+        self.canvas.delete("form_field")
+        self._hide_resize_handles()
+        self._page_drawn_scale.clear()
         
-        for handle in AppConstants.RESIZE_HANDLES:
-            self.canvas.delete(f"handle_{handle}")
-        
-        self.fields.clear()
+        self._fields.clear()
+        self._index_rebuild()
         self.selected_field = None
         self.field_counter = 0
     
@@ -445,27 +987,24 @@ class FieldManager:
         # Clear current fields first
         self.clear_all_fields()
         
-        # Add each detected field
+        # Add the detected fields (their PDF coordinates are already in field.rect)
         for field in detected_fields:
-            # Ensure field has proper canvas coordinates
-            # The PDF coordinates are already stored in field.rect
-            
-            # Add to fields list
-            self.fields.append(field)
-            
-            # Update field counter to avoid name conflicts
-            # Extract number from field name if present
-            import re
-            match = re.search(r'(\d+)$', field.name)
-            if match:
-                field_num = int(match.group(1))
-                self.field_counter = max(self.field_counter, field_num)
+            self._append_field(field)
+        
+        # Update field counter to avoid name conflicts, using the
+        # highest number found at the end of a field name
+        matches = (_FIELD_NUM_RE.search(field.name) for field in detected_fields)
+        self.field_counter = max((int(match.group(1)) for match in matches if match),
+                                 default=self.field_counter)
         
         # Increment counter for next new field
         self.field_counter += 1
         
-        # Draw all fields for current page
+        # Draw all fields for current page in one pass
         if self.pdf_handler and hasattr(self.pdf_handler, 'current_page'):
             self.redraw_fields_for_page(self.pdf_handler.current_page)
         
-        print(f"Loaded {len(detected_fields)} existing fields from PDF")
\ No newline at end of file
+        # Let Tk paint the result now without processing other queued events
+        self.canvas.update_idletasks()
+        
+        logger.debug("Loaded %d existing fields from PDF", len(detected_fields))
\ No newline at end of file
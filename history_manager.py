@@ -4,10 +4,36 @@ History management system for PDF Form Maker
 Implements undo/redo functionality using the Command pattern
 """
 
+import time
 from abc import ABC, abstractmethod
-from typing import List, Optional, Any, Dict
-from models import FormField, FieldType
-import copy
+from collections import deque
+from typing import Deque, List, Optional, Any, Dict
+from models import FormField, FieldType, AppConstants
+
+
+def _copy_rect(rect) -> List[float]:
+    """Copy an [x1, y1, x2, y2] rect"""
+    return [rect[0], rect[1], rect[2], rect[3]]
+
+
+def _copy_properties(properties: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a property dict; values are primitives apart from list-valued ones like rect"""
+    return {prop: (list(value) if type(value) is list else value)
+            for prop, value in properties.items()}
+
+
+def _apply_properties(field_manager, field: FormField, properties: Dict[str, Any]) -> None:
+    """Set copies of properties on a field, keeping its cached type color current"""
+    for prop, value in _copy_properties(properties).items():
+        # Name and rect are indexed by the field manager, so change them through it
+        if prop == 'name':
+            field_manager.rename_field(field, value)
+        elif prop == 'rect':
+            field_manager.set_field_rect(field, value)
+        else:
+            setattr(field, prop, value)
+    if 'type' in properties:
+        field.color = AppConstants.FIELD_COLORS[field.type]
 
 
 class Command(ABC):
@@ -27,6 +53,18 @@ class Command(ABC):
     def description(self) -> str:
         """Get a description of what this command does"""
         pass
+    
+    def merge(self, other: 'Command') -> bool:
+        """
+        Fold a command that directly follows this one into it
+        
+        Args:
+            other: The newer command, already executed
+            
+        Returns:
+            True if this command now covers both, False to keep them separate
+        """
+        return False
 
 
 class CreateFieldCommand(Command):
@@ -34,7 +72,8 @@ class CreateFieldCommand(Command):
     
     def __init__(self, field_manager, field: FormField):
         self.field_manager = field_manager
-        self.field = copy.deepcopy(field)
+        # Keep the field itself so later commands on it still apply after redo
+        self.field = field
         self.was_executed = False
     
     def execute(self) -> None:
@@ -48,8 +87,8 @@ class CreateFieldCommand(Command):
     def undo(self) -> None:
         """Remove the created field"""
         if self.was_executed:
-            if self.field in self.field_manager.fields:
-                self.field_manager.delete_field(self.field)
+            if self.field_manager.delete_field(self.field):
+                self.was_executed = False
     
     def description(self) -> str:
         return f"Create {self.field.type.value} field '{self.field.name}'"
@@ -60,21 +99,23 @@ class DeleteFieldCommand(Command):
     
     def __init__(self, field_manager, field: FormField):
         self.field_manager = field_manager
-        self.field = copy.deepcopy(field)
+        # Keep the field itself so later commands on it still apply after undo
+        self.field = field
         self.field_index = None
     
     def execute(self) -> None:
         """Delete the field"""
-        if self.field in self.field_manager.fields:
+        try:
             self.field_index = self.field_manager.fields.index(self.field)
-            self.field_manager.delete_field(self.field)
+        except ValueError:
+            return
+        self.field_manager.delete_field(self.field)
     
     def undo(self) -> None:
         """Restore the deleted field"""
         if self.field_index is not None:
             # Insert at original position
-            self.field_manager.fields.insert(self.field_index, self.field)
-            self.field_manager.draw_field(self.field)
+            self.field_manager.insert_field(self.field_index, self.field)
     
     def description(self) -> str:
         return f"Delete {self.field.type.value} field '{self.field.name}'"
@@ -86,21 +127,29 @@ class MoveFieldCommand(Command):
     def __init__(self, field_manager, field: FormField, old_rect: List[float], new_rect: List[float]):
         self.field_manager = field_manager
         self.field = field
-        self.old_rect = copy.deepcopy(old_rect)
-        self.new_rect = copy.deepcopy(new_rect)
+        self.old_rect = _copy_rect(old_rect)
+        self.new_rect = _copy_rect(new_rect)
     
     def execute(self) -> None:
         """Move the field to new position"""
-        self.field.rect = copy.deepcopy(self.new_rect)
+        self.field_manager.set_field_rect(self.field, self.new_rect)
         self.field_manager.draw_field(self.field)
     
     def undo(self) -> None:
         """Move the field back to old position"""
-        self.field.rect = copy.deepcopy(self.old_rect)
+        self.field_manager.set_field_rect(self.field, self.old_rect)
         self.field_manager.draw_field(self.field)
     
     def description(self) -> str:
         return f"Move field '{self.field.name}'"
+    
+    def merge(self, other: Command) -> bool:
+        """Absorb a move of the same field that starts where this one ended"""
+        if (isinstance(other, MoveFieldCommand) and other.field is self.field
+                and other.old_rect == self.new_rect):
+            self.new_rect = _copy_rect(other.new_rect)
+            return True
+        return False
 
 
 class EditFieldCommand(Command):
@@ -109,19 +158,18 @@ class EditFieldCommand(Command):
     def __init__(self, field_manager, field: FormField, old_properties: Dict[str, Any], new_properties: Dict[str, Any]):
         self.field_manager = field_manager
         self.field = field
-        self.old_properties = copy.deepcopy(old_properties)
-        self.new_properties = copy.deepcopy(new_properties)
+        self.old_properties = _copy_properties(old_properties)
+        self.new_properties = _copy_properties(new_properties)
     
     def execute(self) -> None:
         """Apply new properties to field"""
-        for prop, value in self.new_properties.items():
-            setattr(self.field, prop, value)
+        # Fields are edited in place later (e.g. rect during drags), so hand out copies
+        _apply_properties(self.field_manager, self.field, self.new_properties)
         self.field_manager.draw_field(self.field)
     
     def undo(self) -> None:
         """Restore old properties to field"""
-        for prop, value in self.old_properties.items():
-            setattr(self.field, prop, value)
+        _apply_properties(self.field_manager, self.field, self.old_properties)
         self.field_manager.draw_field(self.field)
     
     def description(self) -> str:
@@ -136,15 +184,36 @@ class BatchCommand(Command):
         self.commands = commands
         self._description = description
     
+    def _field_manager(self):
+        """Field manager shared by the grouped commands, if any"""
+        for command in self.commands:
+            field_manager = getattr(command, 'field_manager', None)
+            if field_manager is not None:
+                return field_manager
+        return None
+    
+    def _run(self, commands, method: str) -> None:
+        """Call execute/undo on each command, redrawing every touched field once at the end"""
+        field_manager = self._field_manager()
+        if field_manager is None:
+            for command in commands:
+                getattr(command, method)()
+            return
+        
+        field_manager.begin_batch()
+        try:
+            for command in commands:
+                getattr(command, method)()
+        finally:
+            field_manager.end_batch()
+    
     def execute(self) -> None:
         """Execute all commands in order"""
-        for command in self.commands:
-            command.execute()
+        self._run(self.commands, 'execute')
     
     def undo(self) -> None:
         """Undo all commands in reverse order"""
-        for command in reversed(self.commands):
-            command.undo()
+        self._run(reversed(self.commands), 'undo')
     
     def description(self) -> str:
         return self._description
@@ -153,12 +222,37 @@ class BatchCommand(Command):
 class HistoryManager:
     """Manages command history for undo/redo functionality"""
     
+    # Commands added within this many seconds of the previous one may be merged
+    MERGE_WINDOW = 0.5
+    
     def __init__(self, max_history: int = 25):
         self.max_history = max_history
-        self.history: List[Command] = []
+        self.merge_window = self.MERGE_WINDOW
+        self._last_add_time = float('-inf')
+        # Bounded: appending past max_history drops the oldest command in O(1)
+        self.history: Deque[Command] = deque(maxlen=max_history)
+        self._can_undo = False
+        self._can_redo = False
         self.current_index = -1  # -1 means no commands executed
         self.enabled = True
     
+    @property
+    def current_index(self) -> int:
+        """Index of the last executed command (-1 means none)"""
+        return self._current_index
+    
+    @current_index.setter
+    def current_index(self, value: int) -> None:
+        self._current_index = value
+        self._recompute_flags()
+    
+    def _recompute_flags(self) -> None:
+        """Refresh the cached undo/redo availability after the history changed"""
+        size = len(self.history)
+        index = self._current_index
+        self._can_undo = 0 <= index < size
+        self._can_redo = -1 <= index < size - 1
+    
     def execute_command(self, command: Command) -> None:
         """Execute a command and add it to history"""
         if not self.enabled:
@@ -176,43 +270,40 @@ class HistoryManager:
         if not self.enabled:
             return
         
+        # Fold rapid follow-ups (e.g. arrow-key autorepeat moves) into the last command
+        now = time.monotonic()
+        recent = now - self._last_add_time <= self.merge_window
+        self._last_add_time = now
+        if (recent and self.current_index >= 0 and self.current_index == len(self.history) - 1
+                and self.history[self.current_index].merge(command)):
+            self._recompute_flags()
+            return
+        
         # Remove any commands after current index (for redo functionality)
-        if self.current_index < len(self.history) - 1:
-            self.history = self.history[:self.current_index + 1]
+        while len(self.history) > self.current_index + 1:
+            self.history.pop()
         
-        # Add command to history
+        # Add command to history (the deque evicts the oldest one when full)
+        was_full = len(self.history) == self.history.maxlen
         self.history.append(command)
-        self.current_index += 1
-        
-        # Maintain max history size
-        if len(self.history) > self.max_history:
-            self.history.pop(0)
-            self.current_index -= 1
+        if not was_full:
+            self.current_index += 1
+        self._recompute_flags()
     
     def undo(self) -> bool:
         """Undo the last command. Returns True if successful, False if nothing to undo"""
-        if not self.can_undo():
-            return False
-        
-        # Double-check bounds for safety
-        if self.current_index >= len(self.history):
-            self.current_index = len(self.history) - 1
-        
-        if self.current_index < 0 or len(self.history) == 0:
+        # The cached flag is only set while current_index points into the history
+        if not self._can_undo:
             return False
         
         command = self.history[self.current_index]
         command.undo()
-        self.current_index -= 1
+        self.current_index -= 1  # The setter refreshes the flags
         return True
     
     def redo(self) -> bool:
         """Redo the next command. Returns True if successful, False if nothing to redo"""
-        if not self.can_redo():
-            return False
-        
-        # Double-check bounds for safety
-        if self.current_index >= len(self.history) - 1:
+        if not self._can_redo:
             return False
         
         self.current_index += 1
@@ -221,29 +312,22 @@ class HistoryManager:
         return True
     
     def can_undo(self) -> bool:
-        """Check if undo is possible"""
-        return (self.current_index >= 0 and 
-                self.current_index < len(self.history) and 
-                len(self.history) > 0)
+        """Check if undo is possible (cached; refreshed whenever the history changes)"""
+        return self._can_undo
     
     def can_redo(self) -> bool:
-        """Check if redo is possible"""
-        return (self.current_index < len(self.history) - 1 and 
-                len(self.history) > 0)
+        """Check if redo is possible (cached; refreshed whenever the history changes)"""
+        return self._can_redo
     
     def get_undo_description(self) -> Optional[str]:
         """Get description of what would be undone"""
-        if (self.can_undo() and 
-            self.current_index < len(self.history) and 
-            self.current_index >= 0):
+        if self._can_undo:
             return self.history[self.current_index].description()
         return None
     
     def get_redo_description(self) -> Optional[str]:
         """Get description of what would be redone"""
-        if (self.can_redo() and 
-            self.current_index + 1 < len(self.history) and 
-            self.current_index >= -1):
+        if self._can_redo:
             return self.history[self.current_index + 1].description()
         return None
     
@@ -11,12 +11,14 @@ This is the main entry point that coordinates all the components:
 - CoordinateTransformer: Handles coordinate conversions
 
 Requirements: 
-pip install PyMuPDF Pillow
+pip install PyMuPDF Pillow numpy
 
 Usage:
 python main.py
 """
 
+import logging
+import time
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from typing import Optional
@@ -25,10 +27,30 @@ from typing import Optional
 from models import FieldType, AppConstants, MouseState
 from pdf_handler import PDFHandler
 from field_manager import FieldManager
-from ui_components import ToolbarFrame, NavigationFrame, StatusBar, ScrollableCanvas, FieldsSidebar
-from history_manager import HistoryManager, CreateFieldCommand, DeleteFieldCommand, MoveFieldCommand, EditFieldCommand
+from ui_components import (ToolbarFrame, NavigationFrame, StatusBar, ScrollableCanvas, FieldsSidebar,
+                           FieldPropertiesDialog)
+from history_manager import (HistoryManager, CreateFieldCommand, DeleteFieldCommand, MoveFieldCommand, EditFieldCommand,
+                             BatchCommand)
 from pdf_form_inputter import PDFFormInputter
 
+logger = logging.getLogger(__name__)
+
+# Unit movement per arrow key (canvas y grows downward)
+_ARROW_DELTA = {'Left': (-1, 0), 'Right': (1, 0), 'Up': (0, -1), 'Down': (0, 1)}
+
+# Fixed status messages for the interactive paths, built once per field type
+_TOOL_STATUS = {
+    t: f"Selected tool: {t.value.title()} - Click on the PDF to add a field" for t in FieldType
+}
+_SELECTED_STATUS = {
+    t: f"Selected {t.value} field - Drag to move, use arrow keys or handles to resize, or press Delete to remove"
+    for t in FieldType
+}
+_CREATED_STATUS = {
+    t: f"Created {t.value} field - Use mouse to move/resize, arrow keys to fine-tune position, or Delete key to remove"
+    for t in FieldType
+}
+
 
 class PdfFormMakerApp:
     """Main application class that coordinates all components"""
@@ -45,6 +67,13 @@ class PdfFormMakerApp:
         self.current_tool: Optional[FieldType] = None
         self.mouse_state = MouseState()
         self.clipboard_field: Optional['FormField'] = None  # For copy/paste functionality
+        self._last_motion_xy = (None, None)  # Last canvas pixel handled by on_canvas_motion
+        self._last_motion_time = 0.0  # When on_canvas_motion last ran its hit tests
+        self._zoom_redraw_job = None  # Pending after() job of _flush_zoom_redraw
+        self._canvas_has_focus = False  # Kept current by the canvas <FocusIn>/<FocusOut> bindings
+        self.original_field_rect: Optional[list] = None  # Selected field's rect when a drag started
+        self._edit_dialog = None  # FieldPropertiesDialog, built on first edit
+        self._refresh_pending = False  # A _flush_refresh is queued with after_idle
         
         # Create UI components
         self._create_ui_components()
@@ -95,7 +124,8 @@ class PdfFormMakerApp:
         # Main canvas area with mouse wheel zoom
         self.canvas_frame = ScrollableCanvas(
             main_frame,
-            on_mouse_wheel_zoom=self.handle_mouse_wheel_zoom
+            on_mouse_wheel_zoom=self.handle_mouse_wheel_zoom,
+            on_view_changed=self.on_canvas_view_changed
         )
         self.canvas_frame.pack(side='right', fill='both', expand=True, padx=(5, 0))
         
@@ -115,7 +145,7 @@ class PdfFormMakerApp:
     def _bind_events(self):
         """Bind keyboard and mouse events"""
         # Keyboard events
-        self.root.bind('<Key>', self.on_key_press)
+        self.root.bind('<Delete>', self.on_delete_key)
         self.root.bind('<Control-o>', lambda e: self.open_pdf())
         self.root.bind('<Control-s>', lambda e: self.save_pdf())
         self.root.bind('<Control-c>', lambda e: self.copy_field())
@@ -145,7 +175,9 @@ class PdfFormMakerApp:
                 '<Button-1>': self.on_canvas_click,
                 '<B1-Motion>': self.on_canvas_drag,
                 '<ButtonRelease-1>': self.on_canvas_release,
-                '<Motion>': self.on_canvas_motion
+                '<Motion>': self.on_canvas_motion,
+                '<FocusIn>': self._on_canvas_focus_change,
+                '<FocusOut>': self._on_canvas_focus_change
             }
         )
         
@@ -196,13 +228,13 @@ class PdfFormMakerApp:
             self.pdf_inputter.show_inputter()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open PDF form inputter: {str(e)}")
-            print(f"Error in accomplish_pdf: {e}")
+            logger.error("Error in accomplish_pdf: %s", e)
     
     def select_tool(self, field_type: FieldType):
         """Select a form field tool"""
         self.current_tool = field_type
         self.field_manager.clear_selection()
-        self.status_bar.set_status(f"Selected tool: {field_type.value.title()} - Click on the PDF to add a field")
+        self.status_bar.set_status(_TOOL_STATUS[field_type])
     
     def clear_selection(self):
         """Clear current selections"""
@@ -213,35 +245,31 @@ class PdfFormMakerApp:
     
     def handle_arrow_key(self, event):
         """Handle arrow key events for field movement or canvas panning"""
-        print(f"DEBUG: Arrow key pressed - {event.keysym}")  # Debug print
-        
-        # Check if canvas has focus (or any of its children)
-        focused_widget = self.root.focus_get()
-        canvas_has_focus = (focused_widget == self.canvas_frame.canvas or 
-                           (focused_widget and str(focused_widget).startswith(str(self.canvas_frame.canvas))))
+        logger.debug("Arrow key pressed - %s", event.keysym)
         
-        if not canvas_has_focus:
-            print(f"DEBUG: Canvas doesn't have focus (focused: {focused_widget}), ignoring arrow key")
+        # Focus is tracked by bindings, so no Tcl round trips per keystroke
+        if not self._canvas_has_focus:
+            logger.debug("Canvas doesn't have focus, ignoring arrow key")
             return
         
-        print(f"DEBUG: Canvas has focus, processing arrow key")
-        
         # Check if a field is selected
         if self.field_manager.selected_field:
-            print(f"DEBUG: Moving selected field: {self.field_manager.selected_field.name}")  # Debug print
+            logger.debug("Moving selected field: %s", self.field_manager.selected_field.name)
             # Move the selected field
             self.move_selected_field_with_arrow(event)
         else:
-            print("DEBUG: No field selected, falling back to canvas panning")  # Debug print
+            logger.debug("No field selected, falling back to canvas panning")
             # Fall back to canvas panning
             self.canvas_frame.handle_keyboard_pan(event)
     
+    def _on_canvas_focus_change(self, event):
+        """Remember whether the canvas has keyboard focus (for arrow keys)"""
+        self._canvas_has_focus = event.type == tk.EventType.FocusIn
+    
     def move_selected_field_with_arrow(self, event):
         """Move the selected field using arrow keys"""
-        print(f"DEBUG: move_selected_field_with_arrow called with {event.keysym}")  # Debug print
-        
         if not self.field_manager.selected_field:
-            print("DEBUG: No selected field in move method")  # Debug print
+            logger.debug("No selected field in move method")
             return
         
         # Define movement step size (in canvas pixels)
@@ -255,16 +283,9 @@ class PdfFormMakerApp:
         current_step = large_step_size if shift_pressed else step_size
         
         # Calculate movement delta based on direction
-        dx, dy = 0, 0
         direction = event.keysym
-        if direction == 'Left':
-            dx = -current_step
-        elif direction == 'Right':
-            dx = current_step
-        elif direction == 'Up':
-            dy = -current_step
-        elif direction == 'Down':
-            dy = current_step
+        unit_x, unit_y = _ARROW_DELTA.get(direction, (0, 0))
+        dx, dy = unit_x * current_step, unit_y * current_step
         
         # Store original position for undo
         field = self.field_manager.selected_field
@@ -278,11 +299,12 @@ class PdfFormMakerApp:
         new_rect[3] += dy  # y2
         move_command = MoveFieldCommand(self.field_manager, field, original_rect, new_rect)
         
-        # Execute the move command through history manager
-        self.history_manager.execute_command(move_command)
+        # Move now but redraw at idle, like a mouse drag, so autorepeat steps share
+        # a redraw; the history merges the steps of one key hold into one command
+        self.field_manager.set_field_rect(field, new_rect)
+        self.history_manager.add_command(move_command)
         
-        # Update sidebar if the field was moved
-        self._update_sidebar()
+        # The sidebar shows no positions, so it does not need a refresh here
         
         # Update status
         field_name = self.field_manager.selected_field.name
@@ -296,56 +318,51 @@ class PdfFormMakerApp:
         
         # Get canvas coordinates
         x, y = self.canvas_frame.get_canvas_coords(event)
-        print(f"Canvas click at: ({x:.1f}, {y:.1f})")
+        field_manager = self.field_manager  # Read once; every branch below uses it
+        logger.debug("Canvas click at: (%.1f, %.1f)", x, y)
+        self._last_motion_xy = (None, None)  # The selection may change under the cursor
         
         # Check if clicking on a resize handle
-        handle_clicked = self.field_manager.check_resize_handle_click(x, y)
+        handle_clicked = field_manager.check_resize_handle_click(x, y)
         if handle_clicked:
             self.mouse_state.start_resize(x, y, handle_clicked)
             return
         
         # Check if clicking on an existing field
-        clicked_field = self.field_manager.get_field_at_position(
-            x, y, self.pdf_handler.current_page
-        )
+        page_num = self.pdf_handler.current_page
+        clicked_field = field_manager.get_field_at_position(x, y, page_num)
         
         if clicked_field:
             # Select the field
-            self.field_manager.select_field(clicked_field)
+            field_manager.select_field(clicked_field)
             self.sidebar.select_field(clicked_field)  # Update sidebar selection
             
             # Store original field position for undo
             self.original_field_rect = clicked_field.rect.copy()
             
             self.mouse_state.start_drag(x, y)
-            self.status_bar.set_status(f"Selected {clicked_field.type.value} field - Drag to move, use arrow keys or handles to resize, or press Delete to remove")
+            self.status_bar.set_status(_SELECTED_STATUS[clicked_field.type])
             
         elif self.current_tool:
-            # Create new field at click position
-            field = self.field_manager.create_field(
-                self.current_tool, x, y, self.pdf_handler.current_page
-            )
+            # Create, draw and select the new field at click position
+            field = field_manager.create_and_select(self.current_tool, x, y, page_num)
             
             # Create history command for field creation (already executed)
-            create_command = CreateFieldCommand(self.field_manager, field)
+            create_command = CreateFieldCommand(field_manager, field)
             create_command.was_executed = True  # Mark as executed since field was already created
             self.history_manager.add_command(create_command)
             
-            # Draw and select the new field
-            self.field_manager.draw_field(field)
-            self.field_manager.select_field(field)
-            
             # Update sidebar
-            self._update_sidebar()
+            self._schedule_refresh()
             
             # Clear tool selection
             self.current_tool = None
             self.toolbar.clear_tool_selection()
-            self.status_bar.set_status(f"Created {field.type.value} field - Use mouse to move/resize, arrow keys to fine-tune position, or Delete key to remove")
+            self.status_bar.set_status(_CREATED_STATUS[field.type])
             
         else:
             # Clear selection if clicking on empty space
-            self.field_manager.clear_selection()
+            field_manager.clear_selection()
             self.sidebar.select_field(None)  # Clear sidebar selection
     
     def on_canvas_drag(self, event):
@@ -368,6 +385,10 @@ class PdfFormMakerApp:
             dx = x - self.mouse_state.drag_start_x
             dy = y - self.mouse_state.drag_start_y
             
+            # Sub-pixel motion accumulates until it adds up to a whole pixel
+            if abs(dx) < 1 and abs(dy) < 1:
+                return
+            
             self.field_manager.move_field(
                 self.field_manager.selected_field,
                 dx, dy
@@ -381,7 +402,7 @@ class PdfFormMakerApp:
         """Handle canvas mouse release events"""
         # If we were dragging a field, create a move command for history
         if (self.mouse_state.dragging and self.field_manager.selected_field and 
-            hasattr(self, 'original_field_rect') and self.original_field_rect):
+            self.original_field_rect is not None):
             
             current_rect = self.field_manager.selected_field.rect
             
@@ -403,11 +424,25 @@ class PdfFormMakerApp:
     def on_canvas_motion(self, event):
         """Handle canvas mouse motion for cursor changes"""
         if not self.pdf_handler.pdf_doc or not self.field_manager.selected_field:
+            self._last_motion_xy = (None, None)
             self.canvas_frame.set_cursor("")
             return
         
         x, y = self.canvas_frame.get_canvas_coords(event)
         
+        # Skip the hit tests for sub-pixel jitter, and for small moves arriving
+        # faster than MOTION_THROTTLE_S after the last tested one
+        motion_xy = (int(x), int(y))
+        last_x, last_y = self._last_motion_xy
+        if motion_xy == self._last_motion_xy:
+            return
+        now = time.monotonic()
+        if (last_x is not None and now - self._last_motion_time < AppConstants.MOTION_THROTTLE_S
+                and abs(motion_xy[0] - last_x) < 2 and abs(motion_xy[1] - last_y) < 2):
+            return
+        self._last_motion_xy = motion_xy
+        self._last_motion_time = now
+        
         # Check if over a resize handle
         handle = self.field_manager.check_resize_handle_click(x, y)
         if handle:
@@ -418,12 +453,10 @@ class PdfFormMakerApp:
         else:
             self.canvas_frame.set_cursor("")
     
-    def on_key_press(self, event):
-        """Handle key press events"""
-        if event.keysym == 'Delete' and self.field_manager.selected_field:
+    def on_delete_key(self, event):
+        """Handle the Delete key (Escape has its own binding)"""
+        if self.field_manager.selected_field:
             self.delete_selected_field()
-        elif event.keysym == 'Escape':
-            self.clear_selection()
     
     def delete_selected_field(self):
         """Delete the currently selected field"""
@@ -445,7 +478,7 @@ class PdfFormMakerApp:
             
             self.status_bar.set_status(f"Deleted {field.type.value} field")
             # Update sidebar after deletion
-            self._update_sidebar()
+            self._schedule_refresh()
     
     def copy_field(self):
         """Copy the currently selected field to clipboard"""
@@ -453,11 +486,8 @@ class PdfFormMakerApp:
             self.status_bar.set_status("No field selected to copy")
             return
         
-        # Create a copy of the field (deep copy of properties)
-        from copy import deepcopy
-        self.clipboard_field = deepcopy(self.field_manager.selected_field)
-        # Clear the canvas_id as it will be assigned when pasted
-        self.clipboard_field.canvas_id = None
+        # Create a copy of the field (canvas_id is assigned when pasted)
+        self.clipboard_field = self.field_manager.selected_field.clone()
         
         self.status_bar.set_status(f"Copied {self.clipboard_field.type.value} field '{self.clipboard_field.name}'")
     
@@ -471,56 +501,23 @@ class PdfFormMakerApp:
             self.status_bar.set_status("No PDF loaded")
             return
         
-        # Create a copy of the clipboard field for pasting
-        from copy import deepcopy
-        new_field = deepcopy(self.clipboard_field)
-        
-        # Generate a unique name for the pasted field
-        base_name = new_field.name
-        counter = 1
-        while any(field.name == new_field.name for field in self.field_manager.fields):
-            new_field.name = f"{base_name}_copy_{counter}"
-            counter += 1
-        
-        # Set the current page
-        new_field.page_num = self.pdf_handler.current_page
-        
-        # Position the field slightly offset from original or at a default location
-        original_rect = new_field.rect
-        offset = 20.0  # pixels
-        new_field.rect = [
-            original_rect[0] + offset,
-            original_rect[1] + offset,
-            original_rect[2] + offset,
-            original_rect[3] + offset
-        ]
-        
-        # Add the field through the field manager
-        self.field_manager.add_field(new_field)
+        # Add an offset copy of the clipboard field on the current page, under a unique name
+        new_field = self.field_manager.duplicate(self.clipboard_field, self.pdf_handler.current_page)
         self.field_manager.select_field(new_field)
         
         # Update sidebar
-        self._update_sidebar()
+        self._schedule_refresh()
         
         self.status_bar.set_status(f"Pasted {new_field.type.value} field '{new_field.name}'")
     
     def duplicate_field(self):
-        """Duplicate the currently selected field (copy + paste in one action)"""
+        """Duplicate the currently selected field and select the copy"""
         if not self.field_manager.selected_field:
             self.status_bar.set_status("No field selected to duplicate")
             return
         
-        # Store the original clipboard field
-        original_clipboard = self.clipboard_field
-        
-        # Copy the current field
-        self.copy_field()
-        
-        # Paste it
-        self.paste_field()
-        
-        # Restore the original clipboard
-        self.clipboard_field = original_clipboard
+        new_field = self._duplicate_field(self.field_manager.selected_field)
+        self.field_manager.select_field(new_field)
     
     def undo_last_action(self):
         """Undo the last action using the history manager"""
@@ -529,27 +526,27 @@ class PdfFormMakerApp:
                 description = self.history_manager.get_undo_description()
                 self.status_bar.set_status(f"Undone: {description}" if description else "Undone last action")
                 
-                # Refresh UI
-                self._update_sidebar()
-                self.field_manager.redraw_fields_for_page(self.pdf_handler.current_page)
+                # Each command redrew the fields it touched; the sidebar is
+                # rebuilt once, however many undos arrive before the next idle
+                self._schedule_refresh()
             else:
                 self.status_bar.set_status("Nothing to undo")
         except Exception as e:
-            print(f"Error during undo: {e}")
+            logger.error("Error during undo: %s", e)
             self.status_bar.set_status("Error during undo operation")
     
     def previous_page(self):
         """Go to previous page"""
         if self.pdf_handler.previous_page():
             self.field_manager.clear_selection()
-            self.field_manager.redraw_fields_for_page(self.pdf_handler.current_page)
+            self.field_manager.show_page(self.pdf_handler.current_page)
             self._update_navigation()
     
     def next_page(self):
         """Go to next page"""
         if self.pdf_handler.next_page():
             self.field_manager.clear_selection()
-            self.field_manager.redraw_fields_for_page(self.pdf_handler.current_page)
+            self.field_manager.show_page(self.pdf_handler.current_page)
             self._update_navigation()
     
     def _update_navigation(self):
@@ -595,28 +592,49 @@ class PdfFormMakerApp:
     # Zoom control methods
     def zoom_in(self):
         """Zoom in on the PDF"""
-        if self.pdf_handler.zoom_in():
-            self._update_zoom_display()
-            self.field_manager.redraw_fields_for_page(self.pdf_handler.current_page)
+        if self.pdf_handler.zoom_in(display=False):
+            self._schedule_zoom_redraw()
     
     def zoom_out(self):
         """Zoom out on the PDF"""
-        if self.pdf_handler.zoom_out():
-            self._update_zoom_display()
-            self.field_manager.redraw_fields_for_page(self.pdf_handler.current_page)
+        if self.pdf_handler.zoom_out(display=False):
+            self._schedule_zoom_redraw()
     
     def fit_to_window(self):
         """Fit PDF to window"""
+        self._cancel_zoom_redraw()
         if self.pdf_handler.fit_to_window():
             self._update_zoom_display()
             self.field_manager.redraw_fields_for_page(self.pdf_handler.current_page)
     
     def handle_mouse_wheel_zoom(self, event):
         """Handle mouse wheel zoom"""
-        if self.pdf_handler.handle_mouse_wheel_zoom(event):
+        if self.pdf_handler.handle_mouse_wheel_zoom(event, display=False):
+            self._schedule_zoom_redraw()
+    
+    def _schedule_zoom_redraw(self):
+        """Re-render the page and its fields once per frame, however many zoom steps arrive"""
+        if self._zoom_redraw_job is None:
+            self._zoom_redraw_job = self.root.after(AppConstants.ZOOM_REDRAW_DELAY_MS, self._flush_zoom_redraw)
+    
+    def _cancel_zoom_redraw(self):
+        """Drop a pending zoom redraw (a full redraw is about to happen anyway)"""
+        if self._zoom_redraw_job is not None:
+            self.root.after_cancel(self._zoom_redraw_job)
+            self._zoom_redraw_job = None
+    
+    def _flush_zoom_redraw(self):
+        """Show the page and fields at the zoom level reached since the last frame"""
+        self._zoom_redraw_job = None
+        if self.pdf_handler.display_page():
             self._update_zoom_display()
             self.field_manager.redraw_fields_for_page(self.pdf_handler.current_page)
     
+    def on_canvas_view_changed(self):
+        """Draw fields scrolled into view (off-screen fields are skipped on redraw)"""
+        if hasattr(self, 'field_manager') and self.pdf_handler.pdf_doc:
+            self.field_manager.reveal_visible_fields(self.pdf_handler.current_page)
+    
     def _update_zoom_display(self):
         """Update the zoom percentage in status bar"""
         zoom_percentage = self.pdf_handler.get_zoom_percentage()
@@ -634,7 +652,7 @@ class PdfFormMakerApp:
         delete_command = DeleteFieldCommand(self.field_manager, field)
         self.history_manager.execute_command(delete_command)
         
-        self._update_sidebar()
+        self._schedule_refresh()
         self.status_bar.set_status(f"Deleted {field.type.value} field '{field.name}'")
     
     def on_sidebar_field_edit(self, field):
@@ -647,190 +665,82 @@ class PdfFormMakerApp:
     
     def on_sidebar_field_name_changed(self, field, old_name, new_name):
         """Handle field name change from sidebar"""
-        # Update the canvas display to reflect the name change
-        self.field_manager.refresh_canvas()
+        # The sidebar already shows the new name; update the name index and canvas tags
+        self.field_manager.rename_field(field, new_name)
         # Update status bar to show the change
         self.status_bar.set_status(f"Field renamed from '{old_name}' to '{new_name}'")
     
     def _edit_field_properties(self, field):
         """Open field properties dialog"""
-        # Create a simple property editor dialog
-        dialog = tk.Toplevel(self.root)
-        dialog.title(f"Edit {field.type.value} Field")
-        dialog.geometry("400x300")
-        dialog.transient(self.root)
-        dialog.grab_set()
-        
-        # Center the dialog
-        dialog.geometry("+%d+%d" % (self.root.winfo_rootx() + 50, self.root.winfo_rooty() + 50))
-        
-        # Field name
-        tk.Label(dialog, text="Field Name:", font=('Arial', 10, 'bold')).pack(anchor='w', padx=20, pady=(20, 5))
-        name_var = tk.StringVar(value=field.name)
-        name_entry = tk.Entry(dialog, textvariable=name_var, font=('Arial', 10))
-        name_entry.pack(fill='x', padx=20, pady=(0, 10))
-        
-        # Field type (readonly)
-        tk.Label(dialog, text="Field Type:", font=('Arial', 10, 'bold')).pack(anchor='w', padx=20, pady=(10, 5))
-        type_label = tk.Label(dialog, text=field.type.value.title(), font=('Arial', 10), fg=AppConstants.FIELD_COLORS[field.type])
-        type_label.pack(anchor='w', padx=20, pady=(0, 10))
-        
-        # Page number (readonly)
-        tk.Label(dialog, text="Page:", font=('Arial', 10, 'bold')).pack(anchor='w', padx=20, pady=(10, 5))
-        page_label = tk.Label(dialog, text=f"Page {field.page_num + 1}", font=('Arial', 10))
-        page_label.pack(anchor='w', padx=20, pady=(0, 10))
-        
-        # Type-specific options
-        format_frame = None
-        format_var = None
-        image_path_var = None
-        
-        if field.type == FieldType.DATE:
-            tk.Label(dialog, text="Date Format:", font=('Arial', 10, 'bold')).pack(anchor='w', padx=20, pady=(10, 5))
-            format_var = tk.StringVar(value=field.date_format or "MM/DD/YYYY")
-            
-            format_frame = tk.Frame(dialog)
-            format_frame.pack(fill='x', padx=20, pady=(0, 10))
-            
-            # Format dropdown
-            format_options = ["MM/DD/YYYY", "DD/MM/YYYY", "YYYY-MM-DD", "DD MMM YYYY", "MMM DD, YYYY"]
-            format_combo = tk.StringVar()
-            format_combo.set(format_var.get())
-            
-            format_entry = tk.Entry(format_frame, textvariable=format_combo, font=('Arial', 10))
-            format_entry.pack(fill='x')
-            
-            # Add some example formats as buttons
-            examples_frame = tk.Frame(dialog)
-            examples_frame.pack(fill='x', padx=20, pady=(5, 10))
-            
-            for fmt in format_options:
-                btn = tk.Button(examples_frame, text=fmt, 
-                              command=lambda f=fmt: format_combo.set(f),
-                              font=('Arial', 8), relief='flat', bg='#e0e0e0')
-                btn.pack(side='left', padx=(0, 5), pady=2)
-        
-        elif field.type == FieldType.IMAGE:
-            tk.Label(dialog, text="Image File:", font=('Arial', 10, 'bold')).pack(anchor='w', padx=20, pady=(10, 5))
-            
-            # Image path display and selection
-            image_frame = tk.Frame(dialog)
-            image_frame.pack(fill='x', padx=20, pady=(0, 10))
-            
-            image_path_var = tk.StringVar(value=getattr(field, 'image_path', '') or "No image selected")
-            image_path_entry = tk.Entry(image_frame, textvariable=image_path_var, font=('Arial', 10), state='readonly')
-            image_path_entry.pack(side='left', fill='x', expand=True, padx=(0, 5))
-            
-            def select_image():
-                from tkinter import filedialog
-                file_path = filedialog.askopenfilename(
-                    title="Select Image File",
-                    filetypes=[
-                        ("Image files", "*.png *.jpg *.jpeg *.gif *.bmp *.tiff"),
-                        ("PNG files", "*.png"),
-                        ("JPEG files", "*.jpg *.jpeg"),
-                        ("GIF files", "*.gif"),
-                        ("All files", "*.*")
-                    ]
-                )
-                if file_path:
-                    image_path_var.set(file_path)
-            
-            browse_btn = tk.Button(image_frame, text="Browse...", command=select_image, 
-                                 font=('Arial', 9), bg='#2196F3', fg='white')
-            browse_btn.pack(side='right')
-            
-            # Show current image info if available
-            if hasattr(field, 'image_path') and field.image_path:
-                import os
-                try:
-                    file_size = os.path.getsize(field.image_path)
-                    size_mb = file_size / (1024 * 1024)
-                    info_text = f"Current: {os.path.basename(field.image_path)} ({size_mb:.1f} MB)"
-                except:
-                    info_text = f"Current: {os.path.basename(field.image_path)}"
-                
-                info_label = tk.Label(dialog, text=info_text, font=('Arial', 8), fg='#666666')
-                info_label.pack(anchor='w', padx=20, pady=(0, 5))
-        
-        # Buttons
-        button_frame = tk.Frame(dialog)
-        button_frame.pack(fill='x', padx=20, pady=20)
-        
-        def save_changes():
-            # Update field name
-            new_name = name_var.get().strip()
-            if new_name and new_name != field.name:
-                field.name = new_name
-            
-            # Update date format for date fields
-            if field.type == FieldType.DATE and format_combo:
-                new_format = format_combo.get().strip()
-                if new_format:
-                    field.date_format = new_format
-            
-            # Update image path for image fields
-            if field.type == FieldType.IMAGE and image_path_var:
-                new_image_path = image_path_var.get().strip()
-                if new_image_path and new_image_path != "No image selected":
-                    field.image_path = new_image_path
-                    # Clear image_data when new path is set
-                    field.image_data = None
-            
-            # Refresh display
-            self.field_manager.redraw_fields_for_page(self.pdf_handler.current_page)
-            self._update_sidebar()
-            
-            dialog.destroy()
-            self.status_bar.set_status(f"Updated {field.type.value} field '{field.name}'")
-        
-        def cancel_changes():
-            dialog.destroy()
-        
-        tk.Button(button_frame, text="Save", command=save_changes, bg='#4CAF50', fg='white', font=('Arial', 10)).pack(side='right', padx=(5, 0))
-        tk.Button(button_frame, text="Cancel", command=cancel_changes, bg='#f44336', fg='white', font=('Arial', 10)).pack(side='right')
-        
-        # Focus on name entry
-        name_entry.focus_set()
-        name_entry.select_range(0, 'end')
+        # The dialog is built on first use and reused afterwards
+        if self._edit_dialog is None:
+            self._edit_dialog = FieldPropertiesDialog(self.root, on_save=self._on_field_properties_saved,
+                                                      on_rename=self.field_manager.rename_field)
+        self._edit_dialog.show(field)
+    
+    def _on_field_properties_saved(self, field):
+        """Refresh the views after the properties dialog updated a field"""
+        self.field_manager.draw_field(field)
+        self._schedule_refresh()
+        self.status_bar.set_status(f"Updated {field.type.value} field '{field.name}'")
     
     def _duplicate_field(self, field):
-        """Duplicate a field"""
-        # Create a copy of the field with slight offset
-        offset = 20  # PDF units
-        
-        # Get current field's PDF coordinates
-        pdf_rect = field.rect.copy()
-        new_rect = [pdf_rect[0] + offset, pdf_rect[1] + offset, pdf_rect[2] + offset, pdf_rect[3] + offset]
-        
-        # Create new field
-        new_field = self.field_manager.create_field(
-            field.type, 
-            0, 0,  # These will be overridden
-            field.page_num
-        )
-        
-        # Set the new position
-        new_field.rect = new_rect
+        """Duplicate a field as one undoable action"""
+        return self._duplicate_fields([field])[0]
+    
+    def _duplicate_fields(self, fields):
+        """
+        Duplicate several fields as one undoable action
         
-        # Copy properties
-        if hasattr(field, 'options') and field.options:
-            new_field.options = field.options.copy()
-        if hasattr(field, 'group') and field.group:
-            new_field.group = field.group
-        if hasattr(field, 'value') and field.value:
-            new_field.value = field.value
+        The copies are drawn by one idle redraw pass and the sidebar is
+        rebuilt once, however many fields are duplicated.
         
-        # Redraw and update
-        self.field_manager.redraw_fields_for_page(self.pdf_handler.current_page)
-        self._update_sidebar()
-        self.status_bar.set_status(f"Duplicated {field.type.value} field")
+        Args:
+            fields: Fields to duplicate
+            
+        Returns:
+            The new fields, in the same order
+        """
+        new_fields = [self.field_manager.duplicate(field) for field in fields]
+        
+        # Create history commands for the copies (already added)
+        commands = []
+        for new_field in new_fields:
+            create_command = CreateFieldCommand(self.field_manager, new_field)
+            create_command.was_executed = True
+            commands.append(create_command)
+        if len(commands) == 1:
+            self.history_manager.add_command(commands[0])
+            self.status_bar.set_status(f"Duplicated {fields[0].type.value} field")
+        elif commands:
+            self.history_manager.add_command(BatchCommand(commands, f"Duplicate {len(commands)} fields"))
+            self.status_bar.set_status(f"Duplicated {len(commands)} fields")
+        
+        self._schedule_refresh()
+        return new_fields
     
     def _update_sidebar(self):
         """Update the sidebar with current fields"""
         if hasattr(self, 'sidebar'):
             self.sidebar.update_fields(self.field_manager.fields)
     
+    def _schedule_refresh(self):
+        """
+        Update the sidebar once the UI is idle
+        
+        Bursts of edits, such as a held Ctrl+D or Ctrl+Z, then rebuild the
+        sidebar once rather than once per edit. Canvas items need no refresh
+        here: edits redraw just the fields they touch.
+        """
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.root.after_idle(self._flush_refresh)
+    
+    def _flush_refresh(self):
+        """Run the refresh queued by _schedule_refresh"""
+        self._refresh_pending = False
+        self._update_sidebar()
+    
     def on_closing(self):
         """Handle application closing"""
         self.pdf_handler.close_pdf()
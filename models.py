@@ -3,10 +3,14 @@
 Data models and constants for PDF Form Maker
 """
 
-from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
+import sys
+from dataclasses import dataclass, field as dataclass_field
+from typing import List, Optional, Dict, Any, Final
 from enum import Enum
 
+# dataclass(slots=True) needs Python 3.10; older versions get regular dataclasses
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
 class FieldType(Enum):
     """Enumeration of supported form field types"""
@@ -17,9 +21,19 @@ class FieldType(Enum):
     IMAGE = "image"
 
 
-@dataclass
+# Value -> member lookup for deserialization; FieldType(value) goes through the
+# much slower Enum constructor
+_FIELD_TYPES_BY_VALUE = {field_type.value: field_type for field_type in FieldType}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class FormField:
-    """Represents a form field with its properties"""
+    """
+    Represents a form field with its properties
+    
+    Slotted: attributes live in fixed slots rather than a per-instance dict,
+    so every attribute the app sets on a field must be declared here.
+    """
     name: str
     type: FieldType
     page_num: int
@@ -32,19 +46,52 @@ class FormField:
     image_path: Optional[str] = None  # For image fields - path to image file
     image_data: Optional[bytes] = None  # For image fields - binary image data
     
+    # Bookkeeping set by the app after creation (not part of field equality)
+    pdf_rect: Optional[List[float]] = dataclass_field(default=None, compare=False, repr=False)
+    options: Optional[List[str]] = dataclass_field(default=None, compare=False, repr=False)
+    group: Optional[str] = dataclass_field(default=None, compare=False, repr=False)
+    # Outline color for the field's type, resolved once instead of on every draw
+    color: str = dataclass_field(default='', init=False, compare=False, repr=False)
+    
+    def __post_init__(self):
+        self.color = AppConstants.FIELD_COLORS[self.type]
+    
+    def clone(self, new_name: Optional[str] = None) -> 'FormField':
+        """
+        Create an independent copy of the field that is not on the canvas yet
+        
+        Only the list attributes need copying; every other attribute is
+        immutable, so this is much cheaper than copy.deepcopy.
+        
+        Args:
+            new_name: Name for the copy (defaults to the same name)
+            
+        Returns:
+            The new FormField, with no canvas_id
+        """
+        return FormField(
+            self.name if new_name is None else new_name, self.type, self.page_num,
+            list(self.rect), None, self.date_format, self.value, self.image_path, self.image_data,
+            pdf_rect=None if self.pdf_rect is None else list(self.pdf_rect),
+            options=None if self.options is None else list(self.options),
+            group=self.group
+        )
+    
     def to_dict(self) -> Dict[str, Any]:
-        """Convert field to dictionary for serialization"""
+        """Convert field to dictionary for serialization (unset optional properties are left out)"""
         data = {
             'name': self.name,
             'type': self.type.value,
             'page_num': self.page_num,
-            'rect': self.rect,
-            'date_format': self.date_format,
-            'value': self.value
+            'rect': self.rect
         }
+        for key in ('date_format', 'value', 'options', 'group'):
+            value = getattr(self, key)
+            if value is not None:
+                data[key] = value
         
         # Handle image fields - store path but not binary data for JSON serialization
-        if self.type == FieldType.IMAGE:
+        if self.type == FieldType.IMAGE and self.image_path is not None:
             data['image_path'] = self.image_path
             # Note: image_data (bytes) is not serialized to avoid JSON issues
         
@@ -55,11 +102,13 @@ class FormField:
         """Create field from dictionary"""
         field = cls(
             name=data['name'],
-            type=FieldType(data['type']),
+            type=_FIELD_TYPES_BY_VALUE.get(data['type']) or FieldType(data['type']),
             page_num=data['page_num'],
             rect=data['rect'],
             date_format=data.get('date_format'),
-            value=data.get('value')
+            value=data.get('value'),
+            options=data.get('options'),
+            group=data.get('group')
         )
         
         # Handle image fields
@@ -70,6 +119,14 @@ class FormField:
         return field
 
 
+# Zoom limits as module globals: ZoomState reads them on every zoom step,
+# and a global load is cheaper than a class attribute lookup
+_MIN_ZOOM: Final = 0.25
+_MAX_ZOOM: Final = 5.0
+_DEFAULT_ZOOM: Final = 1.0
+_ZOOM_STEP: Final = 0.25
+
+
 class AppConstants:
     """Application constants and configuration"""
     
@@ -81,14 +138,17 @@ class AppConstants:
     NAV_BAR_HEIGHT = 50
     
     # Zoom settings
-    MIN_ZOOM = 0.25  # 25% minimum zoom
-    MAX_ZOOM = 5.0   # 500% maximum zoom
-    DEFAULT_ZOOM = 1.0  # 100% default zoom
-    ZOOM_STEP = 0.25    # 25% zoom increment
+    MIN_ZOOM = _MIN_ZOOM  # 25% minimum zoom
+    MAX_ZOOM = _MAX_ZOOM   # 500% maximum zoom
+    DEFAULT_ZOOM = _DEFAULT_ZOOM  # 100% default zoom
+    ZOOM_STEP = _ZOOM_STEP    # 25% zoom increment
     ZOOM_WHEEL_FACTOR = 0.1  # Mouse wheel zoom sensitivity
+    ZOOM_REDRAW_DELAY_MS = 16  # Zoom steps within one frame share a single redraw
     
     # PDF rendering settings
     PDF_DPI = 150  # DPI for PDF rendering quality
+    PAGE_CACHE_MB = 256  # Memory budget for cached rendered pages
+    PREFETCH_DELAY_MS = 150  # Idle time before rendering neighbouring pages ahead
     
     # Field defaults
     DEFAULT_FIELD_SIZES = {
@@ -115,8 +175,11 @@ class AppConstants:
     # File filters
     PDF_FILE_TYPES = [("PDF files", "*.pdf"), ("All files", "*.*")]
     
+    # Cursor updates: small mouse moves within this many seconds skip hit testing
+    MOTION_THROTTLE_S = 0.033
+    
     # Resize handles
-    RESIZE_HANDLES = ['nw', 'ne', 'sw', 'se', 'n', 's', 'w', 'e']
+    RESIZE_HANDLES = ('nw', 'ne', 'sw', 'se', 'n', 's', 'w', 'e')
     
     # Resize cursors
     RESIZE_CURSORS = {
@@ -130,6 +193,10 @@ class AppConstants:
 class MouseState:
     """Tracks mouse interaction state"""
     
+    # Read on every motion event, so keep the attributes in fixed slots
+    __slots__ = ("dragging", "resizing", "panning", "resize_handle",
+                 "drag_start_x", "drag_start_y", "pan_start_x", "pan_start_y")
+    
     def __init__(self):
         self.dragging = False
         self.resizing = False
@@ -174,17 +241,26 @@ class MouseState:
 class ZoomState:
     """Manages zoom and view state"""
     
+    # Updated on every zoom step, so keep the attributes in fixed slots
+    __slots__ = ("zoom_level", "fit_to_window", "center_x", "center_y")
+    
     def __init__(self):
-        self.zoom_level = AppConstants.DEFAULT_ZOOM
+        self.zoom_level = _DEFAULT_ZOOM
         self.fit_to_window = True  # Whether to fit PDF to window initially
         self.center_x = 0  # Center point for zooming
         self.center_y = 0
     
     def set_zoom(self, new_zoom, center_x=None, center_y=None):
         """Set zoom level with optional center point"""
-        # Clamp zoom to valid range
-        self.zoom_level = max(AppConstants.MIN_ZOOM, 
-                             min(AppConstants.MAX_ZOOM, new_zoom))
+        # Clamp zoom to valid range (comparisons instead of min/max calls)
+        if new_zoom < _MIN_ZOOM:
+            new_zoom = _MIN_ZOOM
+        elif new_zoom > _MAX_ZOOM:
+            new_zoom = _MAX_ZOOM
+        if new_zoom == self.zoom_level and not self.fit_to_window:
+            # Nothing changes (e.g. wheeling on past a zoom limit)
+            return new_zoom
+        self.zoom_level = new_zoom
         
         if center_x is not None:
             self.center_x = center_x
@@ -196,17 +272,17 @@ class ZoomState:
     
     def zoom_in(self, center_x=None, center_y=None):
         """Zoom in by one step"""
-        new_zoom = self.zoom_level + AppConstants.ZOOM_STEP
+        new_zoom = self.zoom_level + _ZOOM_STEP
         return self.set_zoom(new_zoom, center_x, center_y)
     
     def zoom_out(self, center_x=None, center_y=None):
         """Zoom out by one step"""
-        new_zoom = self.zoom_level - AppConstants.ZOOM_STEP
+        new_zoom = self.zoom_level - _ZOOM_STEP
         return self.set_zoom(new_zoom, center_x, center_y)
     
     def reset_zoom(self):
         """Reset to default zoom and fit to window"""
-        self.zoom_level = AppConstants.DEFAULT_ZOOM
+        self.zoom_level = _DEFAULT_ZOOM
         self.fit_to_window = True
     
     def get_zoom_percentage(self):
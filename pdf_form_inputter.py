@@ -8,13 +8,15 @@ Supports all field types: TEXT, CHECKBOX, SIGNATURE, IMAGE, DATE, etc.
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-import fitz  # PyMuPDF
 import os
 from typing import List, Dict, Any, Optional
 from models import FieldType
+from pdf_handler import lazy_import
 from PIL import Image, ImageTk
 import io
 
+fitz = lazy_import("fitz")  # PyMuPDF, loaded when the first form is opened
+
 
 class PDFFormInputter:
     """Custom PDF form input dialog that allows users to fill out PDF forms"""
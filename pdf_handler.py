@@ -5,14 +5,105 @@ PDF Handler for PDF Form Maker
 Handles PDF loading, display, and saving operations.
 """
 
-import fitz  # PyMuPDF
+# fitz annotations below must not be evaluated at import time (see lazy_import)
+from __future__ import annotations
+
+import importlib.util
+import logging
+import sys
+from collections import OrderedDict
 from PIL import Image, ImageTk
 import io
 import tkinter as tk
-from typing import Optional, List, Tuple
+from typing import Any, Hashable, Optional, List, Tuple
 from models import FormField, FieldType, AppConstants, ZoomState
 from coordinate_utils import CoordinateTransformer, calculate_display_scale
 
+logger = logging.getLogger(__name__)
+
+
+def lazy_import(name: str):
+    """
+    Import a module that is only loaded on first attribute access
+    
+    Used for PyMuPDF, whose import takes ~100ms, so the window can appear
+    before a PDF is opened.
+    
+    Args:
+        name: Module name
+        
+    Returns:
+        The (possibly not yet executed) module
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        # Not installed: raise the usual ImportError right away
+        return importlib.import_module(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+fitz = lazy_import("fitz")  # PyMuPDF
+
+
+class PageImageCache:
+    """Least-recently-used cache of rendered page images with a memory budget"""
+    
+    def __init__(self, max_memory_mb: float = AppConstants.PAGE_CACHE_MB):
+        """
+        Initialize the cache
+        
+        Args:
+            max_memory_mb: Approximate memory the cached images may use; the least
+                           recently used ones are dropped beyond it
+        """
+        self.max_bytes = int(max_memory_mb * 1024 * 1024)
+        self.total_bytes = 0
+        self._images: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+    
+    def __len__(self) -> int:
+        return len(self._images)
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._images
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a cached image (marking it recently used), or None"""
+        entry = self._images.get(key)
+        if entry is None:
+            return None
+        self._images.move_to_end(key)
+        return entry[0]
+    
+    def put(self, key: Hashable, image: Any, nbytes: int) -> None:
+        """
+        Add an image, evicting the least recently used ones over the budget
+        
+        Args:
+            key: Cache key
+            image: The rendered image
+            nbytes: Approximate memory used by the image
+        """
+        old = self._images.pop(key, None)
+        if old is not None:
+            self.total_bytes -= old[1]
+        self._images[key] = (image, nbytes)
+        self.total_bytes += nbytes
+        # Always keep the newest image, even if it alone exceeds the budget
+        while self.total_bytes > self.max_bytes and len(self._images) > 1:
+            self.total_bytes -= self._images.popitem(last=False)[1][1]
+    
+    def clear(self) -> None:
+        """Drop every cached image"""
+        self._images.clear()
+        self.total_bytes = 0
+
 
 class PDFHandler:
     """Handles PDF operations - loading, display, and saving"""
@@ -32,7 +123,10 @@ class PDFHandler:
         self.canvas_image = None
         self.coord_transformer: Optional[CoordinateTransformer] = None
         self.zoom_state = ZoomState()  # Add zoom state management
-        self.page_images = {}  # Cache for rendered page images
+        self.page_images = PageImageCache()  # Rendered page images by (page, scale)
+        # Neighbouring pages still to be rendered ahead, and the pending after() job
+        self._prefetch_pages: List[int] = []
+        self._prefetch_job = None
     
     def load_pdf(self, file_path: str) -> bool:
         """
@@ -55,6 +149,7 @@ class PDFHandler:
             self.current_page = 0
             
             # Clear page image cache and reset zoom
+            self._cancel_prefetch()
             self.page_images.clear()
             self.zoom_state.reset_zoom()
             
@@ -327,65 +422,27 @@ class PDFHandler:
             page_rect = page.rect
             
             # Calculate scale considering zoom
-            canvas_width = self.canvas.winfo_width()
-            canvas_height = self.canvas.winfo_height()
-            
-            if canvas_width <= 1 or canvas_height <= 1:
-                # Canvas not yet properly sized, use default
-                canvas_width = 800
-                canvas_height = 600
-            
+            self.pdf_scale = self._scale_for_page(page_rect)
             if self.zoom_state.fit_to_window:
-                # Auto-fit to window
-                base_scale = calculate_display_scale(
-                    (canvas_width, canvas_height),
-                    (page_rect.width, page_rect.height)
-                )
-                self.zoom_state.zoom_level = base_scale  # Update zoom state to match auto-fit
-                self.pdf_scale = base_scale
-            else:
-                # Use current zoom level
-                self.pdf_scale = self.zoom_state.zoom_level
+                self.zoom_state.zoom_level = self.pdf_scale  # Update zoom state to match auto-fit
             
-            print(f"Display scaling: canvas={canvas_width}x{canvas_height}, "
-                  f"PDF={page_rect.width}x{page_rect.height}, scale={self.pdf_scale:.3f}, "
-                  f"zoom={self.zoom_state.get_zoom_percentage()}")
+            logger.debug("Display scaling: PDF=%sx%s, scale=%.3f, zoom=%s", page_rect.width,
+                         page_rect.height, self.pdf_scale, self.zoom_state.get_zoom_percentage())
             
-            # Create cache key including zoom level
-            cache_key = f"{self.current_page}_{self.pdf_scale:.3f}"
-            
-            # Check if we have this image cached
-            if cache_key not in self.page_images:
-                # Create coordinate transformer
+            # Create coordinate transformer (kept while the scale is unchanged,
+            # e.g. when paging at a fixed zoom or redisplaying after an undo)
+            if self.coord_transformer is None or self.coord_transformer.pdf_scale != self.pdf_scale:
                 self.coord_transformer = CoordinateTransformer(
                     self.pdf_scale, 
                     AppConstants.CANVAS_OFFSET
                 )
-                
-                # Render page to pixmap at higher resolution for better quality
-                matrix = fitz.Matrix(self.pdf_scale * AppConstants.PDF_DPI / 72, 
-                                   self.pdf_scale * AppConstants.PDF_DPI / 72)
-                pixmap = page.get_pixmap(matrix=matrix)
-                
-                # Convert to PIL Image then to PhotoImage
-                img_data = pixmap.tobytes("ppm")
-                pil_image = Image.open(io.BytesIO(img_data))
-                
-                # Resize if needed for display
-                display_width = int(page_rect.width * self.pdf_scale)
-                display_height = int(page_rect.height * self.pdf_scale)
-                if pil_image.size != (display_width, display_height):
-                    pil_image = pil_image.resize((display_width, display_height), Image.Resampling.LANCZOS)
-                
-                canvas_image = ImageTk.PhotoImage(pil_image)
-                self.page_images[cache_key] = canvas_image
-            else:
-                canvas_image = self.page_images[cache_key]
             
-            self.canvas_image = canvas_image
+            # Use the cached (possibly prefetched) image for this page and zoom
+            self.canvas_image = self._cached_page_image(page, self.current_page, self.pdf_scale)
             
-            # Clear canvas and display image
-            self.canvas.delete("all")
+            # Replace the page image, keeping field items (FieldManager hides
+            # the ones of other pages) and drawing the page beneath them
+            self.canvas.delete("pdf_page")
             self.canvas.create_image(
                 AppConstants.CANVAS_OFFSET, 
                 AppConstants.CANVAS_OFFSET,
@@ -393,18 +450,120 @@ class PDFHandler:
                 image=self.canvas_image,
                 tags="pdf_page"
             )
+            self.canvas.tag_lower("pdf_page")
             
             # Update canvas scroll region
             scroll_width = int(page_rect.width * self.pdf_scale) + AppConstants.CANVAS_OFFSET * 2
             scroll_height = int(page_rect.height * self.pdf_scale) + AppConstants.CANVAS_OFFSET * 2
             self.canvas.configure(scrollregion=(0, 0, scroll_width, scroll_height))
             
+            self._schedule_prefetch()
             return True
             
         except Exception as e:
             print(f"Failed to display page: {e}")
             return False
     
+    def _scale_for_page(self, page_rect) -> float:
+        """
+        Get the display scale of a page for the current zoom settings
+        
+        Args:
+            page_rect: The page's rect in PDF points
+            
+        Returns:
+            Fit-to-window scale for the page, or the current zoom level
+        """
+        if not self.zoom_state.fit_to_window:
+            # Use current zoom level
+            return self.zoom_state.zoom_level
+        
+        canvas_width = self.canvas.winfo_width()
+        canvas_height = self.canvas.winfo_height()
+        if canvas_width <= 1 or canvas_height <= 1:
+            # Canvas not yet properly sized, use default
+            canvas_width = 800
+            canvas_height = 600
+        
+        # Auto-fit to window
+        return calculate_display_scale(
+            (canvas_width, canvas_height),
+            (page_rect.width, page_rect.height)
+        )
+    
+    def _cached_page_image(self, page, page_num: int, scale: float):
+        """
+        Get a page rendered at a scale, rendering and caching it on a miss
+        
+        Args:
+            page: The PyMuPDF page
+            page_num: Its page number (part of the cache key)
+            scale: Display scale
+            
+        Returns:
+            PhotoImage of the page
+        """
+        cache_key = (page_num, round(scale, 3))
+        canvas_image = self.page_images.get(cache_key)
+        if canvas_image is not None:
+            return canvas_image
+        
+        # Render page to pixmap at higher resolution for better quality
+        matrix = fitz.Matrix(scale * AppConstants.PDF_DPI / 72, 
+                             scale * AppConstants.PDF_DPI / 72)
+        pixmap = page.get_pixmap(matrix=matrix)
+        
+        # Convert to PIL Image then to PhotoImage
+        img_data = pixmap.tobytes("ppm")
+        pil_image = Image.open(io.BytesIO(img_data))
+        
+        # Resize if needed for display
+        display_width = int(page.rect.width * scale)
+        display_height = int(page.rect.height * scale)
+        if pil_image.size != (display_width, display_height):
+            pil_image = pil_image.resize((display_width, display_height), Image.Resampling.LANCZOS)
+        
+        canvas_image = ImageTk.PhotoImage(pil_image)
+        # Tk keeps 4 bytes per pixel
+        self.page_images.put(cache_key, canvas_image, display_width * display_height * 4)
+        return canvas_image
+    
+    def _schedule_prefetch(self):
+        """Render the neighbouring pages once the user pauses, so paging to them is instant"""
+        self._cancel_prefetch()
+        self._prefetch_pages = [page_num for page_num in (self.current_page + 1, self.current_page - 1)
+                                if 0 <= page_num < self.total_pages]
+        if self._prefetch_pages:
+            self._prefetch_job = self.canvas.after(AppConstants.PREFETCH_DELAY_MS, self._prefetch_next)
+    
+    def _cancel_prefetch(self):
+        """Drop prefetches queued for the page being left"""
+        self._prefetch_pages = []
+        if self._prefetch_job is not None:
+            try:
+                self.canvas.after_cancel(self._prefetch_job)
+            except tk.TclError:
+                pass
+            self._prefetch_job = None
+    
+    def _prefetch_next(self):
+        """Render one queued neighbouring page into the cache, then queue the next"""
+        self._prefetch_job = None
+        if not self.pdf_doc or not self._prefetch_pages:
+            return
+        
+        page_num = self._prefetch_pages.pop(0)
+        try:
+            page = self.pdf_doc[page_num]
+            self._cached_page_image(page, page_num, self._scale_for_page(page.rect))
+        except Exception as e:
+            # Best effort: display_page renders the page (and reports errors) when it is shown
+            logger.debug("Failed to prefetch page %d: %s", page_num + 1, e)
+        
+        # One page per callback keeps the UI responsive between renders
+        if self._prefetch_pages:
+            self._prefetch_job = self.canvas.after(AppConstants.PREFETCH_DELAY_MS, self._prefetch_next)
+    
     def save_pdf_with_fields(self, file_path: str, fields: List[FormField]) -> bool:
         """
         Save the PDF with form fields
@@ -531,7 +690,7 @@ class PDFHandler:
             widget.field_name = f"date_{field.name}"
             
             # Add comprehensive JavaScript for date validation and formatting
-            date_format = getattr(field, 'date_format', 'MM/DD/YYYY')
+            date_format = field.date_format or 'MM/DD/YYYY'
             widget.script_change = self._generate_date_validation_script(date_format)
             widget.script_format = self._generate_date_format_script(date_format)
             widget.script_focus = self._generate_date_focus_script(date_format)
@@ -561,7 +720,7 @@ class PDFHandler:
             widget.text_color = (0.4, 0.4, 0.4)  # Gray text
             
             # Set instructions based on whether image is pre-loaded
-            if hasattr(field, 'image_path') and field.image_path:
+            if field.image_path:
                 try:
                     # Embed the actual image as static content
                     self._embed_image_from_path(page, rect, field.image_path)
@@ -577,7 +736,7 @@ class PDFHandler:
                     print(f"Warning: Could not embed image '{field.image_path}': {e}")
                     widget.field_value = "📷 [Image load failed]"
             
-            elif hasattr(field, 'image_data') and field.image_data:
+            elif field.image_data:
                 try:
                     # Embed image data as static content
                     self._embed_image_in_rect(page, rect, field.image_data)
@@ -620,6 +779,7 @@ class PDFHandler:
     
     def close_pdf(self):
         """Close the current PDF document"""
+        self._cancel_prefetch()
         if self.pdf_doc:
             self.pdf_doc.close()
             self.pdf_doc = None
@@ -652,13 +812,15 @@ class PDFHandler:
         return False
     
     # Zoom control methods
-    def zoom_in(self, center_x=None, center_y=None) -> bool:
+    def zoom_in(self, center_x=None, center_y=None, display: bool = True) -> bool:
         """
         Zoom in by one step
         
         Args:
             center_x: X coordinate to zoom around (optional)
             center_y: Y coordinate to zoom around (optional)
+            display: Re-render the page now; pass False when the caller
+                     calls display_page itself (e.g. once for several steps)
             
         Returns:
             True if zoom changed, False if at maximum zoom
@@ -667,17 +829,20 @@ class PDFHandler:
         self.zoom_state.zoom_in(center_x, center_y)
         
         if self.zoom_state.zoom_level != old_zoom:
-            self.display_page()  # Refresh display with new zoom
+            if display:
+                self.display_page()  # Refresh display with new zoom
             return True
         return False
     
-    def zoom_out(self, center_x=None, center_y=None) -> bool:
+    def zoom_out(self, center_x=None, center_y=None, display: bool = True) -> bool:
         """
         Zoom out by one step
         
         Args:
             center_x: X coordinate to zoom around (optional)
             center_y: Y coordinate to zoom around (optional)
+            display: Re-render the page now; pass False when the caller
+                     calls display_page itself (e.g. once for several steps)
             
         Returns:
             True if zoom changed, False if at minimum zoom
@@ -686,11 +851,12 @@ class PDFHandler:
         self.zoom_state.zoom_out(center_x, center_y)
         
         if self.zoom_state.zoom_level != old_zoom:
-            self.display_page()  # Refresh display with new zoom
+            if display:
+                self.display_page()  # Refresh display with new zoom
             return True
         return False
     
-    def set_zoom(self, zoom_level: float, center_x=None, center_y=None) -> bool:
+    def set_zoom(self, zoom_level: float, center_x=None, center_y=None, display: bool = True) -> bool:
         """
         Set specific zoom level
         
@@ -698,6 +864,7 @@ class PDFHandler:
             zoom_level: New zoom level
             center_x: X coordinate to zoom around (optional)
             center_y: Y coordinate to zoom around (optional)
+            display: Re-render the page now (see zoom_in)
             
         Returns:
             True if zoom changed, False otherwise
@@ -706,7 +873,8 @@ class PDFHandler:
         self.zoom_state.set_zoom(zoom_level, center_x, center_y)
         
         if self.zoom_state.zoom_level != old_zoom:
-            self.display_page()  # Refresh display with new zoom
+            if display:
+                self.display_page()  # Refresh display with new zoom
             return True
         return False
     
@@ -729,12 +897,13 @@ class PDFHandler:
         """Get current zoom level as percentage string"""
         return self.zoom_state.get_zoom_percentage()
     
-    def handle_mouse_wheel_zoom(self, event) -> bool:
+    def handle_mouse_wheel_zoom(self, event, display: bool = True) -> bool:
         """
         Handle mouse wheel zoom
         
         Args:
             event: Mouse wheel event
+            display: Re-render the page now (see zoom_in)
             
         Returns:
             True if zoom changed, False otherwise
@@ -750,7 +919,7 @@ class PDFHandler:
         else:  # Zoom out
             new_zoom = self.zoom_state.zoom_level - zoom_factor
         
-        return self.set_zoom(new_zoom, canvas_x, canvas_y)
+        return self.set_zoom(new_zoom, canvas_x, canvas_y, display)
     
     def _generate_date_validation_script(self, date_format):
         """Generate JavaScript for date field validation"""
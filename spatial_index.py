@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Spatial index for PDF Form Maker
+
+Buckets rectangles into a uniform grid so point and area queries only look at
+the few rectangles near the query instead of every field on the page.
+"""
+
+import math
+from typing import Any, Dict, Hashable, List, Tuple
+
+
+class GridIndex:
+    """Uniform grid of rectangle buckets supporting point and area queries"""
+
+    # Rectangles spanning more cells than this are kept in a separate list
+    MAX_CELLS = 4096
+
+    def __init__(self, cell_size: float = 64.0, padding: float = 1.0):
+        """
+        Initialize the grid index
+
+        Args:
+            cell_size: Width/height of one grid cell (same units as the rectangles)
+            padding: Margin added around each rectangle so queries on an edge
+                     never miss it because of floating point rounding
+        """
+        self.cell_size = float(cell_size)
+        self.padding = float(padding)
+        self._cells: Dict[Tuple[int, int], Dict[Hashable, Any]] = {}
+        self._large: Dict[Hashable, Any] = {}
+        # key -> (rect, cell range or None for large entries, object)
+        self._entries: Dict[Hashable, Tuple[Tuple[float, ...], Any, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def _cell_range(self, rect):
+        """Return (cx1, cy1, cx2, cy2) cell bounds for a rectangle, or None if too large"""
+        x1, y1, x2, y2 = rect
+        size = self.cell_size
+        pad = self.padding
+        try:
+            cx1 = math.floor((min(x1, x2) - pad) / size)
+            cy1 = math.floor((min(y1, y2) - pad) / size)
+            cx2 = math.floor((max(x1, x2) + pad) / size)
+            cy2 = math.floor((max(y1, y2) + pad) / size)
+        except (OverflowError, ValueError):
+            return None
+        if (cx2 - cx1 + 1) * (cy2 - cy1 + 1) > self.MAX_CELLS:
+            return None
+        return cx1, cy1, cx2, cy2
+
+    def insert(self, key: Hashable, obj: Any, rect) -> None:
+        """
+        Add (or replace) a rectangle
+
+        Args:
+            key: Unique key for the entry
+            obj: Object returned by queries
+            rect: [x1, y1, x2, y2] bounds of the object
+        """
+        if key in self._entries:
+            self.remove(key)
+
+        rect = tuple(rect)
+        cells = self._cell_range(rect)
+        if cells is None:
+            self._large[key] = obj
+        else:
+            cx1, cy1, cx2, cy2 = cells
+            for cx in range(cx1, cx2 + 1):
+                for cy in range(cy1, cy2 + 1):
+                    self._cells.setdefault((cx, cy), {})[key] = obj
+        self._entries[key] = (rect, cells, obj)
+
+    def update(self, key: Hashable, obj: Any, rect) -> bool:
+        """
+        Re-bucket an entry if its rectangle changed
+
+        Returns:
+            True if the entry was (re)inserted, False if it was already current
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == tuple(rect):
+            return False
+        self.insert(key, obj, rect)
+        return True
+
+    def remove(self, key: Hashable) -> bool:
+        """
+        Remove an entry
+
+        Returns:
+            True if the entry existed, False otherwise
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+
+        cells = entry[1]
+        if cells is None:
+            del self._large[key]
+            return True
+
+        cx1, cy1, cx2, cy2 = cells
+        for cx in range(cx1, cx2 + 1):
+            for cy in range(cy1, cy2 + 1):
+                bucket = self._cells.get((cx, cy))
+                if bucket is not None:
+                    bucket.pop(key, None)
+                    if not bucket:
+                        del self._cells[(cx, cy)]
+        return True
+
+    def clear(self) -> None:
+        """Remove every entry"""
+        self._cells.clear()
+        self._large.clear()
+        self._entries.clear()
+
+    def query_point(self, x: float, y: float) -> List[Any]:
+        """
+        Get candidate objects whose (padded) cells contain a point
+
+        Candidates are not checked against their exact rectangles; callers
+        must do the final containment test.
+        """
+        bucket = self._cells.get((math.floor(x / self.cell_size), math.floor(y / self.cell_size)))
+        if bucket is None:
+            return list(self._large.values())
+        if not self._large:
+            return list(bucket.values())
+        return list(bucket.values()) + list(self._large.values())
+
+    def query_rect(self, x1: float, y1: float, x2: float, y2: float) -> List[Any]:
+        """
+        Get candidate objects whose (padded) cells overlap an area
+
+        Like query_point, the result is a superset of the true overlaps.
+        """
+        cells = self._cell_range((x1, y1, x2, y2))
+        if cells is None:
+            return [entry[2] for entry in self._entries.values()]
+
+        found: Dict[Hashable, Any] = dict(self._large)
+        cx1, cy1, cx2, cy2 = cells
+        for cx in range(cx1, cx2 + 1):
+            for cy in range(cy1, cy2 + 1):
+                bucket = self._cells.get((cx, cy))
+                if bucket:
+                    found.update(bucket)
+        return list(found.values())
+
+    def items(self):
+        """Iterate (key, object) pairs for every entry"""
+        for key, entry in self._entries.items():
+            yield key, entry[2]
@@ -7,184 +7,107 @@ import fitz
 import sys
 import os
 
+PAGE_TITLES = [
+    "Comprehensive Form Field Test",
+    "Page 2 - Additional Fields",
+]
+
+# Layout: labels start at FIRST_ROW_Y and are ROW_SPACING apart, plus a field's `gap`
+FIRST_ROW_Y = 100
+ROW_SPACING = 50
+
+TEXT = fitz.PDF_WIDGET_TYPE_TEXT
+CHECKBOX = fitz.PDF_WIDGET_TYPE_CHECKBOX
+SIGNATURE = fitz.PDF_WIDGET_TYPE_SIGNATURE
+COMBOBOX = fitz.PDF_WIDGET_TYPE_COMBOBOX
+
+# One entry per test field. `x` is the widget's horizontal extent and `dy` its
+# vertical extent relative to the label baseline; `gap` adds space before the next
+# row and any other keys go to _mk_widget.
+FIELD_SPECS = [
+    # 1. Text field
+    dict(page=0, label="Name:", type=TEXT, name="full_name", x=(150, 400)),
+    # 2. Email field (text)
+    dict(page=0, label="Email:", type=TEXT, name="email_address", x=(150, 400),
+         value="user@example.com"),
+    # 3. Birth Date field (text that should be detected as datetime)
+    dict(page=0, label="Birth Date:", type=TEXT, name="birth_date", x=(150, 300),
+         value="MM/DD/YYYY", fill=(0.95, 0.95, 1)),
+    # 4. Expiry Date field (text with ISO format hint)
+    dict(page=0, label="Expiry Date:", type=TEXT, name="expire_date_yyyy_mm_dd", x=(150, 300),
+         value="2025-12-31", fill=(0.95, 0.95, 1)),
+    # 5. Checkbox - Agree to Terms
+    dict(page=0, label="I agree to the terms and conditions", type=CHECKBOX, name="agree_terms",
+         x=(350, 370), dy=(-5, 15), value=False),
+    # 6. Newsletter Checkbox
+    dict(page=0, label="Subscribe to newsletter", type=CHECKBOX, name="newsletter_subscription",
+         x=(250, 270), dy=(-5, 15), value=True),
+    # 7. Signature field
+    dict(page=0, label="Signature:", type=SIGNATURE, name="digital_signature", x=(150, 400),
+         dy=(-5, 40), value=None, fill=(0.98, 0.98, 0.98), gap=20),
+    # 8. Combobox (will be mapped to datetime)
+    dict(page=0, label="Country:", type=COMBOBOX, name="country_selection", x=(150, 300),
+         value="USA", choice_values=["USA", "Canada", "UK", "Other"]),
+    # 9. Comments field (large text area)
+    dict(page=1, label="Comments:", type=TEXT, name="user_comments", x=(50, 500),
+         dy=(25, 125), value="Enter your comments here...", fontsize=10, gap=100),
+    # 10. European date format field
+    dict(page=1, label="European Date:", type=TEXT, name="european_date_dd_mm_yyyy", x=(150, 300),
+         value="25/12/2023", fill=(0.95, 0.95, 1)),
+]
+
+_WIDGET_TYPE_NAMES = {
+    TEXT: "TEXT",
+    CHECKBOX: "CHECKBOX",
+    SIGNATURE: "SIGNATURE",
+    COMBOBOX: "COMBOBOX",
+}
+
+_TEXT_LIKE_TYPES = (TEXT, COMBOBOX)
+
+def _mk_widget(field_type, name, rect, value="", fill=(1, 1, 1), border=(0, 0, 0), fontsize=11,
+               **extra):
+    """Build a configured fitz.Widget; `extra` holds any other widget attributes"""
+    widget = fitz.Widget()
+    widget.field_name = name
+    widget.field_type = field_type
+    widget.rect = rect
+    if value is not None:
+        widget.field_value = value
+    if field_type in _TEXT_LIKE_TYPES:
+        widget.text_font = "helv"
+        widget.text_fontsize = fontsize
+    widget.fill_color = fill
+    widget.border_color = border
+    widget.border_width = 1
+    for key, val in extra.items():
+        setattr(widget, key, val)
+    return widget
+
+def _add_fields(page, specs):
+    """Label and add the given FIELD_SPECS entries to a page, one row after another"""
+    y_pos = FIRST_ROW_Y
+    for spec in specs:
+        spec = dict(spec)
+        del spec["page"]
+        gap = spec.pop("gap", 0)
+        
+        page.insert_text((50, y_pos), spec.pop("label"), fontsize=12)
+        x1, x2 = spec.pop("x")
+        dy1, dy2 = spec.pop("dy", (-5, 20))
+        rect = fitz.Rect(x1, y_pos + dy1, x2, y_pos + dy2)
+        page.add_widget(_mk_widget(spec.pop("type"), spec.pop("name"), rect, **spec))
+        y_pos += ROW_SPACING + gap
+
 def create_comprehensive_test_pdf():
     """Create a comprehensive test PDF with various form field types"""
     try:
         # Create a new PDF document
         doc = fitz.open()
-        page = doc.new_page()
-        
-        # Add title
-        page.insert_text((50, 50), "Comprehensive Form Field Test", fontsize=16, color=(0, 0, 0))
-        
-        y_pos = 100
-        spacing = 50
-        
-        # 1. Text field
-        page.insert_text((50, y_pos), "Name:", fontsize=12)
-        text_rect = fitz.Rect(150, y_pos - 5, 400, y_pos + 20)
-        text_widget = fitz.Widget()
-        text_widget.field_name = "full_name"
-        text_widget.field_type = fitz.PDF_WIDGET_TYPE_TEXT
-        text_widget.rect = text_rect
-        text_widget.field_value = ""
-        text_widget.text_font = "helv"
-        text_widget.text_fontsize = 11
-        text_widget.fill_color = (1, 1, 1)
-        text_widget.border_color = (0, 0, 0)
-        text_widget.border_width = 1
-        page.add_widget(text_widget)
-        
-        y_pos += spacing
-        
-        # 2. Email field (text)
-        page.insert_text((50, y_pos), "Email:", fontsize=12)
-        email_rect = fitz.Rect(150, y_pos - 5, 400, y_pos + 20)
-        email_widget = fitz.Widget()
-        email_widget.field_name = "email_address"
-        email_widget.field_type = fitz.PDF_WIDGET_TYPE_TEXT
-        email_widget.rect = email_rect
-        email_widget.field_value = "user@example.com"
-        email_widget.text_font = "helv"
-        email_widget.text_fontsize = 11
-        email_widget.fill_color = (1, 1, 1)
-        email_widget.border_color = (0, 0, 0)
-        email_widget.border_width = 1
-        page.add_widget(email_widget)
-        
-        y_pos += spacing
-        
-        # 3. Birth Date field (text that should be detected as datetime)
-        page.insert_text((50, y_pos), "Birth Date:", fontsize=12)
-        date_rect = fitz.Rect(150, y_pos - 5, 300, y_pos + 20)
-        date_widget = fitz.Widget()
-        date_widget.field_name = "birth_date"
-        date_widget.field_type = fitz.PDF_WIDGET_TYPE_TEXT
-        date_widget.rect = date_rect
-        date_widget.field_value = "MM/DD/YYYY"
-        date_widget.text_font = "helv"
-        date_widget.text_fontsize = 11
-        date_widget.fill_color = (0.95, 0.95, 1)
-        date_widget.border_color = (0, 0, 0)
-        date_widget.border_width = 1
-        page.add_widget(date_widget)
-        
-        y_pos += spacing
-        
-        # 4. Expiry Date field (text with ISO format hint)
-        page.insert_text((50, y_pos), "Expiry Date:", fontsize=12)
-        expiry_rect = fitz.Rect(150, y_pos - 5, 300, y_pos + 20)
-        expiry_widget = fitz.Widget()
-        expiry_widget.field_name = "expire_date_yyyy_mm_dd"
-        expiry_widget.field_type = fitz.PDF_WIDGET_TYPE_TEXT
-        expiry_widget.rect = expiry_rect
-        expiry_widget.field_value = "2025-12-31"
-        expiry_widget.text_font = "helv"
-        expiry_widget.text_fontsize = 11
-        expiry_widget.fill_color = (0.95, 0.95, 1)
-        expiry_widget.border_color = (0, 0, 0)
-        expiry_widget.border_width = 1
-        page.add_widget(expiry_widget)
-        
-        y_pos += spacing
-        
-        # 5. Checkbox - Agree to Terms
-        page.insert_text((50, y_pos), "I agree to the terms and conditions", fontsize=12)
-        check_rect = fitz.Rect(350, y_pos - 5, 370, y_pos + 15)
-        check_widget = fitz.Widget()
-        check_widget.field_name = "agree_terms"
-        check_widget.field_type = fitz.PDF_WIDGET_TYPE_CHECKBOX
-        check_widget.rect = check_rect
-        check_widget.field_value = False
-        check_widget.fill_color = (1, 1, 1)
-        check_widget.border_color = (0, 0, 0)
-        check_widget.border_width = 1
-        page.add_widget(check_widget)
-        
-        y_pos += spacing
-        
-        # 6. Newsletter Checkbox
-        page.insert_text((50, y_pos), "Subscribe to newsletter", fontsize=12)
-        newsletter_rect = fitz.Rect(250, y_pos - 5, 270, y_pos + 15)
-        newsletter_widget = fitz.Widget()
-        newsletter_widget.field_name = "newsletter_subscription"
-        newsletter_widget.field_type = fitz.PDF_WIDGET_TYPE_CHECKBOX
-        newsletter_widget.rect = newsletter_rect
-        newsletter_widget.field_value = True
-        newsletter_widget.fill_color = (1, 1, 1)
-        newsletter_widget.border_color = (0, 0, 0)
-        newsletter_widget.border_width = 1
-        page.add_widget(newsletter_widget)
-        
-        y_pos += spacing
-        
-        # 7. Signature field
-        page.insert_text((50, y_pos), "Signature:", fontsize=12)
-        sig_rect = fitz.Rect(150, y_pos - 5, 400, y_pos + 40)
-        sig_widget = fitz.Widget()
-        sig_widget.field_name = "digital_signature"
-        sig_widget.field_type = fitz.PDF_WIDGET_TYPE_SIGNATURE
-        sig_widget.rect = sig_rect
-        sig_widget.fill_color = (0.98, 0.98, 0.98)
-        sig_widget.border_color = (0, 0, 0)
-        sig_widget.border_width = 1
-        page.add_widget(sig_widget)
-        
-        y_pos += spacing + 20
-        
-        # 8. Combobox (will be mapped to datetime)
-        page.insert_text((50, y_pos), "Country:", fontsize=12)
-        combo_rect = fitz.Rect(150, y_pos - 5, 300, y_pos + 20)
-        combo_widget = fitz.Widget()
-        combo_widget.field_name = "country_selection"
-        combo_widget.field_type = fitz.PDF_WIDGET_TYPE_COMBOBOX
-        combo_widget.rect = combo_rect
-        combo_widget.choice_values = ["USA", "Canada", "UK", "Other"]
-        combo_widget.field_value = "USA"
-        combo_widget.text_font = "helv"
-        combo_widget.text_fontsize = 11
-        combo_widget.fill_color = (1, 1, 1)
-        combo_widget.border_color = (0, 0, 0)
-        combo_widget.border_width = 1
-        page.add_widget(combo_widget)
-        
-        # Add a second page with additional fields
-        page2 = doc.new_page()
-        page2.insert_text((50, 50), "Page 2 - Additional Fields", fontsize=16, color=(0, 0, 0))
-        
-        y_pos = 100
-        
-        # 9. Comments field (large text area)
-        page2.insert_text((50, y_pos), "Comments:", fontsize=12)
-        comments_rect = fitz.Rect(50, y_pos + 25, 500, y_pos + 125)
-        comments_widget = fitz.Widget()
-        comments_widget.field_name = "user_comments"
-        comments_widget.field_type = fitz.PDF_WIDGET_TYPE_TEXT
-        comments_widget.rect = comments_rect
-        comments_widget.field_value = "Enter your comments here..."
-        comments_widget.text_font = "helv"
-        comments_widget.text_fontsize = 10
-        comments_widget.fill_color = (1, 1, 1)
-        comments_widget.border_color = (0, 0, 0)
-        comments_widget.border_width = 1
-        page2.add_widget(comments_widget)
-        
-        y_pos += 150
-        
-        # 10. European date format field
-        page2.insert_text((50, y_pos), "European Date:", fontsize=12)
-        eu_date_rect = fitz.Rect(150, y_pos - 5, 300, y_pos + 20)
-        eu_date_widget = fitz.Widget()
-        eu_date_widget.field_name = "european_date_dd_mm_yyyy"
-        eu_date_widget.field_type = fitz.PDF_WIDGET_TYPE_TEXT
-        eu_date_widget.rect = eu_date_rect
-        eu_date_widget.field_value = "25/12/2023"
-        eu_date_widget.text_font = "helv"
-        eu_date_widget.text_fontsize = 11
-        eu_date_widget.fill_color = (0.95, 0.95, 1)
-        eu_date_widget.border_color = (0, 0, 0)
-        eu_date_widget.border_width = 1
-        page2.add_widget(eu_date_widget)
+        for page_index, title in enumerate(PAGE_TITLES):
+            page = doc.new_page()
+            page.insert_text((50, 50), title, fontsize=16, color=(0, 0, 0))
+            _add_fields(page, [spec for spec in FIELD_SPECS if spec["page"] == page_index])
         
         # Save the document
         output_file = "comprehensive_test_form.pdf"
@@ -209,7 +132,8 @@ def verify_pdf_fields(pdf_file):
     """Verify the fields in the created PDF"""
     try:
         doc = fitz.open(pdf_file)
-        print(f"\n📊 Verifying fields in {pdf_file}:")
+        # Collect the report and write it once instead of printing per widget
+        out = [f"\n📊 Verifying fields in {pdf_file}:"]
         
         total_fields = 0
         for page_num in range(len(doc)):
@@ -217,22 +141,21 @@ def verify_pdf_fields(pdf_file):
             widgets = page.widgets()
             
             if widgets:
-                print(f"\nPage {page_num + 1}:")
+                out.append(f"\nPage {page_num + 1}:")
                 for widget in widgets:
                     total_fields += 1
-                    field_type_name = {
-                        fitz.PDF_WIDGET_TYPE_TEXT: "TEXT",
-                        fitz.PDF_WIDGET_TYPE_CHECKBOX: "CHECKBOX",
-                        fitz.PDF_WIDGET_TYPE_SIGNATURE: "SIGNATURE",
-                        fitz.PDF_WIDGET_TYPE_COMBOBOX: "COMBOBOX",
-                    }.get(widget.field_type, f"UNKNOWN({widget.field_type})")
+                    # Only format the UNKNOWN fallback on a miss
+                    field_type_name = _WIDGET_TYPE_NAMES.get(widget.field_type)
+                    if field_type_name is None:
+                        field_type_name = f"UNKNOWN({widget.field_type})"
                     
-                    print(f"  • {widget.field_name} ({field_type_name})")
+                    out.append(f"  • {widget.field_name} ({field_type_name})")
                     if widget.field_value:
-                        print(f"    Value: {widget.field_value}")
+                        out.append(f"    Value: {widget.field_value}")
         
         doc.close()
-        print(f"\n✅ Total fields verified: {total_fields}")
+        out.append(f"\n✅ Total fields verified: {total_fields}")
+        sys.stdout.write("\n".join(out) + "\n")
         
     except Exception as e:
         print(f"❌ Error verifying PDF: {e}")
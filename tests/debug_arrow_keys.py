@@ -34,7 +34,7 @@ def debug_arrow_keys():
             page_num=0,
             rect=[200, 200, 400, 230]
         )
-        app.field_manager.fields.append(test_field)
+        app.field_manager.add_field(test_field)
         app.field_manager.selected_field = test_field
         app.field_manager.draw_field(test_field)
         app._update_sidebar()
@@ -26,7 +26,7 @@ def final_arrow_test():
     )
     
     # Add the field and select it
-    app.field_manager.fields.append(test_field)
+    app.field_manager.add_field(test_field)
     app.field_manager.selected_field = test_field
     app.field_manager.draw_field(test_field)
     app._update_sidebar()
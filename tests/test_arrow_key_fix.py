@@ -44,7 +44,7 @@ def test_arrow_key_focus():
         )
         
         # Add and select the field
-        app.field_manager.fields.append(test_field)
+        app.field_manager.add_field(test_field)
         app.field_manager.selected_field = test_field
         app.field_manager.draw_field(test_field)
         
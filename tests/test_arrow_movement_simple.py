@@ -26,7 +26,7 @@ def test_arrow_key_movement():
         )
         
         # Add the field to the field manager
-        app.field_manager.fields.append(test_field)
+        app.field_manager.add_field(test_field)
         app.field_manager.selected_field = test_field
         
         print("Created test field at position:", test_field.rect)
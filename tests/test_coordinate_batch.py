@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the batched coordinate transformation API
+"""
+
+import sys
+import os
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from coordinate_utils import CoordinateTransformer, CoordinateTransformerFast, calculate_display_scale
+
+
+def test_batch_matches_scalar():
+    """Batched conversions must agree with the per-rectangle methods"""
+    print("Testing batched canvas<->PDF conversion:")
+    print("-" * 50)
+
+    transformer = CoordinateTransformer(0.8, 25)
+    page_height = 792
+    canvas_rects = [
+        [150, 100, 250, 130],
+        [300, 400, 200, 350],  # Reversed corners must be re-ordered
+        [25, 25, 45, 45],
+    ]
+
+    pdf_batch = transformer.canvas_to_pdf_batch(canvas_rects, page_height)
+    assert pdf_batch.shape == (3, 4)
+
+    for canvas_rect, pdf_row in zip(canvas_rects, pdf_batch):
+        expected = transformer.canvas_to_pdf(canvas_rect, page_height)
+        print(f"  Canvas {canvas_rect} -> PDF {pdf_row.tolist()}")
+        assert np.allclose(pdf_row, expected), f"Expected {expected}, got {pdf_row.tolist()}"
+
+    canvas_batch = transformer.pdf_to_canvas_batch(pdf_batch, page_height)
+    for pdf_row, canvas_row in zip(pdf_batch, canvas_batch):
+        expected = transformer.pdf_to_canvas(pdf_row.tolist(), page_height)
+        assert np.allclose(canvas_row, expected), f"Expected {expected}, got {canvas_row.tolist()}"
+
+    print("✅ Batched conversion matches scalar conversion")
+
+
+def test_batch_empty():
+    """An empty batch converts to an empty (0, 4) array"""
+    transformer = CoordinateTransformer(1.5, 25)
+    empty = np.empty((0, 4))
+
+    assert transformer.canvas_to_pdf_batch(empty, 792).shape == (0, 4)
+    assert transformer.pdf_to_canvas_batch(empty, 792).shape == (0, 4)
+
+    # Plain lists, including an empty one and a single flat rect, give the same shapes
+    assert transformer.canvas_to_pdf_batch([], 792).shape == (0, 4)
+    assert transformer.pdf_to_canvas_batch([], 792).shape == (0, 4)
+    assert transformer.canvas_to_pdf_batch([25, 25, 175, 55], 792).tolist() == [[0, 0, 100, 20]]
+    assert transformer.pdf_to_canvas_batch([0, 0, 100, 20], 792).tolist() == [[25, 25, 175, 55]]
+    print("✅ Empty batches handled")
+
+
+def test_clamp_batch_matches_scalar():
+    """Batched clamping must agree with clamp_to_page"""
+    transformer = CoordinateTransformer(1.0, 25)
+    page_width, page_height = 612, 792
+    pdf_rects = [
+        [-5, 10, 700, 20],      # Spills over the left and right edges
+        [600, 780, 601, 781],   # Too small and near the bottom-right corner
+        [100, 100, 200, 150],   # Already valid
+    ]
+
+    clamped = transformer.clamp_to_page_batch(pdf_rects, page_width, page_height)
+    for pdf_rect, row in zip(pdf_rects, clamped):
+        expected = transformer.clamp_to_page(pdf_rect, page_width, page_height)
+        print(f"  {pdf_rect} -> {row.tolist()}")
+        assert np.allclose(row, expected), f"Expected {expected}, got {row.tolist()}"
+
+    print("✅ Batched clamping matches scalar clamping")
+
+
+def test_display_scale_accepts_lists():
+    """Cached display scale gives the same result for list and tuple sizes"""
+    from_tuple = calculate_display_scale((800, 600), (612, 792))
+    from_list = calculate_display_scale([800, 600], [612, 792])
+    assert from_tuple == from_list == min(750 / 612, 550 / 792, 2.0)
+    print(f"✅ Display scale cached: {from_tuple:.3f}")
+
+
+def test_fast_transformer_matches_python():
+    """The compiled transformer (or its pure Python fallback) agrees with CoordinateTransformer"""
+    print(f"Using {CoordinateTransformerFast.__module__}.{CoordinateTransformerFast.__name__}")
+    fast = CoordinateTransformerFast(0.8, 25)
+    reference = CoordinateTransformer(0.8, 25)
+
+    for rect in ([150, 100, 250, 130], [300, 400, 200, 350]):
+        assert np.allclose(fast.canvas_to_pdf(rect, 792), reference.canvas_to_pdf(rect, 792))
+        assert np.allclose(fast.pdf_to_canvas(rect, 792), reference.pdf_to_canvas(rect, 792))
+        assert np.allclose(fast.clamp_to_page(rect, 612, 792), reference.clamp_to_page(rect, 612, 792))
+
+    print("✅ Fast transformer matches the Python implementation")
+
+
+if __name__ == "__main__":
+    test_batch_matches_scalar()
+    test_batch_empty()
+    test_clamp_batch_matches_scalar()
+    test_display_scale_accepts_lists()
+    test_fast_transformer_matches_python()
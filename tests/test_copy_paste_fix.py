@@ -37,7 +37,7 @@ def test_copy_paste_fix():
         )
         
         # Add the field to the field manager
-        app.field_manager.fields.append(test_field)
+        app.field_manager.add_field(test_field)
         app.field_manager.selected_field = test_field
         
         # Test copy
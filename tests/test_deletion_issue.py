@@ -50,6 +50,10 @@ def test_field_deletion_in_saved_pdf():
     # Step 2: Load the PDF and detect fields
     print("\n2. Loading PDF and detecting fields...")
     mock_canvas = mock.MagicMock()
+    mock_canvas.canvasx.return_value = 0.0
+    mock_canvas.canvasy.return_value = 0.0
+    mock_canvas.winfo_width.return_value = 2000
+    mock_canvas.winfo_height.return_value = 2000
     pdf_handler = PDFHandler(mock_canvas)
     field_manager = FieldManager(mock_canvas, pdf_handler)
     
@@ -74,7 +78,7 @@ def test_field_deletion_in_saved_pdf():
     print(f"   Deleting field: '{field_to_delete.name}'")
     
     # Remove from field manager (this is what happens when user deletes)
-    field_manager.fields.remove(field_to_delete)
+    field_manager.delete_field(field_to_delete)
     
     print(f"   Remaining fields: {len(field_manager.fields)}")
     remaining_field_names = [f.name for f in field_manager.fields]
@@ -46,7 +46,8 @@ def test_field_deletion():
     print("\n2. Simulating field deletion...")
     if len(field_manager.fields) > 1:
         # Remove the first field
-        deleted_field = field_manager.fields.pop(0)
+        deleted_field = field_manager.fields[0]
+        field_manager.delete_field(deleted_field)
         print(f"   Deleted field: {deleted_field.name}")
     else:
         print("   Only one field found, keeping it for save test")
@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+Test script to verify FieldManager's deferred (idle-time) redraws
+"""
+
+import sys
+import os
+import unittest.mock as mock
+from types import SimpleNamespace
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from field_manager import FieldManager
+from models import FormField, FieldType
+
+
+def make_manager():
+    """FieldManager on a mock canvas whose after_idle callbacks are queued for the test"""
+    canvas = mock.MagicMock()
+    idle_callbacks = []
+    canvas.after_idle.side_effect = idle_callbacks.append
+    # A view large enough that nothing is culled unless a test narrows it
+    canvas.canvasx.return_value = 0.0
+    canvas.canvasy.return_value = 0.0
+    canvas.winfo_width.return_value = 2000
+    canvas.winfo_height.return_value = 2000
+    pdf_handler = SimpleNamespace(pdf_scale=1.0, current_page=0)
+    return FieldManager(canvas, pdf_handler), canvas, idle_callbacks
+
+
+def run_idle(idle_callbacks):
+    while idle_callbacks:
+        idle_callbacks.pop(0)()
+
+
+def test_drag_coalesces_redraws():
+    """Many move_field calls in one event burst produce a single redraw"""
+    print("Testing coalesced drag redraws:")
+    print("-" * 50)
+
+    field_manager, canvas, idle_callbacks = make_manager()
+    field = FormField("drag_me", FieldType.TEXT, 0, [100, 100, 200, 130])
+    field_manager.add_field(field)
+    field_manager.select_field(field)
+    run_idle(idle_callbacks)
+    canvas.create_rectangle.reset_mock()
+
+    for _ in range(20):
+        field_manager.move_field(field, 2, 1)
+
+    assert len(idle_callbacks) == 1, "Only one idle redraw should be scheduled"
+    assert canvas.create_rectangle.call_count == 0, "Nothing is drawn before the idle flush"
+    assert field.rect == [140, 120, 240, 150]
+
+    run_idle(idle_callbacks)
+    # One field rectangle plus its 8 resize handles
+    print(f"  Rectangles drawn after flush: {canvas.create_rectangle.call_count}")
+    assert canvas.create_rectangle.call_count == 9
+    print("✅ 20 moves coalesced into one redraw")
+
+
+def test_flush_skips_deleted_and_offpage_fields():
+    """Pending redraws are dropped for fields deleted or on another page"""
+    field_manager, canvas, idle_callbacks = make_manager()
+    deleted = FormField("deleted", FieldType.TEXT, 0, [10, 10, 50, 50])
+    other_page = FormField("other_page", FieldType.TEXT, 1, [10, 10, 50, 50])
+    field_manager.add_field(deleted)
+    field_manager.add_field(other_page)
+    canvas.create_rectangle.reset_mock()
+
+    field_manager.move_field(deleted, 5, 5)
+    field_manager.move_field(other_page, 5, 5)
+    field_manager.delete_field(deleted)
+    run_idle(idle_callbacks)
+
+    assert canvas.create_rectangle.call_count == 0
+    print("✅ Stale redraws skipped")
+
+
+def test_drag_repositions_existing_items():
+    """A drag flush moves the live canvas items instead of recreating them"""
+    field_manager, canvas, idle_callbacks = make_manager()
+    canvas.type.return_value = 'rectangle'  # Items drawn earlier still exist
+    field = FormField("move_in_place", FieldType.TEXT, 0, [100, 100, 200, 130])
+    field_manager.add_field(field)
+    field_manager.select_field(field)
+    run_idle(idle_callbacks)
+    canvas.reset_mock()
+
+    field_manager.move_field(field, 10, 0)
+    run_idle(idle_callbacks)
+
+    assert canvas.create_rectangle.call_count == 0
+    assert canvas.create_text.call_count == 0
+    assert canvas.delete.call_count == 0
+    # Field rectangle, label and 8 resize handles
+    assert canvas.coords.call_count == 10
+    x1, y1, x2, y2 = canvas.coords.call_args_list[0].args[1:]
+    assert (x1, y1, x2, y2) == (135, 125, 235, 155)
+    print("✅ Drag updates coords in place")
+
+
+def test_resize_handle_hit_testing():
+    """check_resize_handle_click finds each handle and ignores the field body"""
+    field_manager, canvas, idle_callbacks = make_manager()
+    field = FormField("handles", FieldType.TEXT, 0, [100, 100, 200, 130])
+    field_manager.add_field(field)
+    field_manager.select_field(field)
+
+    # Canvas rect is [125, 125, 225, 155] with the 25px offset
+    expected = {
+        'nw': (125, 125), 'ne': (225, 125), 'sw': (125, 155), 'se': (225, 155),
+        'n': (175, 125), 's': (175, 155), 'w': (125, 140), 'e': (225, 140),
+    }
+    for direction, (x, y) in expected.items():
+        assert field_manager.check_resize_handle_click(x, y) == direction, direction
+    assert field_manager.check_resize_handle_click(150, 140) is None
+    assert field_manager.check_resize_handle_click(500, 500) is None
+
+    # The cached handle boxes follow moves, rect updates and zoom changes
+    field_manager.move_field(field, 100, 0)
+    assert field_manager.check_resize_handle_click(325, 155) == 'se'
+    field_manager.set_field_rect(field, [100, 100, 200, 130])
+    assert field_manager.check_resize_handle_click(225, 155) == 'se'
+    field_manager.pdf_handler.pdf_scale = 2.0
+    assert field_manager.check_resize_handle_click(425, 285) == 'se'
+    assert field_manager.check_resize_handle_click(225, 155) is None
+    print("✅ All 8 resize handles hit-tested")
+
+
+def test_page_redraw_uses_batch_rects():
+    """redraw_fields_for_page draws each field at its single-field canvas rect"""
+    field_manager, canvas, idle_callbacks = make_manager()
+    field_manager.pdf_handler.pdf_scale = 1.5
+    field_manager.fields = [FormField(f"f{i}", FieldType.TEXT, i % 2, [10 * i, 20, 10 * i + 40, 50])
+                            for i in range(5)] + [FormField("skip", FieldType.TEXT, 1, [0, 0, 10, 10])]
+    canvas.reset_mock()
+
+    field_manager.redraw_fields_for_page(0)
+
+    expected = [field_manager.get_canvas_rect_for_field(f) for f in field_manager.fields if f.page_num == 0]
+    drawn = [list(call.args) for call in canvas.create_rectangle.call_args_list]
+    assert drawn == expected, drawn
+    assert field_manager.get_canvas_rects_for_fields([]) == []
+    print("✅ Page redraw converts rects in one batch")
+
+
+def test_bulk_clears_use_shared_tags():
+    """Page redraws and clear_all_fields delete by shared tag, not per field"""
+    field_manager, canvas, idle_callbacks = make_manager()
+    for i in range(10):
+        field_manager.add_field(FormField(f"f{i}", FieldType.TEXT, 0, [i, i, i + 20, i + 20]))
+    tags = canvas.create_rectangle.call_args_list[0].kwargs['tags']
+    assert tags == ("field_f0", "form_field", "form_field_p0"), tags
+
+    canvas.reset_mock()
+    field_manager.redraw_fields_for_page(0)
+    deleted = [call.args[0] for call in canvas.delete.call_args_list]
+    assert deleted == ["form_field_p0"], deleted
+
+    canvas.reset_mock()
+    field_manager.clear_all_fields()
+    deleted = [call.args[0] for call in canvas.delete.call_args_list]
+    assert deleted == ["form_field"], deleted
+    print("✅ Bulk clears use one tagged delete")
+
+
+def test_bulk_load_draws_once():
+    """load_existing_fields draws the page once and schedules no idle redraws"""
+    field_manager, canvas, idle_callbacks = make_manager()
+    field_manager.select_field(FormField("old", FieldType.TEXT, 0, [0, 0, 10, 10]))
+    idle_callbacks.clear()
+    canvas.reset_mock()
+    detected = [FormField(f"text_{i}", FieldType.TEXT, i % 2, [i, i, i + 30, i + 20]) for i in range(1, 41)]
+
+    field_manager.load_existing_fields(detected)
+
+    assert not idle_callbacks, "Bulk load should not queue idle redraws"
+    assert canvas.create_rectangle.call_count == 20
+    assert canvas.update_idletasks.call_count == 1
+    assert field_manager.field_counter == 41
+    print("✅ Bulk load drew the current page once")
+
+
+def test_resize_enforces_minimum_size():
+    """Each handle moves only its own edges and never shrinks below 10 canvas pixels"""
+    field_manager, canvas, idle_callbacks = make_manager()
+    field_manager.pdf_handler.pdf_scale = 2.0
+    field = FormField("resize_me", FieldType.TEXT, 0, [100, 100, 200, 130])
+    field_manager.add_field(field)
+
+    field_manager.resize_field(field, 'nw', 1000, 1000)
+    assert field.rect == [195, 125, 200, 130], field.rect
+    field_manager.resize_field(field, 'e', 825, 0)
+    assert field.rect == [195, 125, 400, 130], field.rect
+
+    # Without a PDF handler canvas and PDF coordinates coincide
+    plain = FieldManager(mock.MagicMock())
+    field = FormField("plain", FieldType.TEXT, 0, [100, 100, 200, 130])
+    plain.add_field(field)
+    plain.resize_field(field, 's', 0, 50)
+    assert field.rect == [100, 100, 200, 110], field.rect
+    print("✅ Resize honours the minimum size")
+
+
+def test_redraw_skips_offscreen_fields():
+    """Page redraws only draw fields in view; scrolling reveals the rest"""
+    field_manager, canvas, idle_callbacks = make_manager()
+    canvas.canvasx.return_value = 0.0
+    canvas.canvasy.return_value = 0.0
+    canvas.winfo_width.return_value = 400
+    canvas.winfo_height.return_value = 300
+    field_manager.fields = [FormField(f"row_{i}", FieldType.TEXT, 0, [10, i * 100, 110, i * 100 + 30])
+                            for i in range(10)]
+    canvas.reset_mock()
+
+    field_manager.redraw_fields_for_page(0)
+    # With the 25px offset rows 0-2 start above y=300; row 3 starts at 325
+    print(f"  Drawn in first viewport: {canvas.create_rectangle.call_count}")
+    assert canvas.create_rectangle.call_count == 3
+
+    canvas.reset_mock()
+    canvas.canvasy.return_value = 600.0
+    field_manager.reveal_visible_fields(0)
+    run_idle(idle_callbacks)
+    drawn = sorted(call.kwargs['tags'][0] for call in canvas.create_rectangle.call_args_list)
+    assert drawn == ["field_row_6", "field_row_7", "field_row_8"], drawn
+
+    # Already-drawn fields are not drawn again
+    canvas.reset_mock()
+    field_manager.reveal_visible_fields(0)
+    run_idle(idle_callbacks)
+    assert canvas.create_rectangle.call_count == 0
+    print("✅ Off-screen fields are drawn once scrolled into view")
+
+
+def test_selection_reuses_handle_items():
+    """Selecting another field moves the existing handles instead of recreating them"""
+    field_manager, canvas, idle_callbacks = make_manager()
+    canvas.type.return_value = 'rectangle'  # Items drawn earlier still exist
+    first = FormField("first", FieldType.TEXT, 0, [100, 100, 200, 130])
+    second = FormField("second", FieldType.TEXT, 0, [300, 300, 400, 330])
+    field_manager.add_field(first)
+    field_manager.add_field(second)
+    field_manager.select_field(first)
+    run_idle(idle_callbacks)
+    handle_ids = dict(field_manager._handle_ids)
+
+    canvas.reset_mock()
+    field_manager.select_field(second)
+    run_idle(idle_callbacks)
+    # Only the two fields' rectangles are recreated, not the 8 handles
+    assert canvas.create_rectangle.call_count == 2
+    assert field_manager._handle_ids == handle_ids
+    canvas.itemconfigure.assert_any_call("form_handle", state='hidden')
+    canvas.itemconfigure.assert_any_call("form_handle", state='normal')
+
+    canvas.reset_mock()
+    field_manager.clear_selection()
+    canvas.itemconfigure.assert_called_once_with("form_handle", state='hidden')
+    assert canvas.delete.call_count == 0
+    print("✅ Handle items are pooled across selections")
+
+
+def test_create_and_select_draws_once():
+    """A newly created field is drawn once, already selected, on the idle pass"""
+    field_manager, canvas, idle_callbacks = make_manager()
+    old = FormField("old", FieldType.TEXT, 0, [0, 0, 10, 10])
+    field_manager.add_field(old)
+    field_manager.select_field(old)
+    run_idle(idle_callbacks)
+    canvas.reset_mock()
+
+    field = field_manager.create_and_select(FieldType.TEXT, 100, 100, 0)
+    assert field_manager.selected_field is field and field in field_manager.fields
+    assert canvas.create_rectangle.call_count == 0, "Nothing is drawn before the idle flush"
+
+    run_idle(idle_callbacks)
+    # New field and its 8 handles, plus the old field without its highlight
+    assert canvas.create_rectangle.call_count == 10
+    print("✅ Created field drawn once with its handles")
+
+
+def test_duplicate_clones_once():
+    """duplicate adds one offset copy under a unique name and draws it on the idle pass"""
+    field_manager, canvas, idle_callbacks = make_manager()
+    field = FormField("choice", FieldType.TEXT, 0, [10, 10, 110, 30], options=["a", "b"])
+    field_manager.add_field(field)
+    canvas.reset_mock()
+
+    copy = field_manager.duplicate(field)
+    assert copy.name == "choice_copy_1" and copy.rect == [30, 30, 130, 50]
+    assert copy.options == field.options and copy.options is not field.options
+    assert field.rect == [10, 10, 110, 30] and field_manager.fields[-1] is copy
+    assert canvas.create_rectangle.call_count == 0
+    run_idle(idle_callbacks)
+    assert canvas.create_rectangle.call_count == 1
+
+    pasted = field_manager.duplicate(field, page_num=2)
+    assert pasted.name == "choice_copy_2" and pasted.page_num == 2
+    assert field_manager.get_fields_for_page(2) == [pasted]
+    print("✅ Duplicate clones once and draws once")
+
+
+def test_page_switch_reuses_hidden_items():
+    """Returning to a page unhides its items unless it changed or the zoom did"""
+    field_manager, canvas, idle_callbacks = make_manager()
+    canvas.type.return_value = 'rectangle'  # Items drawn earlier still exist
+    field_manager.fields = [FormField(f"f{i}", FieldType.TEXT, i % 2, [10 * i, 10, 10 * i + 20, 30])
+                            for i in range(6)]
+    field_manager.redraw_fields_for_page(0)
+
+    canvas.reset_mock()
+    field_manager.show_page(1)
+    assert canvas.create_rectangle.call_count == 3
+    canvas.itemconfigure.assert_any_call("form_field_p0", state='hidden')
+
+    canvas.reset_mock()
+    field_manager.show_page(0)
+    run_idle(idle_callbacks)
+    assert canvas.create_rectangle.call_count == 0
+    canvas.itemconfigure.assert_any_call("form_field_p1", state='hidden')
+    canvas.itemconfigure.assert_any_call("form_field_p0", state='normal')
+
+    # A field of the hidden page changes: that page is redrawn when shown
+    field_manager.move_field(field_manager.fields[1], 5, 0)
+    run_idle(idle_callbacks)
+    canvas.reset_mock()
+    field_manager.show_page(1)
+    assert canvas.create_rectangle.call_count == 3
+
+    # After a zoom the hidden page is redrawn too
+    field_manager.pdf_handler.pdf_scale = 2.0
+    field_manager.redraw_fields_for_page(1)
+    canvas.reset_mock()
+    field_manager.show_page(0)
+    assert canvas.create_rectangle.call_count == 3
+
+    # Pages without fields only hide the page left behind
+    canvas.reset_mock()
+    field_manager.show_page(5)
+    assert canvas.create_rectangle.call_count == 0 and canvas.winfo_width.call_count == 0
+    canvas.itemconfigure.assert_any_call("form_field_p0", state='hidden')
+    print("✅ Page switches reuse hidden field items")
+
+
+def test_arrow_moves_share_one_redraw():
+    """Repeated set_field_rect calls update the field at once and redraw it once"""
+    field_manager, canvas, idle_callbacks = make_manager()
+    field = FormField("nudged", FieldType.TEXT, 0, [100, 100, 200, 130])
+    field_manager.add_field(field)
+    rect = field.rect
+    canvas.reset_mock()
+
+    for i in range(1, 16):
+        field_manager.set_field_rect(field, [100 + 2 * i, 100, 200 + 2 * i, 130])
+
+    assert field.rect is rect and rect == [130, 100, 230, 130]
+    assert field_manager.get_field_at_position(250, 140, 0) is field
+    assert len(idle_callbacks) == 1 and canvas.create_rectangle.call_count == 0
+    run_idle(idle_callbacks)
+    assert canvas.create_rectangle.call_count == 1
+    print("✅ Arrow-key steps share one redraw")
+
+
+if __name__ == "__main__":
+    test_drag_coalesces_redraws()
+    test_flush_skips_deleted_and_offpage_fields()
+    test_drag_repositions_existing_items()
+    test_resize_handle_hit_testing()
+    test_page_redraw_uses_batch_rects()
+    test_bulk_clears_use_shared_tags()
+    test_bulk_load_draws_once()
+    test_resize_enforces_minimum_size()
+    test_redraw_skips_offscreen_fields()
+    test_selection_reuses_handle_items()
+    test_create_and_select_draws_once()
+    test_duplicate_clones_once()
+    test_page_switch_reuses_hidden_items()
+    test_arrow_moves_share_one_redraw()
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Test script to verify history commands act on the live field objects
+"""
+
+import sys
+import os
+import unittest.mock as mock
+from types import SimpleNamespace
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from field_manager import FieldManager
+from history_manager import (HistoryManager, CreateFieldCommand, DeleteFieldCommand, MoveFieldCommand,
+                             EditFieldCommand, BatchCommand)
+from models import FormField, FieldType, AppConstants
+
+
+def make_managers():
+    pdf_handler = SimpleNamespace(pdf_scale=1.0, current_page=0)
+    return FieldManager(mock.MagicMock(), pdf_handler), HistoryManager(max_history=25)
+
+
+def test_undo_redo_keeps_field_identity():
+    """Create, move, delete and their undo/redo all work on the same field object"""
+    print("Testing history command field identity:")
+    print("-" * 50)
+
+    field_manager, history_manager = make_managers()
+    field = field_manager.create_field(FieldType.TEXT, 100, 100, 0)
+    create_command = CreateFieldCommand(field_manager, field)
+    create_command.was_executed = True  # create_field already added it
+    history_manager.add_command(create_command)
+
+    old_rect = field.rect.copy()
+    field_manager.move_field(field, 50, 0)
+    history_manager.add_command(MoveFieldCommand(field_manager, field, old_rect, field.rect))
+    moved_rect = field.rect.copy()
+
+    # Undo the move and the create, then redo both
+    assert history_manager.undo() and field.rect == old_rect
+    assert history_manager.undo() and field not in field_manager.fields
+    assert history_manager.redo()
+    assert field_manager.fields[0] is field
+    assert history_manager.redo() and field.rect == moved_rect
+
+    # Delete and restore the very same object
+    history_manager.execute_command(DeleteFieldCommand(field_manager, field))
+    assert not field_manager.fields
+    assert history_manager.undo()
+    assert field_manager.fields[0] is field
+    print("✅ Undo/redo kept working on the original field")
+
+
+def test_edit_command_copies_list_properties():
+    """Edits store and apply their own copies of list values like rect"""
+    field_manager, history_manager = make_managers()
+    field = FormField("edit_me", FieldType.TEXT, 0, [10, 10, 60, 30])
+    field_manager.add_field(field)
+    new_rect = [20, 20, 70, 40]
+    history_manager.execute_command(EditFieldCommand(
+        field_manager, field, {'name': 'edit_me', 'rect': field.rect}, {'name': 'renamed', 'rect': new_rect}))
+    new_rect[0] = 999
+
+    assert field.name == 'renamed' and field.rect == [20, 20, 70, 40]
+    field_manager.move_field(field, 5, 5)  # Moves edit field.rect in place
+    assert history_manager.undo()
+    assert field.name == 'edit_me' and field.rect == [10, 10, 60, 30]
+    assert history_manager.redo()
+    assert field.rect == [20, 20, 70, 40]
+    print("✅ Edit command kept independent copies")
+
+
+def test_edit_command_keeps_type_color():
+    """The color cached on a field follows type edits and their undo"""
+    field_manager, history_manager = make_managers()
+    field = FormField("typed", FieldType.TEXT, 0, [0, 0, 10, 10])
+    field_manager.add_field(field)
+    assert field.color == AppConstants.FIELD_COLORS[FieldType.TEXT]
+
+    history_manager.execute_command(EditFieldCommand(
+        field_manager, field, {'type': FieldType.TEXT}, {'type': FieldType.DATE}))
+    assert field.color == AppConstants.FIELD_COLORS[FieldType.DATE]
+    assert history_manager.undo() and field.color == AppConstants.FIELD_COLORS[FieldType.TEXT]
+    print("✅ Cached field color follows type edits")
+
+
+def test_history_is_bounded():
+    """Only the newest max_history commands are kept, and redo branches are dropped"""
+    field_manager = make_managers()[0]
+    history_manager = HistoryManager(max_history=5)
+    history_manager.merge_window = 0  # Keep every move as its own command
+    field = FormField("bounded", FieldType.TEXT, 0, [0, 0, 10, 10])
+    field_manager.add_field(field)
+
+    for i in range(12):
+        history_manager.execute_command(MoveFieldCommand(field_manager, field, [i, 0, i + 10, 10], [i + 1, 0, i + 11, 10]))
+    assert len(history_manager.history) == 5 and history_manager.current_index == 4
+
+    while history_manager.undo():
+        pass
+    assert field.rect == [7, 0, 17, 10]
+
+    assert history_manager.redo() and history_manager.redo()
+    history_manager.execute_command(MoveFieldCommand(field_manager, field, [9, 0, 19, 10], [50, 0, 60, 10]))
+    assert len(history_manager.history) == 3 and not history_manager.can_redo()
+    print("✅ History stays bounded")
+
+
+def test_rapid_moves_coalesce():
+    """Back-to-back moves of one field become a single undo step"""
+    field_manager, history_manager = make_managers()
+    field = FormField("nudged", FieldType.TEXT, 0, [0, 0, 10, 10])
+    other = FormField("other", FieldType.TEXT, 0, [50, 50, 60, 60])
+    field_manager.add_field(field)
+    field_manager.add_field(other)
+
+    for i in range(30):  # Arrow-key autorepeat
+        history_manager.execute_command(MoveFieldCommand(field_manager, field, [i, 0, i + 10, 10], [i + 1, 0, i + 11, 10]))
+    assert len(history_manager.history) == 1
+    history_manager.execute_command(MoveFieldCommand(field_manager, other, [50, 50, 60, 60], [51, 50, 61, 60]))
+    assert len(history_manager.history) == 2
+
+    assert history_manager.undo() and history_manager.undo()
+    assert field.rect == [0, 0, 10, 10] and other.rect == [50, 50, 60, 60]
+    assert history_manager.redo() and field.rect == [30, 0, 40, 10]
+
+    # Moves further apart than the merge window stay separate
+    history_manager.merge_window = 0
+    history_manager.execute_command(MoveFieldCommand(field_manager, field, [30, 0, 40, 10], [31, 0, 41, 10]))
+    history_manager.execute_command(MoveFieldCommand(field_manager, field, [31, 0, 41, 10], [32, 0, 42, 10]))
+    assert len(history_manager.history) == 3
+    print("✅ Autorepeat moves coalesced into one command")
+
+
+def test_batch_draws_each_field_once():
+    """A batch of edits redraws each touched field once, after the last edit"""
+    field_manager, history_manager = make_managers()
+    canvas = field_manager.canvas
+    field = FormField("batched", FieldType.TEXT, 0, [0, 0, 10, 10])
+    doomed = FormField("doomed", FieldType.TEXT, 0, [20, 20, 30, 30])
+    field_manager.add_field(field)
+    field_manager.add_field(doomed)
+    canvas.reset_mock()
+
+    commands = [MoveFieldCommand(field_manager, field, [i, 0, i + 10, 10], [i + 1, 0, i + 11, 10]) for i in range(10)]
+    commands.append(EditFieldCommand(field_manager, doomed, {'name': 'doomed'}, {'name': 'gone'}))
+    commands.append(DeleteFieldCommand(field_manager, doomed))
+    history_manager.execute_command(BatchCommand(commands, "Nudge and delete"))
+
+    drawn = [call.args for call in canvas.create_rectangle.call_args_list]
+    assert drawn == [(35.0, 25.0, 45.0, 35.0)], drawn
+    assert doomed not in field_manager.fields
+
+    canvas.reset_mock()
+    assert history_manager.undo()
+    assert field.rect == [0, 0, 10, 10] and doomed.name == 'doomed'
+    assert canvas.create_rectangle.call_count == 2
+    print("✅ Batch redrew each field once")
+
+
+def test_undo_redraws_only_touched_field():
+    """Undoing an edit redraws the edited field, not the rest of its page"""
+    field_manager, history_manager = make_managers()
+    canvas = field_manager.canvas
+    fields = [FormField(f"f{i}", FieldType.TEXT, 0, [10 * i, 0, 10 * i + 5, 5]) for i in range(20)]
+    for field in fields:
+        field_manager.add_field(field)
+    history_manager.execute_command(MoveFieldCommand(field_manager, fields[7], [70, 0, 75, 5], [70, 50, 75, 55]))
+
+    canvas.reset_mock()
+    assert history_manager.undo() and fields[7].rect == [70, 0, 75, 5]
+    assert canvas.create_rectangle.call_count == 1
+    print("✅ Undo redrew only the touched field")
+
+
+def test_undo_redo_flags_follow_history():
+    """Cached can_undo/can_redo track every history change, including direct index edits"""
+    field_manager = make_managers()[0]
+    history_manager = HistoryManager(max_history=3)
+    history_manager.merge_window = 0
+    field = FormField("flags", FieldType.TEXT, 0, [0, 0, 10, 10])
+    field_manager.add_field(field)
+    assert not history_manager.can_undo() and not history_manager.can_redo()
+
+    for i in range(4):
+        history_manager.execute_command(MoveFieldCommand(field_manager, field, [i, 0, i + 10, 10], [i + 1, 0, i + 11, 10]))
+    assert history_manager.can_undo() and not history_manager.can_redo()
+    assert history_manager.undo() and history_manager.can_redo()
+
+    history_manager.current_index = 999
+    assert not history_manager.can_undo() and not history_manager.undo()
+    history_manager.current_index = -5
+    assert not history_manager.can_redo() and not history_manager.redo()
+    history_manager.current_index = 0
+    assert history_manager.can_undo() and history_manager.can_redo()
+    assert history_manager.get_redo_description() == "Move field 'flags'", history_manager.get_redo_description()
+
+    history_manager.clear_history()
+    assert not history_manager.can_undo() and not history_manager.can_redo()
+    print("✅ Undo/redo flags stay in sync")
+
+
+def test_batch_duplicate_undoes_as_one_step():
+    """Copies recorded as one batch of executed creates are undone and redone together"""
+    field_manager, history_manager = make_managers()
+    originals = [FormField(f"f{i}", FieldType.TEXT, 0, [10 * i, 0, 10 * i + 5, 5]) for i in range(3)]
+    for field in originals:
+        field_manager.add_field(field)
+
+    copies = [field_manager.duplicate(field) for field in originals]
+    commands = []
+    for copy in copies:
+        command = CreateFieldCommand(field_manager, copy)
+        command.was_executed = True
+        commands.append(command)
+    history_manager.add_command(BatchCommand(commands, "Duplicate 3 fields"))
+    assert [f.name for f in copies] == ["f0_copy_1", "f1_copy_1", "f2_copy_1"]
+
+    assert history_manager.undo() and field_manager.fields == originals
+    assert history_manager.redo() and field_manager.fields[3:] == copies
+    assert all(a is b for a, b in zip(field_manager.fields[3:], copies))
+    print("✅ Batch duplicate is one undo step")
+
+
+if __name__ == "__main__":
+    test_undo_redo_keeps_field_identity()
+    test_edit_command_copies_list_properties()
+    test_edit_command_keeps_type_color()
+    test_history_is_bounded()
+    test_rapid_moves_coalesce()
+    test_batch_draws_each_field_once()
+    test_undo_redraws_only_touched_field()
+    test_undo_redo_flags_follow_history()
+    test_batch_duplicate_undoes_as_one_step()
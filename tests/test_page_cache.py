@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the rendered page image cache
+"""
+
+import sys
+import os
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pdf_handler import PageImageCache
+
+
+def test_cache_evicts_least_recently_used():
+    """Images beyond the memory budget are dropped oldest-use first"""
+    print("Testing page image cache:")
+    print("-" * 50)
+
+    cache = PageImageCache(max_memory_mb=3)
+    megabyte = 1024 * 1024
+    for page in range(3):
+        cache.put((page, 1.0), f"page {page}", megabyte)
+    assert len(cache) == 3 and cache.total_bytes == 3 * megabyte
+
+    # Touch page 0 so page 1 is the least recently used
+    assert cache.get((0, 1.0)) == "page 0"
+    cache.put((3, 1.0), "page 3", megabyte)
+    print(f"  Cached keys: {sorted(key[0] for key in cache._images)}")
+    assert (1, 1.0) not in cache
+    assert (0, 1.0) in cache and (3, 1.0) in cache
+    assert cache.get((1, 1.0)) is None
+
+    # Replacing an entry does not count it twice
+    cache.put((3, 1.0), "page 3 again", megabyte)
+    assert cache.total_bytes == 3 * megabyte
+
+    # A single image larger than the budget is still kept
+    cache.put((4, 2.0), "huge", 10 * megabyte)
+    assert len(cache) == 1 and cache.get((4, 2.0)) == "huge"
+
+    cache.clear()
+    assert len(cache) == 0 and cache.total_bytes == 0
+    print("✅ Page image cache honours its memory budget")
+
+
+if __name__ == "__main__":
+    test_cache_evicts_least_recently_used()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Test script to verify spatial-index hit testing in FieldManager
+"""
+
+import sys
+import os
+import random
+import unittest.mock as mock
+from types import SimpleNamespace
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from field_manager import FieldManager
+from models import FormField, FieldType
+from spatial_index import GridIndex
+
+
+def brute_force_hit(field_manager, x, y, page_num):
+    """Reference hit test: first field in list order containing the point"""
+    for field in field_manager.fields:
+        if field.page_num != page_num:
+            continue
+        x1, y1, x2, y2 = field_manager.get_canvas_rect_for_field(field)
+        if x1 <= x <= x2 and y1 <= y <= y2:
+            return field
+    return None
+
+
+def make_manager(scale=1.5):
+    pdf_handler = SimpleNamespace(pdf_scale=scale, current_page=0)
+    canvas = mock.MagicMock()
+    canvas.canvasx.return_value = 0.0
+    canvas.canvasy.return_value = 0.0
+    canvas.winfo_width.return_value = 2000
+    canvas.winfo_height.return_value = 2000
+    return FieldManager(canvas, pdf_handler)
+
+
+def test_grid_index_queries():
+    """GridIndex returns candidates near the query and forgets removed entries"""
+    index = GridIndex(cell_size=50)
+    index.insert("a", "A", [10, 10, 40, 40])
+    index.insert("b", "B", [200, 200, 260, 230])
+    index.insert("huge", "H", [0, 0, 1e9, 1e9])
+
+    assert "A" in index.query_point(20, 20)
+    assert "B" not in index.query_point(20, 20)
+    assert "H" in index.query_point(500, 500)
+    assert set(index.query_rect(0, 0, 300, 300)) == {"A", "B", "H"}
+
+    assert index.update("a", "A", [10, 10, 40, 40]) is False
+    assert index.update("a", "A", [300, 300, 320, 320]) is True
+    assert "A" not in index.query_point(20, 20)
+
+    assert index.remove("b") and not index.remove("b")
+    assert len(index) == 2
+    print("✅ GridIndex insert/update/remove/query work")
+
+
+def test_hit_testing_matches_linear_scan():
+    """Indexed get_field_at_position agrees with a brute-force scan"""
+    print("Testing indexed hit testing:")
+    print("-" * 50)
+
+    random.seed(1234)
+    field_manager = make_manager()
+    fields = []
+    for i in range(300):
+        x, y = random.uniform(0, 550), random.uniform(0, 750)
+        fields.append(FormField(
+            f"field_{i}", FieldType.TEXT, i % 3,
+            [x, y, x + random.uniform(5, 120), y + random.uniform(5, 40)]))
+    field_manager.fields = fields
+
+    mismatches = 0
+    for _ in range(2000):
+        x, y, page = random.uniform(0, 900), random.uniform(0, 1200), random.randrange(3)
+        if field_manager.get_field_at_position(x, y, page) is not brute_force_hit(field_manager, x, y, page):
+            mismatches += 1
+
+    print(f"  Mismatches: {mismatches}")
+    assert mismatches == 0
+    print("✅ Indexed hit testing matches the linear scan")
+
+
+def test_index_follows_mutations():
+    """Moves, resizes, inserts, deletes and reassignment keep the index current"""
+    field_manager = make_manager(scale=1.0)
+    field = FormField("f", FieldType.TEXT, 0, [100, 100, 200, 130])
+    other = FormField("g", FieldType.TEXT, 0, [400, 400, 450, 450])
+    field_manager.add_field(field)
+
+    # PDF [100, 100, 200, 130] is drawn at canvas [125, 125, 225, 155] (25px offset)
+    assert field_manager.get_field_at_position(150, 140, 0) is field
+
+    field_manager.move_field(field, 300, 0)
+    assert field_manager.get_field_at_position(150, 140, 0) is None
+    assert field_manager.get_field_at_position(450, 140, 0) is field
+
+    field_manager.resize_field(field, 'se', 700, 300)
+    assert field_manager.get_field_at_position(650, 280, 0) is field
+
+    field_manager.set_field_rect(field, [0, 0, 50, 50])
+    assert field_manager.get_field_at_position(40, 40, 0) is field
+
+    field_manager.fields = [other]
+    assert field_manager.get_field_at_position(40, 40, 0) is None
+    assert field_manager.get_field_at_position(450, 450, 0) is other
+
+    field_manager.insert_field(0, field)
+    assert field_manager.get_field_at_position(40, 40, 0) is field
+    field_manager.delete_field(field)
+    assert field_manager.get_field_at_position(40, 40, 0) is None
+
+    field_manager.clear_all_fields()
+    assert field_manager.get_field_at_position(450, 450, 0) is None
+    print("✅ Index follows field mutations")
+
+
+def test_delete_finds_copies_by_name():
+    """delete_field accepts the managed field or an equal copy, even after a rename"""
+    import copy
+    field_manager = make_manager(scale=1.0)
+    fields = [FormField(f"f{i}", FieldType.TEXT, 0, [i, i, i + 10, i + 10]) for i in range(50)]
+    for field in fields:
+        field_manager.add_field(field)
+
+    assert field_manager.delete_field(copy.deepcopy(fields[10]))
+    assert fields[10] not in field_manager.fields
+    assert not field_manager.delete_field(fields[10])
+
+    field_manager.rename_field(fields[20], "renamed")
+    assert field_manager.delete_field(copy.deepcopy(fields[20]))
+    assert field_manager.delete_field(fields[30])
+    assert len(field_manager.fields) == 47
+    assert field_manager._fields_by_name.keys() == {f.name for f in field_manager.fields}
+    print("✅ delete_field resolves copies through the name index")
+
+
+def test_fields_by_page_follow_mutations():
+    """Per-page field lists match a filter of self.fields after every kind of change"""
+    field_manager = make_manager(scale=1.0)
+
+    def check():
+        for page in range(4):
+            expected = [f for f in field_manager.fields if f.page_num == page]
+            assert field_manager.get_fields_for_page(page) == expected, page
+
+    fields = [FormField(f"f{i}", FieldType.TEXT, i % 3, [i, i, i + 10, i + 10]) for i in range(30)]
+    for field in fields[:20]:
+        field_manager.add_field(field)
+    check()
+    field_manager.insert_field(0, fields[20])
+    field_manager.insert_field(7, fields[21])
+    for field in fields[22:25]:
+        field_manager.add_field(field)
+    check()
+    field_manager.delete_field(fields[3])
+    field_manager.delete_field(fields[20])
+    field_manager.delete_field(field_manager.fields[5])
+    check()
+    field_manager.load_existing_fields(fields[25:])
+    check()
+    field_manager.clear_all_fields()
+    assert field_manager.get_fields_for_page(0) == []
+    print("✅ Per-page field lists stay in sync")
+
+
+def test_unique_names_use_name_index():
+    """generate_unique_name skips names of managed fields, including renamed ones"""
+    field_manager = make_manager(scale=1.0)
+    for name in ("text_1", "text_1_copy_1", "text_2"):
+        field_manager.add_field(FormField(name, FieldType.TEXT, 0, [0, 0, 10, 10]))
+
+    assert field_manager.generate_unique_name("text_3") == "text_3"
+    assert field_manager.generate_unique_name("text_2") == "text_2_copy_1"
+    assert field_manager.generate_unique_name("text_1") == "text_1_copy_2"
+
+    field_manager.rename_field(field_manager.fields[2], "text_3")
+    assert field_manager.generate_unique_name("text_2") == "text_2"
+    assert field_manager.generate_unique_name("text_3") == "text_3_copy_1"
+    print("✅ Unique names come from the name index")
+
+
+def test_paste_after_rename_gets_unique_name():
+    """A field copied after a rename pastes under a name no other field uses"""
+    field_manager = make_manager(scale=1.0)
+    field = FormField("text_1", FieldType.TEXT, 0, [0, 0, 10, 10])
+    field_manager.add_field(field)
+    field_manager.rename_field(field, "signature")
+    assert field_manager.generate_unique_name("text_1") == "text_1"
+
+    # Copy the renamed field as Ctrl+C does, then paste it twice
+    clipboard = field.clone()
+    field_manager.duplicate(clipboard, 0)
+    field_manager.duplicate(clipboard, 0)
+    names = [f.name for f in field_manager.fields]
+    assert names == ["signature", "signature_copy_1", "signature_copy_2"], names
+    print("✅ Pasting after a rename picks an unused name")
+
+
+if __name__ == "__main__":
+    test_grid_index_queries()
+    test_hit_testing_matches_linear_scan()
+    test_index_follows_mutations()
+    test_delete_finds_copies_by_name()
+    test_fields_by_page_follow_mutations()
+    test_unique_names_use_name_index()
+    test_paste_after_rename_gets_unique_name()
@@ -71,7 +71,7 @@ def test_field_zoom_responsiveness():
         print()
         
         # Clean up for next test
-        field_manager.fields.clear()
+        field_manager.clear_all_fields()
     
     root.destroy()
 
@@ -261,6 +261,7 @@ class StatusBar(tk.Frame):
             font=('Arial', 9)
         )
         self.status_label.pack(side='left', fill='x', expand=True, padx=5, pady=3)
+        self._last_text = self.status_label.cget('text')
         
         # Right side - zoom percentage
         self.zoom_label = tk.Label(
@@ -272,31 +273,44 @@ class StatusBar(tk.Frame):
             width=8
         )
         self.zoom_label.pack(side='right', padx=5, pady=3)
+        self._last_zoom = self.zoom_label.cget('text')
     
     def set_status(self, message: str):
-        """Set the status message"""
+        """Set the status message (skipped if it is already showing)"""
+        if message == self._last_text:
+            return
         self.status_label.config(text=message)
+        self._last_text = message
     
     def set_zoom(self, zoom_percentage: str):
-        """Set the zoom percentage display"""
+        """Set the zoom percentage display (skipped if it is already showing)"""
+        if zoom_percentage == self._last_zoom:
+            return
         self.zoom_label.config(text=zoom_percentage)
+        self._last_zoom = zoom_percentage
 
 
 class ScrollableCanvas(tk.Frame):
     """Canvas with scrollbars for PDF display"""
     
-    def __init__(self, parent, on_mouse_wheel_zoom: Callable = None):
+    def __init__(self, parent, on_mouse_wheel_zoom: Callable = None,
+                 on_view_changed: Callable = None):
         """
         Initialize the scrollable canvas
         
         Args:
             parent: Parent widget
             on_mouse_wheel_zoom: Callback for mouse wheel zoom
+            on_view_changed: Callback when the visible part of the canvas changes
+                             (scrolling, panning or resizing)
         """
         super().__init__(parent, bg='white')
         
         self.on_mouse_wheel_zoom = on_mouse_wheel_zoom
+        self.on_view_changed = on_view_changed
         self.panning = False
+        self._cursor = ""  # Last cursor configured, to skip redundant Tk calls
+        self._view_change_pending = False  # on_view_changed is queued with after_idle
         self.pan_start_x = 0
         self.pan_start_y = 0
         
@@ -314,10 +328,14 @@ class ScrollableCanvas(tk.Frame):
         
         # Configure canvas scrolling
         self.canvas.configure(
-            yscrollcommand=self.v_scrollbar.set,
-            xscrollcommand=self.h_scrollbar.set
+            yscrollcommand=self._on_yscroll,
+            xscrollcommand=self._on_xscroll
         )
         
+        # Plain wheel scrolling runs as Tcl scripts; Python only hears about it
+        # through the (coalesced) scroll commands below
+        self._bind_wheel_scrolling()
+        
         # Bind mouse wheel events for zoom
         if self.on_mouse_wheel_zoom:
             self.canvas.bind("<Control-MouseWheel>", self._on_ctrl_mouse_wheel)
@@ -340,6 +358,51 @@ class ScrollableCanvas(tk.Frame):
         self.h_scrollbar.pack(side='bottom', fill='x')
         self.canvas.pack(side='left', fill='both', expand=True)
     
+    def _bind_wheel_scrolling(self):
+        """
+        Scroll the canvas with the mouse wheel (Shift for horizontal)
+        
+        The bindings are Tcl scripts, so wheel events are not dispatched to
+        Python handlers. The resulting view change still reaches Python via
+        yscrollcommand/xscrollcommand, which report it at most once per idle.
+        """
+        windowing_system = self.canvas.tk.call("tk", "windowingsystem")
+        if windowing_system == "x11":
+            # X11 reports wheel steps as button 4/5 presses
+            self.canvas.bind("<Button-4>", "%W yview scroll -3 units")
+            self.canvas.bind("<Button-5>", "%W yview scroll 3 units")
+            self.canvas.bind("<Shift-Button-4>", "%W xview scroll -3 units")
+            self.canvas.bind("<Shift-Button-5>", "%W xview scroll 3 units")
+            return
+        
+        # Windows deltas come in multiples of 120 (touchpads send fractions of that),
+        # macOS deltas are already small steps. int() truncates toward zero so
+        # both directions scroll the same amount.
+        step = "[expr {int(-(%D) / 120.0 * 3)}]" if windowing_system == "win32" else "[expr {-(%D)}]"
+        self.canvas.bind("<MouseWheel>", f"%W yview scroll {step} units")
+        self.canvas.bind("<Shift-MouseWheel>", f"%W xview scroll {step} units")
+    
+    def _on_yscroll(self, first, last):
+        """Update the vertical scrollbar and report the view change"""
+        self.v_scrollbar.set(first, last)
+        self._schedule_view_changed()
+    
+    def _on_xscroll(self, first, last):
+        """Update the horizontal scrollbar and report the view change"""
+        self.h_scrollbar.set(first, last)
+        self._schedule_view_changed()
+    
+    def _schedule_view_changed(self):
+        """Report view changes once per idle, however many scroll steps arrive"""
+        if self.on_view_changed and not self._view_change_pending:
+            self._view_change_pending = True
+            self.after_idle(self._flush_view_changed)
+    
+    def _flush_view_changed(self):
+        """Run the view change callback queued by _schedule_view_changed"""
+        self._view_change_pending = False
+        self.on_view_changed()
+    
     def _on_ctrl_mouse_wheel(self, event):
         """Handle Ctrl+mouse wheel for zooming"""
         if self.on_mouse_wheel_zoom:
@@ -352,6 +415,7 @@ class ScrollableCanvas(tk.Frame):
         self.pan_start_x = event.x
         self.pan_start_y = event.y
         self.canvas.config(cursor="fleur")  # Change cursor to indicate panning
+        self._cursor = "fleur"
     
     def _do_pan(self, event):
         """Perform panning"""
@@ -395,6 +459,7 @@ class ScrollableCanvas(tk.Frame):
         """End panning"""
         self.panning = False
         self.canvas.config(cursor="")  # Reset cursor
+        self._cursor = ""
     
     def handle_keyboard_pan(self, event):
         """Handle keyboard panning (arrow keys)"""
@@ -439,14 +504,206 @@ class ScrollableCanvas(tk.Frame):
     
     def set_cursor(self, cursor: str):
         """Set canvas cursor"""
-        if not self.panning:  # Don't override panning cursor
+        if not self.panning and cursor != self._cursor:  # Don't override panning cursor
             self.canvas.config(cursor=cursor)
+            self._cursor = cursor
     
     def get_canvas_coords(self, event):
         """Get canvas coordinates from event (accounting for scrolling)"""
         return self.canvas.canvasx(event.x), self.canvas.canvasy(event.y)
 
 
+class FieldPropertiesDialog(tk.Toplevel):
+    """Field properties editor, built once and reused for every field"""
+    
+    DATE_FORMATS = ["MM/DD/YYYY", "DD/MM/YYYY", "YYYY-MM-DD", "DD MMM YYYY", "MMM DD, YYYY"]
+    NO_IMAGE_TEXT = "No image selected"
+    
+    def __init__(self, parent, on_save: Callable = None, on_rename: Callable = None):
+        """
+        Build the (hidden) dialog
+        
+        Args:
+            parent: Parent window
+            on_save: Callback(field) run after the edited field was updated
+            on_rename: Callback(field, new_name) that renames the field (the name
+                       is assigned directly if not given)
+        """
+        super().__init__(parent)
+        self.withdraw()
+        self.parent = parent
+        self.on_save = on_save
+        self.on_rename = on_rename
+        self.field = None
+        
+        self.geometry("400x300")
+        self.transient(parent)
+        self.protocol("WM_DELETE_WINDOW", self.hide)
+        
+        # Field name
+        tk.Label(self, text="Field Name:", font=('Arial', 10, 'bold')).pack(anchor='w', padx=20, pady=(20, 5))
+        self.name_var = tk.StringVar()
+        self.name_entry = tk.Entry(self, textvariable=self.name_var, font=('Arial', 10))
+        self.name_entry.pack(fill='x', padx=20, pady=(0, 10))
+        
+        # Field type (readonly)
+        tk.Label(self, text="Field Type:", font=('Arial', 10, 'bold')).pack(anchor='w', padx=20, pady=(10, 5))
+        self.type_label = tk.Label(self, font=('Arial', 10))
+        self.type_label.pack(anchor='w', padx=20, pady=(0, 10))
+        
+        # Page number (readonly)
+        tk.Label(self, text="Page:", font=('Arial', 10, 'bold')).pack(anchor='w', padx=20, pady=(10, 5))
+        self.page_label = tk.Label(self, font=('Arial', 10))
+        self.page_label.pack(anchor='w', padx=20, pady=(0, 10))
+        
+        # Type-specific sections, packed only while editing a field of that type
+        self.date_section = self._build_date_section()
+        self.image_section = self._build_image_section()
+        
+        # Buttons
+        self.button_frame = tk.Frame(self)
+        self.button_frame.pack(fill='x', padx=20, pady=20)
+        tk.Button(self.button_frame, text="Save", command=self.save, bg='#4CAF50', fg='white', font=('Arial', 10)).pack(side='right', padx=(5, 0))
+        tk.Button(self.button_frame, text="Cancel", command=self.hide, bg='#f44336', fg='white', font=('Arial', 10)).pack(side='right')
+    
+    def _build_date_section(self) -> tk.Frame:
+        """Build the date format editor"""
+        section = tk.Frame(self)
+        tk.Label(section, text="Date Format:", font=('Arial', 10, 'bold')).pack(anchor='w', pady=(10, 5))
+        
+        self.format_var = tk.StringVar()
+        tk.Entry(section, textvariable=self.format_var, font=('Arial', 10)).pack(fill='x', pady=(0, 10))
+        
+        # Add some example formats as buttons
+        examples_frame = tk.Frame(section)
+        examples_frame.pack(fill='x', pady=(5, 10))
+        for fmt in self.DATE_FORMATS:
+            tk.Button(examples_frame, text=fmt, command=lambda f=fmt: self.format_var.set(f),
+                      font=('Arial', 8), relief='flat', bg='#e0e0e0').pack(side='left', padx=(0, 5), pady=2)
+        return section
+    
+    def _build_image_section(self) -> tk.Frame:
+        """Build the image file picker"""
+        section = tk.Frame(self)
+        tk.Label(section, text="Image File:", font=('Arial', 10, 'bold')).pack(anchor='w', pady=(10, 5))
+        
+        # Image path display and selection
+        image_frame = tk.Frame(section)
+        image_frame.pack(fill='x', pady=(0, 10))
+        self.image_path_var = tk.StringVar()
+        tk.Entry(image_frame, textvariable=self.image_path_var, font=('Arial', 10),
+                 state='readonly').pack(side='left', fill='x', expand=True, padx=(0, 5))
+        tk.Button(image_frame, text="Browse...", command=self._select_image,
+                  font=('Arial', 9), bg='#2196F3', fg='white').pack(side='right')
+        
+        # Current image info, filled in by show()
+        self.image_info_label = tk.Label(section, font=('Arial', 8), fg='#666666')
+        return section
+    
+    def _select_image(self):
+        """Let the user pick the image for an image field"""
+        from tkinter import filedialog
+        file_path = filedialog.askopenfilename(
+            title="Select Image File",
+            filetypes=[
+                ("Image files", "*.png *.jpg *.jpeg *.gif *.bmp *.tiff"),
+                ("PNG files", "*.png"),
+                ("JPEG files", "*.jpg *.jpeg"),
+                ("GIF files", "*.gif"),
+                ("All files", "*.*")
+            ]
+        )
+        if file_path:
+            self.image_path_var.set(file_path)
+    
+    def show(self, field):
+        """
+        Load a field into the dialog and show it
+        
+        Args:
+            field: The FormField to edit
+        """
+        self.field = field
+        self.title(f"Edit {field.type.value} Field")
+        self.name_var.set(field.name)
+        self.type_label.config(text=field.type.value.title(), fg=field.color)
+        self.page_label.config(text=f"Page {field.page_num + 1}")
+        
+        self.date_section.pack_forget()
+        self.image_section.pack_forget()
+        if field.type == FieldType.DATE:
+            self.format_var.set(field.date_format or "MM/DD/YYYY")
+            self.date_section.pack(fill='x', padx=20, before=self.button_frame)
+        elif field.type == FieldType.IMAGE:
+            self.image_path_var.set(field.image_path or self.NO_IMAGE_TEXT)
+            self._show_image_info(field.image_path)
+            self.image_section.pack(fill='x', padx=20, before=self.button_frame)
+        
+        # Place the dialog near the parent's top-left corner
+        self.geometry("+%d+%d" % (self.parent.winfo_rootx() + 50, self.parent.winfo_rooty() + 50))
+        self.deiconify()
+        self.lift()
+        self.grab_set()
+        
+        # Focus on name entry
+        self.name_entry.focus_set()
+        self.name_entry.select_range(0, 'end')
+    
+    def _show_image_info(self, image_path: Optional[str]):
+        """Show the name and size of the field's current image, if it has one"""
+        if not image_path:
+            self.image_info_label.pack_forget()
+            return
+        
+        import os
+        try:
+            size_mb = os.path.getsize(image_path) / (1024 * 1024)
+            info_text = f"Current: {os.path.basename(image_path)} ({size_mb:.1f} MB)"
+        except OSError:
+            info_text = f"Current: {os.path.basename(image_path)}"
+        self.image_info_label.config(text=info_text)
+        self.image_info_label.pack(anchor='w', pady=(0, 5))
+    
+    def hide(self):
+        """Hide the dialog, keeping its widgets for the next edit"""
+        self.grab_release()
+        self.withdraw()
+        self.field = None
+    
+    def save(self):
+        """Apply the edited values to the field and hide the dialog"""
+        field = self.field
+        if field is None:
+            self.hide()
+            return
+        
+        # Update field name
+        new_name = self.name_var.get().strip()
+        if new_name and new_name != field.name:
+            if self.on_rename:
+                self.on_rename(field, new_name)
+            else:
+                field.name = new_name
+        
+        # Update date format for date fields
+        if field.type == FieldType.DATE:
+            new_format = self.format_var.get().strip()
+            if new_format:
+                field.date_format = new_format
+        
+        # Update image path for image fields
+        if field.type == FieldType.IMAGE:
+            new_image_path = self.image_path_var.get().strip()
+            if new_image_path and new_image_path != self.NO_IMAGE_TEXT:
+                field.image_path = new_image_path
+                # Clear image_data when new path is set
+                field.image_data = None
+        
+        self.hide()
+        if self.on_save:
+            self.on_save(field)
+
+
 class FieldsSidebar(tk.Frame):
     """Sidebar for managing form fields with quick actions"""
     
@@ -635,7 +892,7 @@ class FieldsSidebar(tk.Frame):
             text=field.type.value.title(),
             font=('Arial', 10, 'bold'),
             bg=item_frame['bg'],
-            fg=AppConstants.FIELD_COLORS[field.type],
+            fg=field.color,
             anchor='w'
         )
         type_label.pack(anchor='w')